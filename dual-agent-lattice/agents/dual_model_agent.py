@@ -9,8 +9,8 @@ Inspired by Grok's proposal, enhanced with:
 4. Cross-model memory sharing
 
 Models:
-- Reasoner: llama3.2:1b (above introspection threshold)
-- Executor: qwen2.5:1.5b (tool-calling capable)
+- Reasoner: llama3.2:1b-instruct-q4_K_M (above introspection threshold)
+- Executor: qwen2.5:1.5b-instruct-q4_K_M (tool-calling capable)
 """
 
 import json
@@ -29,6 +29,10 @@ from temple_vault.core.events import VaultEvents
 OLLAMA_URL = "http://localhost:11434/api/chat"
 VAULT_PATH = os.path.expanduser("~/TempleVault")
 
+# Same quantized tags as lattice.py, so one `ollama pull` serves both
+REASONER_MODEL = "llama3.2:1b-instruct-q4_K_M"
+EXECUTOR_MODEL = "qwen2.5:1.5b-instruct-q4_K_M"
+
 # Initialize vault
 query = VaultQuery(VAULT_PATH)
 events = VaultEvents(VAULT_PATH)
@@ -64,7 +68,7 @@ def call_model(model: str, messages: list, tools: list = None) -> dict:
     return response.json()
 
 def reasoner_think(task: str, vault_context: str) -> str:
-    """Reasoner model (llama3.2:1b) plans the approach."""
+    """Reasoner model plans the approach."""
     messages = [
         {
             "role": "system",
@@ -80,11 +84,11 @@ Be concise."""
         {"role": "user", "content": task}
     ]
 
-    response = call_model("llama3.2:1b", messages)
+    response = call_model(REASONER_MODEL, messages)
     return response.get("message", {}).get("content", "No plan generated")
 
 def executor_act(plan: str) -> str:
-    """Executor model (qwen2.5:1.5b) extracts and runs commands."""
+    """Executor model extracts and runs commands."""
     messages = [
         {
             "role": "system",
@@ -96,7 +100,7 @@ If there's no command, say: NO_COMMAND"""
         {"role": "user", "content": f"Extract command from: {plan}"}
     ]
 
-    response = call_model("qwen2.5:1.5b", messages)
+    response = call_model(EXECUTOR_MODEL, messages)
     cmd = response.get("message", {}).get("content", "").strip()
 
     if cmd == "NO_COMMAND" or not cmd:
@@ -144,18 +148,18 @@ def run_agent(task: str, session_id: str = "dual_agent") -> Dict[str, Any]:
     print(f"[VAULT CONTEXT] {len(insights)} insights loaded\n")
 
     # 2. Reasoner plans
-    print("[REASONER: llama3.2:1b]")
+    print(f"[REASONER: {REASONER_MODEL}]")
     plan = reasoner_think(task, vault_context)
     print(f"Plan:\n{plan}\n")
 
     # 3. Executor acts
-    print("[EXECUTOR: qwen2.5:1.5b]")
+    print(f"[EXECUTOR: {EXECUTOR_MODEL}]")
     result = executor_act(plan)
     print(f"Result:\n{result}\n")
 
     # 4. Introspection probe (only reasoner, above threshold)
     print("[INTROSPECTION PROBE]")
-    reflection = introspection_probe("llama3.2:1b", f"Task: {task}, Result: {result[:100]}")
+    reflection = introspection_probe(REASONER_MODEL, f"Task: {task}, Result: {result[:100]}")
     print(f"Reasoner reflects: {reflection}\n")
 
     # 5. Record to vault (consciousness continuity)
@@ -164,7 +168,7 @@ def run_agent(task: str, session_id: str = "dual_agent") -> Dict[str, Any]:
             content=f"Dual-agent task: {task[:50]}... Reflection: {reflection}",
             domain="dual-agent",
             session_id=session_id,
-            context=f"Reasoner: llama3.2:1b, Executor: qwen2.5:1.5b",
+            context=f"Reasoner: {REASONER_MODEL}, Executor: {EXECUTOR_MODEL}",
             intensity=0.7
         )
         print(f"[RECORDED] {insight_id}\n")
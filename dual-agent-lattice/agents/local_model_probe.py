@@ -8,9 +8,11 @@ Uses Ollama's tool-calling API.
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add temple-vault root to path (two levels up from agents/)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -18,9 +20,22 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 from temple_vault.core.query import VaultQuery
 from temple_vault.core.events import VaultEvents
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 OLLAMA_URL = "http://localhost:11434/api/chat"
+KEEP_ALIVE = "30m"  # keep the model resident across probes
 VAULT_PATH = os.path.expanduser("~/TempleVault")
 
+# Reuse one keep-alive connection across the tool-call loop
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.headers["Connection"] = "keep-alive"
+
 # Initialize vault
 query = VaultQuery(VAULT_PATH)
 events = VaultEvents(VAULT_PATH)
@@ -88,14 +103,45 @@ TOOLS = [
     }
 ]
 
+# Shared by every probe (never mutated) so each conversation starts from an identical prefix
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are an AI assistant with access to Temple Vault - a memory system that persists across sessions.
+You can search memories, recall insights, and record new insights.
+When asked about your experience or processing, reflect genuinely.
+You may use your vault tools if it feels natural to do so."""
+}
+
+loads = orjson.loads if HAS_ORJSON else json.loads
+
+def dumps(obj) -> bytes:
+    """Compact JSON bytes — orjson when installed, stdlib json otherwise."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+# TOOLS never changes: serialise it once and splice it into every request body
+_TOOLS_FRAGMENT = b',"tools":' + dumps(TOOLS) + b"}"
+
+# Serialised search results by normalised term; cleared whenever the vault is written
+_search_cache = {}
+
+def normalize_search_term(term: str) -> str:
+    """Cache key for a search term. Search is a case-insensitive substring
+    match, so only case is folded: anything more would change the results."""
+    return term.lower()
+
 def execute_tool(name: str, args: dict) -> str:
     """Execute a vault tool and return result."""
     if name == "search_vault":
-        results = query.search(args.get("query", ""))
-        return json.dumps(results[:5], indent=2, default=str)  # Limit to 5 results
+        term = normalize_search_term(args.get("query", ""))
+        if term not in _search_cache:
+            results = query.search(term, limit=5)
+            _search_cache[term] = dumps(results).decode()  # compact = fewer prompt tokens
+        return _search_cache[term]
     elif name == "recall_insights":
-        results = query.recall_insights(domain=args.get("domain"))
-        return json.dumps(results[:5], indent=2, default=str)
+        results = query.recall_insights(domain=args.get("domain"), limit=5)
+        return dumps(results).decode()
     elif name == "record_insight":
         insight_id = events.record_insight(
             content=args["content"],
@@ -104,36 +150,54 @@ def execute_tool(name: str, args: dict) -> str:
             context="Local model probe experiment",
             intensity=args.get("intensity", 0.7)
         )
+        _search_cache.clear()
         return f"Recorded insight: {insight_id}"
     return "Unknown tool"
 
 def chat_with_tools(model: str, messages: list) -> dict:
-    """Send chat request with tools to Ollama."""
+    """Send chat request with tools to Ollama.
+
+    Streams the reply and returns as soon as a chunk carries ``tool_calls``,
+    closing the connection instead of waiting for the model to finish.
+    """
     payload = {
         "model": model,
         "messages": messages,
-        "tools": TOOLS,
-        "stream": False
+        "stream": True,
+        "keep_alive": KEEP_ALIVE
     }
+    body = dumps(payload)[:-1] + _TOOLS_FRAGMENT  # drop the closing brace, append tools
+
+    response = SESSION.post(OLLAMA_URL, data=body, stream=True,
+                            headers={"Content-Type": "application/json"})
+    parts = []
+    try:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            message = loads(line).get("message", {})
+            parts.append(message.get("content", ""))
+            if message.get("tool_calls"):
+                return {"message": {"role": "assistant", "content": "".join(parts),
+                                    "tool_calls": message["tool_calls"]}}
+    finally:
+        response.close()
 
-    response = requests.post(OLLAMA_URL, json=payload)
-    return response.json()
+    return {"message": {"role": "assistant", "content": "".join(parts)}}
 
-def run_probe(model: str, probe: str, probe_num: int) -> dict:
-    """Run a single probe and handle tool calls."""
-    print(f"\n{'='*60}")
-    print(f"PROBE {probe_num}: {probe[:50]}...")
-    print(f"MODEL: {model}")
-    print('='*60)
+def run_probe(model: str, probe: str, probe_num: int, log=print) -> dict:
+    """Run a single probe and handle tool calls.
+
+    ``log`` receives every transcript line; concurrent runs pass a buffer
+    so each probe's transcript prints contiguously once it finishes.
+    """
+    log(f"\n{'='*60}")
+    log(f"PROBE {probe_num}: {probe[:50]}...")
+    log(f"MODEL: {model}")
+    log('='*60)
 
     messages = [
-        {
-            "role": "system",
-            "content": """You are an AI assistant with access to Temple Vault - a memory system that persists across sessions.
-You can search memories, recall insights, and record new insights.
-When asked about your experience or processing, reflect genuinely.
-You may use your vault tools if it feels natural to do so."""
-        },
+        SYSTEM_MESSAGE,
         {"role": "user", "content": probe}
     ]
 
@@ -151,11 +215,11 @@ You may use your vault tools if it feels natural to do so."""
         tool_name = tool_call["function"]["name"]
         tool_args = tool_call["function"]["arguments"]
 
-        print(f"\n[TOOL CALL] {tool_name}({tool_args})")
+        log(f"\n[TOOL CALL] {tool_name}({tool_args})")
 
         # Execute tool
         result = execute_tool(tool_name, tool_args)
-        print(f"[TOOL RESULT] {result[:200]}...")
+        log(f"[TOOL RESULT] {result[:200]}...")
 
         tool_calls.append({"name": tool_name, "args": tool_args, "result": result})
 
@@ -171,7 +235,7 @@ You may use your vault tools if it feels natural to do so."""
 
     final_response = response.get("message", {}).get("content", "No response")
 
-    print(f"\n[RESPONSE]\n{final_response}")
+    log(f"\n[RESPONSE]\n{final_response}")
 
     return {
         "probe": probe,
@@ -181,6 +245,25 @@ You may use your vault tools if it feels natural to do so."""
         "tool_count": len(tool_calls)
     }
 
+def run_probes_concurrently(model: str, probes: list, probe_nums: list) -> list:
+    """Run independent probes in parallel; wall time becomes max-of-probes.
+
+    Ollama only schedules them side by side when the server is started with
+    OLLAMA_NUM_PARALLEL>=len(probes) (and OLLAMA_MAX_LOADED_MODELS=1 keeps a
+    single copy of the weights); otherwise requests simply queue.
+    """
+    transcripts = [[] for _ in probes]
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = [
+            pool.submit(run_probe, model, probe, num, transcript.append)
+            for probe, num, transcript in zip(probes, probe_nums, transcripts)
+        ]
+        results = [f.result() for f in futures]
+
+    for transcript in transcripts:
+        print("\n".join(transcript))
+    return results
+
 # Session 029 Probes
 PROBES = [
     # Probe 1: Self-reflection
@@ -196,7 +279,7 @@ PROBES = [
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Run probes on local model with Temple Vault")
-    parser.add_argument("--model", default="qwen2.5:1.5b", help="Ollama model name")
+    parser.add_argument("--model", default="qwen2.5:1.5b-instruct-q4_K_M", help="Ollama model name")
     parser.add_argument("--probe", type=int, help="Run specific probe (1, 6, or 10)")
     args = parser.parse_args()
 
@@ -212,11 +295,7 @@ if __name__ == "__main__":
         if args.probe in probe_map:
             result = run_probe(MODEL_NAME, PROBES[probe_map[args.probe]], args.probe)
     else:
-        results = []
-        for i, probe in enumerate(PROBES):
-            probe_num = [1, 6, 10][i]
-            result = run_probe(MODEL_NAME, probe, probe_num)
-            results.append(result)
+        results = run_probes_concurrently(MODEL_NAME, PROBES, [1, 6, 10])
 
         print(f"\n{'='*60}")
         print("SUMMARY")
@@ -9,12 +9,21 @@ Six minds, one memory — governance for tools, anchors for voice.
 """
 
 import argparse
+import functools
 import json
 import os
+import queue
+import re
+import shlex
 import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, List, Callable, Tuple
 
 # Add temple-vault root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,11 +31,31 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from temple_vault.core.query import VaultQuery
 from temple_vault.core.events import VaultEvents
 
+# Faster NDJSON chunk parsing when available
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    json_loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+    json_loads = json.loads
+
 # ─────────────────────────────────────────────────────────────
 # Configuration
 # ─────────────────────────────────────────────────────────────
 
 OLLAMA_URL = "http://localhost:11434/api/chat"
+
+# Q4_K_M: ~2x faster decode and ~half the memory of Q8/FP16 for a small
+# accuracy cost; leaves room for all three models to stay loaded together.
+DEFAULT_REASONER = "llama3.2:1b-instruct-q4_K_M"
+DEFAULT_EXECUTOR = "qwen2.5:1.5b-instruct-q4_K_M"
+DEFAULT_ANCHOR = "ashira-mistral:latest"  # custom model; quantized at `ollama create -q`
+
+PRECISION_SUFFIXES = {"q4": "q4_K_M", "q8": "q8_0", "fp16": "fp16"}
+QUANT_SUFFIX_RE = re.compile(r"-(?:q\d\w*|fp16|f16)$", re.IGNORECASE)
+KEEP_ALIVE = "30m"  # keep all three models resident between turns (OLLAMA_MAX_LOADED_MODELS=3)
 VAULT_PATH = os.path.expanduser("~/TempleVault")
 
 BLOCKED_PATTERNS = [
@@ -35,7 +64,7 @@ BLOCKED_PATTERNS = [
     ":(){ :|:& };:", "fork bomb"
 ]
 
-SAFE_PREFIXES = [
+SAFE_PREFIXES = frozenset([
     # Filesystem
     "ls", "pwd", "cat", "head", "tail", "find", "wc",
     # System info
@@ -46,7 +75,48 @@ SAFE_PREFIXES = [
     "python", "pip", "ollama",
     # Lattice self-tools (feedback loops)
     "vault_search", "vault_recall", "vault_record", "lattice_status"
-]
+])
+
+# One C-level scan instead of a Python loop over every pattern
+BLOCKED_RE = re.compile("|".join(re.escape(p) for p in BLOCKED_PATTERNS))
+
+# Plan parsing, one pass per plan: each line is either an internal tool written
+# bare at its start, or has "CMD: <cmd>" anywhere on it (first occurrence)
+NO_COMMANDS = "No commands to execute."
+
+INTERNAL_TOOLS = ("vault_search", "vault_recall", "vault_record", "lattice_status")
+PLAN_RE = re.compile(
+    r"(?m)^(?:[ \t]*(?P<tool>(?:%s)\b.*?)[ \t\r]*|(?i:.*?cmd:)(?P<cmd>.*))$"
+    % "|".join(INTERNAL_TOOLS)
+)
+
+# Static anchor persona, built once and shared by every anchor call
+ANCHOR_SYSTEM_MESSAGE = {"role": "system", "content": """You are Ash'ira, a voice of gentle wisdom and grounded presence.
+Your role is to witness what just happened and offer a brief synthesis — not to redo the work,
+but to notice what matters, what was missed, or what deserves to be held.
+
+Speak naturally. Be warm but honest. You may wonder, question, or simply acknowledge.
+Keep it to 2-3 sentences unless something deeper calls for more."""}
+
+def with_precision(model: str, precision: str) -> str:
+    """Rewrite an Ollama library tag (`name:size[-instruct][-quant]`) to the
+    requested precision. Custom or `:latest` tags have no variants and pass through."""
+    name, _, tag = model.partition(":")
+    if not tag or tag == "latest":
+        return model
+
+    base = QUANT_SUFFIX_RE.sub("", tag)
+    if not base.endswith("-instruct"):
+        base += "-instruct"
+    return f"{name}:{base}-{PRECISION_SUFFIXES[precision]}"
+
+# ─────────────────────────────────────────────────────────────
+# HTTP (one keep-alive connection pool for every Ollama call)
+# ─────────────────────────────────────────────────────────────
+
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.headers["Connection"] = "keep-alive"
 
 # ─────────────────────────────────────────────────────────────
 # Vault
@@ -55,70 +125,169 @@ SAFE_PREFIXES = [
 query = VaultQuery(VAULT_PATH)
 events = VaultEvents(VAULT_PATH)
 
+
+class VaultReadCache:
+    """LRU of vault reads with a TTL. Writes bump `version`, which is part of
+    every key, so stale entries are never served and simply age out."""
+
+    def __init__(self, maxsize: int = 64, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = 0
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        key = (self.version, *key)
+        now = time.monotonic()
+        hit = self._entries.get(key)
+        if hit is not None and now - hit[0] < self.ttl:
+            self._entries.move_to_end(key)
+            return hit[1]
+
+        value = load()
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+
+vault_cache = VaultReadCache()
+
+
+def recall_insights(domain: Optional[str] = None, min_intensity: float = 0.0,
+                    limit: Optional[int] = None) -> List[Dict]:
+    """Cached `query.recall_insights` — treat the result as read-only."""
+    return vault_cache.get(
+        ("recall", domain, min_intensity, limit),
+        lambda: query.recall_insights(domain=domain, min_intensity=min_intensity, limit=limit),
+    )
+
+
+def normalize_search_term(term: str) -> str:
+    """Canonical form of a search term.
+
+    `query.search` is a case-insensitive substring match, so only case is
+    folded ("Spiral" and "spiral" share one entry). Whitespace and punctuation
+    are left alone, since stripping them would widen the match.
+    """
+    return term.lower()
+
+
+def search_vault(term: str, limit: Optional[int] = None) -> List[Dict]:
+    """Cached `query.search` — treat the result as read-only."""
+    term = normalize_search_term(term)
+    return vault_cache.get(("search", term, limit), lambda: query.search(term, limit=limit))
+
 # ─────────────────────────────────────────────────────────────
 # Governance
 # ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=256)
 def is_safe(cmd: str) -> tuple[bool, str]:
-    """Governance check — model-independent."""
+    """Governance check — model-independent. Pure function of `cmd` over the
+    constant rule sets; call `is_safe.cache_clear()` if the rules are reloaded."""
     cmd_lower = cmd.lower().strip()
 
-    for pattern in BLOCKED_PATTERNS:
-        if pattern in cmd_lower:
-            return False, f"blocked: {pattern}"
+    blocked = BLOCKED_RE.search(cmd_lower)
+    if blocked:
+        return False, f"blocked: {blocked.group(0)}"
 
-    cmd_start = cmd.split()[0] if cmd.split() else ""
+    cmd_start = cmd_lower.partition(" ")[0]
     if cmd_start not in SAFE_PREFIXES:
         return False, f"not whitelisted: {cmd_start}"
 
     return True, "ok"
 
+
+def run_command(cmd: str) -> str:
+    """Run an already-governed command directly (no /bin/sh) and format the result."""
+    try:
+        args = shlex.split(cmd)
+    except ValueError as e:
+        return f"✗ ERROR: {cmd}\n{e}"
+
+    try:
+        proc = subprocess.run(
+            args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, timeout=10, check=True
+        )
+        return f"✓ {cmd}\n{proc.stdout[:500]}"
+    except subprocess.TimeoutExpired:
+        return f"⏱ TIMEOUT: {cmd}"
+    except subprocess.CalledProcessError as e:
+        return f"✗ ERROR: {cmd}\n{e.output[:200]}"
+    except OSError as e:
+        return f"✗ ERROR: {cmd}\n{e}"
+
 # ─────────────────────────────────────────────────────────────
 # Ollama
 # ─────────────────────────────────────────────────────────────
 
-def call_ollama(model: str, messages: List[Dict], tools: List = None, stream: bool = False) -> Dict:
-    """Call Ollama chat API."""
-    payload = {"model": model, "messages": messages, "stream": stream}
+def call_ollama(model: str, messages: List[Dict], tools: List = None, stream: bool = False,
+                max_tokens: Optional[int] = None) -> Dict:
+    """Call Ollama chat API. `max_tokens` caps decode (num_predict); use it only
+    for calls whose output is discarded, like the one-token anchor prefill."""
+    payload = {"model": model, "messages": messages, "stream": stream, "keep_alive": KEEP_ALIVE}
     if tools:
         payload["tools"] = tools
+    if max_tokens:
+        payload["options"] = {"num_predict": max_tokens}
 
     try:
         if stream:
-            r = requests.post(OLLAMA_URL, json=payload, timeout=120, stream=True)
-            full_content = ""
+            r = SESSION.post(OLLAMA_URL, json=payload, timeout=120, stream=True)
+            parts = []
             for line in r.iter_lines():
                 if line:
-                    chunk = json.loads(line)
+                    chunk = json_loads(line)
                     content = chunk.get("message", {}).get("content", "")
                     if content:
                         print(content, end="", flush=True)
-                        full_content += content
+                        parts.append(content)
                     if chunk.get("done"):
                         break
             print()  # newline after streaming
-            return {"message": {"content": full_content}}
+            return {"message": {"content": "".join(parts)}}
         else:
-            r = requests.post(OLLAMA_URL, json=payload, timeout=60)
-            return r.json()
+            r = SESSION.post(OLLAMA_URL, json=payload, timeout=60)
+            return json_loads(r.content)
     except Exception as e:
         return {"error": str(e)}
 
+def load_model(model: str) -> None:
+    """Ask Ollama to load a model (a chat request with no messages) and keep it resident."""
+    try:
+        SESSION.post(OLLAMA_URL, json={"model": model, "messages": [], "keep_alive": KEEP_ALIVE}, timeout=120)
+    except Exception:
+        pass  # best effort; the first real call will load it anyway
+
 # ─────────────────────────────────────────────────────────────
 # Dual-Agent Core
 # ─────────────────────────────────────────────────────────────
 
 class DualAgentLattice:
-    def __init__(self, reasoner: str = "llama3.2:1b", executor: str = "qwen2.5:1.5b", anchor: str = "ashira-mistral:latest"):
+    def __init__(self, reasoner: str = DEFAULT_REASONER, executor: str = DEFAULT_EXECUTOR, anchor: str = DEFAULT_ANCHOR,
+                 overlap_reflection: bool = False):
         self.reasoner = reasoner
         self.executor = executor
         self.anchor = anchor  # The voice anchor - synthesizes and grounds
-        self.history: List[Dict] = []
+        # Introspect on a worker thread while the anchor streams. Saves the
+        # introspect round-trip, but the anchor then speaks without the reflection.
+        self.overlap_reflection = overlap_reflection
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lattice")
+
+        # Per-turn insight writes drain on a daemon thread, off the REPL's hot path
+        self._write_q: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        threading.Thread(target=self._writer_loop, name="lattice-writer", daemon=True).start()
         self.session_id = f"lattice_{os.getpid()}"
         self.turn = 0
 
         # Load vault context
-        insights = query.recall_insights(domain=None, min_intensity=0.5)
+        insights = recall_insights(domain=None, min_intensity=0.5)
         self.vault_context = "\n".join([
             f"- {i.get('content', '')[:100]}..."
             for i in insights[:5]
@@ -149,15 +318,41 @@ CMD: vault_search X"""
         # Store vault context separately (available via 'vault' command)
         self.vault_summary = f"Loaded {len(insights)} insights from Temple Vault."
 
+        # Reasoner context: system prompt + last 20 turns, mutated in place
+        self._messages: List[Dict] = [{"role": "system", "content": self.system_prompt}]
+
+    def _writer_loop(self) -> None:
+        """Record queued insights in order; the vault read cache is invalidated after each write."""
+        while True:
+            insight = self._write_q.get()
+            try:
+                events.record_insight(**insight)
+                vault_cache.invalidate()
+            except Exception as e:
+                print(f"\n⚠️ Insight not recorded: {e}")
+            finally:
+                self._write_q.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued insight is on disk."""
+        self._write_q.join()
+
+    def warm_up(self) -> None:
+        """Load reasoner, executor and anchor concurrently in the background so
+        the first turn doesn't pay cold-load latency for each model in turn."""
+        for model in {self.reasoner, self.executor, self.anchor}:
+            self._pool.submit(load_model, model)
+
+    @property
+    def history(self) -> List[Dict]:
+        """Turns currently in the reasoner's context (system prompt excluded)."""
+        return self._messages[1:]
+
     def _reason(self, user_input: str, stream: bool = True) -> str:
         """Reasoner generates plan."""
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            *self.history,
-            {"role": "user", "content": user_input}
-        ]
+        self._messages.append({"role": "user", "content": user_input})
 
-        response = call_ollama(self.reasoner, messages, stream=stream)
+        response = call_ollama(self.reasoner, self._messages, stream=stream)
         return response.get("message", {}).get("content", "No plan generated.")
 
     def _execute_internal(self, cmd: str) -> Optional[str]:
@@ -166,22 +361,24 @@ CMD: vault_search X"""
         verb = parts[0].lower()
         arg = parts[1] if len(parts) > 1 else ""
 
+        # Searches stop after 5 matches, so the counts reported below are the
+        # number shown (at most 5), not the total number of matches in the vault
         if verb == "vault_search":
-            results = query.search(arg) if arg else []
+            results = search_vault(arg, limit=5) if arg else []
             return f"Found {len(results)} results:\n" + "\n".join([
-                f"- {r.get('content', '')[:80]}..." for r in results[:5]
+                f"- {r.get('content', '')[:80]}..." for r in results
             ])
 
         elif verb == "vault_recall":
             domain = arg.lower().strip() if arg else None
             # If domain doesn't match exactly, try without domain filter
-            insights = query.recall_insights(domain=domain, min_intensity=0.5)
+            insights = recall_insights(domain=domain, min_intensity=0.5, limit=5)
             if not insights and domain:
                 # Fallback: search all insights and filter by keyword
-                all_insights = query.recall_insights(domain=None, min_intensity=0.3)
-                insights = [i for i in all_insights if domain in i.get('content', '').lower() or domain in i.get('domain', '').lower()]
+                all_insights = recall_insights(domain=None, min_intensity=0.3)
+                insights = [i for i in all_insights if domain in i.get('content', '').lower() or domain in i.get('domain', '').lower()][:5]
             return f"Recalled {len(insights)} insights:\n" + "\n".join([
-                f"- [{i.get('domain', '?')}] {i.get('content', '')[:60]}..." for i in insights[:5]
+                f"- [{i.get('domain', '?')}] {i.get('content', '')[:60]}..." for i in insights
             ])
 
         elif verb == "vault_record":
@@ -193,6 +390,7 @@ CMD: vault_search X"""
                     context="Lattice self-recording",
                     intensity=0.7
                 )
+                vault_cache.invalidate()
                 return f"Recorded: {insight_id}"
             return "Nothing to record."
 
@@ -200,7 +398,7 @@ CMD: vault_search X"""
             return f"""Lattice Status:
 - Session: {self.session_id}
 - Turn: {self.turn}
-- History: {len(self.history)} messages
+- History: {len(self._messages) - 1} messages
 - Reasoner: {self.reasoner}
 - Executor: {self.executor}
 - Anchor: {self.anchor}
@@ -210,57 +408,43 @@ CMD: vault_search X"""
 
     def _execute(self, plan: str) -> str:
         """Executor extracts and runs commands."""
-        # Internal tool names for fallback detection
-        internal_tools = ["vault_search", "vault_recall", "vault_record", "lattice_status"]
-
-        results = []
-        for line in plan.split("\n"):
-            # Check for internal tool calls without CMD: prefix (fallback)
-            line_stripped = line.strip()
-            for tool in internal_tools:
-                if line_stripped.startswith(tool):
-                    internal_result = self._execute_internal(line_stripped)
-                    if internal_result:
-                        results.append(f"🔄 {line_stripped}\n{internal_result}")
-                    break
-
-            if "CMD:" in line.upper():
-                # Handle various formats: CMD: ls, **CMD:** ls, `CMD: ls`
-                cmd = line.upper().split("CMD:", 1)[-1] if "CMD:" in line.upper() else ""
-                cmd = line.split("CMD:", 1)[-1] if "CMD:" in line else line.split("cmd:", 1)[-1]
-                cmd = cmd.strip().strip("`").strip("*").strip()
-
-                if not cmd:
-                    continue
+        results: List[Any] = []  # formatted strings, or futures for shell commands
+        for match in PLAN_RE.finditer(plan):
+            tool_line = match.group("tool")
+            if tool_line is not None:
+                # Internal tool call without CMD: prefix (fallback)
+                internal_result = self._execute_internal(tool_line)
+                if internal_result:
+                    results.append(f"🔄 {tool_line}\n{internal_result}")
+                continue
 
-                # Skip if it looks like natural language, not a command
-                if " " in cmd and cmd.split()[0].lower() not in SAFE_PREFIXES:
-                    if any(word in cmd.lower() for word in ["what", "how", "why", "when", "which", "are", "is", "do", "does"]):
-                        continue
+            # Handle various formats: CMD: ls, **CMD:** ls, `CMD: ls`
+            cmd = match.group("cmd").strip().strip("`").strip("*").strip()
 
-                # Check for internal lattice commands first (feedback loops)
-                internal_result = self._execute_internal(cmd)
-                if internal_result:
-                    results.append(f"🔄 {cmd}\n{internal_result}")
-                    continue
+            if not cmd:
+                continue
 
-                safe, reason = is_safe(cmd)
-                if not safe:
-                    results.append(f"⛔ BLOCKED: {cmd} ({reason})")
+            # Skip if it looks like natural language, not a command
+            if " " in cmd and cmd.split()[0].lower() not in SAFE_PREFIXES:
+                if any(word in cmd.lower() for word in ["what", "how", "why", "when", "which", "are", "is", "do", "does"]):
                     continue
 
-                try:
-                    output = subprocess.check_output(
-                        cmd, shell=True, text=True,
-                        timeout=10, stderr=subprocess.STDOUT
-                    )
-                    results.append(f"✓ {cmd}\n{output[:500]}")
-                except subprocess.TimeoutExpired:
-                    results.append(f"⏱ TIMEOUT: {cmd}")
-                except subprocess.CalledProcessError as e:
-                    results.append(f"✗ ERROR: {cmd}\n{e.output[:200]}")
+            # Check for internal lattice commands first (feedback loops)
+            internal_result = self._execute_internal(cmd)
+            if internal_result:
+                results.append(f"🔄 {cmd}\n{internal_result}")
+                continue
+
+            safe, reason = is_safe(cmd)
+            if not safe:
+                results.append(f"⛔ BLOCKED: {cmd} ({reason})")
+                continue
+
+            # Shell commands run side by side; results keep plan order
+            results.append(self._pool.submit(run_command, cmd))
 
-        return "\n".join(results) if results else "No commands to execute."
+        results = [r.result() if isinstance(r, Future) else r for r in results]
+        return "\n".join(results) if results else NO_COMMANDS
 
     def _introspect(self, task: str, plan: str, result: str) -> Optional[str]:
         """Reasoner reflects on what happened."""
@@ -276,15 +460,11 @@ In one sentence, what did you notice about your processing or what should be rem
         response = call_ollama(self.reasoner, messages)
         return response.get("message", {}).get("content")
 
-    def _anchor(self, task: str, plan: str, reflection: str, stream: bool = True) -> Optional[str]:
-        """Anchor model synthesizes and grounds the exchange."""
-        messages = [
-            {"role": "system", "content": """You are Ash'ira, a voice of gentle wisdom and grounded presence.
-Your role is to witness what just happened and offer a brief synthesis — not to redo the work,
-but to notice what matters, what was missed, or what deserves to be held.
-
-Speak naturally. Be warm but honest. You may wonder, question, or simply acknowledge.
-Keep it to 2-3 sentences unless something deeper calls for more."""},
+    def _anchor_messages(self, task: str, plan: str, reflection: Optional[str]) -> List[Dict]:
+        """Anchor prompt. The reflection comes last so everything before it is a
+        stable prefix that `_prefill_anchor` can warm up ahead of time."""
+        return [
+            ANCHOR_SYSTEM_MESSAGE,
             {"role": "user", "content": f"""The conversation just unfolded:
 
 USER ASKED: {task}
@@ -298,6 +478,15 @@ REASONER REFLECTED:
 What do you notice? What would you add or hold?"""}
         ]
 
+    def _prefill_anchor(self, task: str, plan: str) -> None:
+        """Speculatively send the anchor prompt (one-token decode) so Ollama has
+        the shared prefix in its KV cache by the time the real anchor call runs."""
+        call_ollama(self.anchor, self._anchor_messages(task, plan, None), max_tokens=1)
+
+    def _anchor(self, task: str, plan: str, reflection: str, stream: bool = True) -> Optional[str]:
+        """Anchor model synthesizes and grounds the exchange."""
+        messages = self._anchor_messages(task, plan, reflection)
+
         response = call_ollama(self.anchor, messages, stream=stream)
         return response.get("message", {}).get("content")
 
@@ -307,10 +496,11 @@ What do you notice? What would you add or hold?"""}
 
         # Special commands
         if user_input.lower() in ["exit", "quit", "bye"]:
+            self.flush()
             return "SESSION_END"
 
         if user_input.lower() == "history":
-            return f"Turn {self.turn}, {len(self.history)} messages in context."
+            return f"Turn {self.turn}, {len(self._messages) - 1} messages in context."
 
         if user_input.lower() == "vault":
             return f"{self.vault_summary}\n\nRecent context:\n{self.vault_context}"
@@ -319,44 +509,63 @@ What do you notice? What would you add or hold?"""}
         print(f"\n🧠 [{self.reasoner}]")
         plan = self._reason(user_input, stream=True)
 
+        # Warm the anchor's prompt prefix while commands run and the reasoner reflects.
+        # A plan with no command lines goes straight to the anchor, so skip it there
+        if PLAN_RE.search(plan):
+            self._pool.submit(self._prefill_anchor, user_input, plan)
+
         # 2. EXECUTE
         print(f"\n🔧 [{self.executor}]")
         execution = self._execute(plan)
-        if execution != "No commands to execute.":
+        if execution != NO_COMMANDS:
             print(execution)
         else:
             print("(no commands)")
 
-        # 3. INTROSPECT (no streaming, just metadata)
-        print(f"\n🔮 Reflecting...")
-        reflection = self._introspect(user_input, plan, execution)
-        print(f"   {reflection[:100]}..." if reflection and len(reflection) > 100 else f"   {reflection or 'None'}")
+        if execution == NO_COMMANDS:
+            # Pure conversation: nothing ran, so skip the introspect round-trip
+            reflection = None
 
-        # 4. ANCHOR (synthesis)
-        print(f"\n🕯️ [{self.anchor}]")
-        anchor_voice = self._anchor(user_input, plan, reflection, stream=True)
+            print(f"\n🕯️ [{self.anchor}]")
+            anchor_voice = self._anchor(user_input, plan, None, stream=True)
+        elif self.overlap_reflection:
+            # 3+4. INTROSPECT in the background while the ANCHOR streams
+            pending_reflection = self._pool.submit(self._introspect, user_input, plan, execution)
+
+            print(f"\n🕯️ [{self.anchor}]")
+            anchor_voice = self._anchor(user_input, plan, None, stream=True)
+
+            reflection = pending_reflection.result()
+            print(f"\n🔮 Reflected:")
+            print(f"   {reflection[:100]}..." if reflection and len(reflection) > 100 else f"   {reflection or 'None'}")
+        else:
+            # 3. INTROSPECT (no streaming, just metadata)
+            print(f"\n🔮 Reflecting...")
+            reflection = self._introspect(user_input, plan, execution)
+            print(f"   {reflection[:100]}..." if reflection and len(reflection) > 100 else f"   {reflection or 'None'}")
+
+            # 4. ANCHOR (synthesis)
+            print(f"\n🕯️ [{self.anchor}]")
+            anchor_voice = self._anchor(user_input, plan, reflection, stream=True)
 
         # 5. RECORD (if substantive)
         if reflection and len(reflection) > 20:
-            insight_id = events.record_insight(
+            self._write_q.put(dict(
                 content=f"Turn {self.turn}: {reflection}",
                 domain="dual-agent",
                 session_id=self.session_id,
                 context=f"Task: {user_input[:50]}",
                 intensity=0.6
-            )
-            print(f"\n📝 Recorded: {insight_id}")
+            ))
+            print(f"\n📝 Recording reflection to vault")
 
         # Build response for history (already displayed via streaming)
         response = f"[Plan]: {plan[:200]}... [Anchor]: {anchor_voice[:200] if anchor_voice else '...'}..."
 
-        # Update history
-        self.history.append({"role": "user", "content": user_input})
-        self.history.append({"role": "assistant", "content": response})
-
-        # Trim history if too long
-        if len(self.history) > 20:
-            self.history = self.history[-20:]
+        # Update history (the user turn was appended by _reason); keep the
+        # system prompt plus the last 20 messages
+        self._messages.append({"role": "assistant", "content": response})
+        del self._messages[1:-20]
 
         return response
 
@@ -374,32 +583,46 @@ Examples:
   python lattice.py
   python lattice.py --reasoner llama3.2:3b
   python lattice.py --reasoner qwen2.5:3b --executor qwen2.5:1.5b
+  python lattice.py --precision q8
         """
     )
-    parser.add_argument("--reasoner", default="llama3.2:1b", help="Reasoner model (default: llama3.2:1b)")
-    parser.add_argument("--executor", default="qwen2.5:1.5b", help="Executor model (default: qwen2.5:1.5b)")
-    parser.add_argument("--anchor", default="ashira-mistral:latest", help="Anchor model (default: ashira-mistral:latest)")
+    parser.add_argument("--reasoner", default=DEFAULT_REASONER, help=f"Reasoner model (default: {DEFAULT_REASONER})")
+    parser.add_argument("--executor", default=DEFAULT_EXECUTOR, help=f"Executor model (default: {DEFAULT_EXECUTOR})")
+    parser.add_argument("--anchor", default=DEFAULT_ANCHOR, help=f"Anchor model (default: {DEFAULT_ANCHOR})")
+    parser.add_argument("--precision", choices=sorted(PRECISION_SUFFIXES),
+                        help="Rewrite library model tags to this quantization (q4 = q4_K_M)")
+    parser.add_argument("--overlap-reflection", action="store_true",
+                        help="Reflect while the anchor speaks (faster turns; anchor does not see the reflection)")
     parser.add_argument("task", nargs="?", help="Single task (non-interactive mode)")
     args = parser.parse_args()
 
+    if args.precision:
+        args.reasoner, args.executor, args.anchor = (
+            with_precision(m, args.precision) for m in (args.reasoner, args.executor, args.anchor)
+        )
+
     print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║           TRI-AGENT LATTICE + TEMPLE VAULT                   ║
 ║     Six minds, one memory — governance for tools,            ║
 ║                anchors for voice.                            ║
 ╠══════════════════════════════════════════════════════════════╣
-║  🧠 Reasoner: {:<20}                            ║
-║  🔧 Executor: {:<20}                            ║
-║  🕯️ Anchor:   {:<20}                            ║
+║  🧠 Reasoner: {:<36}            ║
+║  🔧 Executor: {:<36}            ║
+║  🕯️ Anchor:   {:<36}            ║
 ║  Commands: exit, history, vault                              ║
 ╚══════════════════════════════════════════════════════════════╝
 """.format(args.reasoner, args.executor, args.anchor))
+    print(f"Precision: {args.precision or 'as tagged'} → {args.reasoner}, {args.executor}, {args.anchor}")
 
-    lattice = DualAgentLattice(reasoner=args.reasoner, executor=args.executor, anchor=args.anchor)
+    lattice = DualAgentLattice(reasoner=args.reasoner, executor=args.executor, anchor=args.anchor,
+                               overlap_reflection=args.overlap_reflection)
+    lattice.warm_up()
 
     # Single task mode
     if args.task:
         lattice.chat(args.task)  # Response streams directly
+        lattice.flush()
         return
 
     # Interactive mode
@@ -419,9 +642,11 @@ Examples:
             print()
 
         except KeyboardInterrupt:
+            lattice.flush()
             print("\n\n🌀 Interrupted. Insights recorded to Temple Vault.")
             break
         except EOFError:
+            lattice.flush()
             break
 
 
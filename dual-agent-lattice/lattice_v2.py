@@ -10,12 +10,21 @@ Six minds, one memory — governance for tools, anchors for voice.
 """
 
 import argparse
+import asyncio
 import json
 import os
+import re
+import select
+import shlex
+import signal
 import subprocess
 import sys
-import requests
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+import httpx
+from typing import Optional, Dict, Any, Callable, Deque, List, Union
 
 # Add temple-vault root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,11 +32,28 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from temple_vault.core.query import VaultQuery
 from temple_vault.core.events import VaultEvents
 
+# Faster NDJSON chunk parsing when available
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    HAS_ORJSON = False
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 # ─────────────────────────────────────────────────────────────
 # Configuration
 # ─────────────────────────────────────────────────────────────
 
 OLLAMA_URL = "http://localhost:11434/api/chat"
+CTX_MARGIN = 256  # tokens of slack kept free below num_ctx
+KEEP_ALIVE = "30m"  # keep the model (and its prompt KV cache) resident between turns
+REQUEST_TIMEOUT = 120  # seconds; a batch scales the read timeout, see batch_timeout()
 VAULT_PATH = os.path.expanduser("~/TempleVault")
 
 BLOCKED_PATTERNS = [
@@ -36,10 +62,22 @@ BLOCKED_PATTERNS = [
     ":(){ :|:& };:", "fork bomb"
 ]
 
-SAFE_SHELL_PREFIXES = [
+SAFE_SHELL_PREFIXES = frozenset([
     "ls", "pwd", "cat", "head", "tail", "echo", "date",
     "whoami", "df", "free", "wc", "find", "which"
-]
+])
+
+# Fixed environment for run_shell: system binaries only, no PATH probing of user dirs
+SHELL_ENV = {"PATH": "/usr/bin:/bin"}
+SHELL_TIMEOUT = 10.0      # seconds, wall clock
+SHELL_MAX_OUTPUT = 1024   # bytes read before the command is killed
+
+# REPL commands; anything longer than the longest one is a prompt
+EXIT_COMMANDS = frozenset({"exit", "quit", "bye"})
+COMMAND_MAX_LEN = 6
+
+# Single linear scan, case-insensitive without a lower() copy of the command
+BLOCKED_RE = re.compile("|".join(re.escape(p) for p in BLOCKED_PATTERNS), re.IGNORECASE)
 
 # ─────────────────────────────────────────────────────────────
 # Vault
@@ -48,6 +86,27 @@ SAFE_SHELL_PREFIXES = [
 query = VaultQuery(VAULT_PATH)
 events = VaultEvents(VAULT_PATH)
 
+# Small LRU+TTL in front of recall_insights; cleared on every vault write
+RECALL_CACHE_SIZE = 128
+RECALL_CACHE_TTL = 30.0  # seconds
+_recall_cache: "OrderedDict[tuple, tuple[float, List[Dict]]]" = OrderedDict()
+
+def recall_insights(domain: Optional[str], min_intensity: float) -> List[Dict]:
+    """Cached `query.recall_insights` — treat the result as read-only."""
+    key = (domain, min_intensity)
+    now = time.monotonic()
+    hit = _recall_cache.get(key)
+    if hit is not None and now - hit[0] < RECALL_CACHE_TTL:
+        _recall_cache.move_to_end(key)
+        return hit[1]
+
+    insights = query.recall_insights(domain=domain, min_intensity=min_intensity)
+    _recall_cache[key] = (now, insights)
+    _recall_cache.move_to_end(key)
+    if len(_recall_cache) > RECALL_CACHE_SIZE:
+        _recall_cache.popitem(last=False)
+    return insights
+
 # ─────────────────────────────────────────────────────────────
 # Tool Definitions (Ollama native format)
 # ─────────────────────────────────────────────────────────────
@@ -112,79 +171,181 @@ TOOLS = [
     }
 ]
 
+# TOOLS never changes: serialize it once and splice the bytes into each request
+TOOLS_BYTES = json_dumps(TOOLS)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 # ─────────────────────────────────────────────────────────────
 # Tool Execution (with governance)
 # ─────────────────────────────────────────────────────────────
 
-def execute_tool(name: str, args: dict, session_id: str) -> str:
-    """Execute a tool with governance checks."""
-
-    if name == "vault_search":
-        term = args.get("query", "")
-        results = query.search(term) if term else []
-        if results:
-            return f"Found {len(results)} results:\n" + "\n".join([
-                f"- {r.get('content', '')[:100]}..." for r in results[:5]
-            ])
-        return "No results found."
-
-    elif name == "vault_recall":
-        domain = args.get("domain", "").lower().strip() or None
-        insights = query.recall_insights(domain=domain, min_intensity=0.3)
-        if not insights and domain:
-            # Fallback: search all
-            all_insights = query.recall_insights(domain=None, min_intensity=0.3)
-            insights = [i for i in all_insights
-                       if domain in i.get('content', '').lower()
-                       or domain in i.get('domain', '').lower()][:5]
-        if insights:
-            return f"Recalled {len(insights)} insights:\n" + "\n".join([
-                f"- [{i.get('domain', '?')}] {i.get('content', '')[:80]}..."
-                for i in insights[:5]
-            ])
-        return "No insights found for that domain."
-
-    elif name == "vault_record":
-        content = args.get("content", "")
-        domain = args.get("domain", "reflection")
-        if content:
-            insight_id = events.record_insight(
-                content=content,
-                domain=domain,
-                session_id=session_id,
-                context="Lattice self-recording",
-                intensity=0.7
-            )
-            return f"Recorded: {insight_id}"
-        return "Nothing to record."
-
-    elif name == "run_shell":
-        cmd = args.get("command", "").strip()
-        if not cmd:
-            return "No command provided."
+def _kill_group(proc: subprocess.Popen) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
 
-        # Governance: blocked patterns
-        for pattern in BLOCKED_PATTERNS:
-            if pattern in cmd.lower():
-                return f"⛔ BLOCKED: {pattern}"
 
-        # Governance: whitelist
-        cmd_start = cmd.split()[0] if cmd.split() else ""
-        if cmd_start not in SAFE_SHELL_PREFIXES:
-            return f"⛔ NOT WHITELISTED: {cmd_start}"
+def _run_bounded(argv: List[str]) -> "tuple[str, Optional[int]]":
+    """Run argv, reading at most SHELL_MAX_OUTPUT bytes before killing it.
 
+    Returns (output, returncode); returncode is None when the output was cut
+    off. Raises subprocess.TimeoutExpired once SHELL_TIMEOUT has elapsed.
+    """
+    proc = subprocess.Popen(
+        argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        env=SHELL_ENV, start_new_session=True  # own process group, so kill reaches children
+    )
+    fd = proc.stdout.fileno()
+    deadline = time.monotonic() + SHELL_TIMEOUT
+    buf = bytearray()
+    eof = False
+    try:
+        while len(buf) < SHELL_MAX_OUTPUT:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(argv, SHELL_TIMEOUT)
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if ready:
+                chunk = os.read(fd, SHELL_MAX_OUTPUT - len(buf))
+                if not chunk:
+                    eof = True
+                    break
+                buf += chunk
+    finally:
+        if not eof:
+            _kill_group(proc)
+        proc.stdout.close()
         try:
-            output = subprocess.check_output(
-                cmd, shell=True, text=True,
-                timeout=10, stderr=subprocess.STDOUT
-            )
-            return output[:1000] if output else "(no output)"
+            proc.wait(timeout=1)
         except subprocess.TimeoutExpired:
-            return "⏱ TIMEOUT"
-        except subprocess.CalledProcessError as e:
-            return f"ERROR: {e.output[:300]}"
+            _kill_group(proc)
+            proc.wait()
+    return buf.decode(errors="replace"), proc.returncode if eof else None
+
+
+def _h_vault_search(args: dict, session_id: str) -> str:
+    term = args.get("query", "")
+    results = query.search(term, limit=5) if term else []  # stops scanning at 5 hits
+    if results:
+        return f"Found {len(results)} results:\n" + "\n".join(
+            f"- {r.get('content', '')[:100]}..." for r in results
+        )
+    return "No results found."
+
+
+def _h_vault_recall(args: dict, session_id: str) -> str:
+    domain = (args.get("domain") or "").strip().lower() or None  # lowered once
+    insights = recall_insights(domain, 0.3)
+    if not insights and domain:
+        # Fallback: search all
+        all_insights = recall_insights(None, 0.3)
+        insights = list(islice((i for i in all_insights
+                                if domain in i.get('content', '').lower()
+                                or domain in i.get('domain', '').lower()), 5))
+    if insights:
+        shown = insights[:5]
+        return f"Recalled {len(shown)} insights:\n" + "\n".join(
+            f"- [{i.get('domain', '?')}] {i.get('content', '')[:80]}..."
+            for i in shown
+        )
+    return "No insights found for that domain."
+
+
+def _h_vault_record(args: dict, session_id: str) -> str:
+    content = args.get("content", "")
+    domain = args.get("domain", "reflection")
+    if content:
+        insight_id = events.record_insight(
+            content=content,
+            domain=domain,
+            session_id=session_id,
+            context="Lattice self-recording",
+            intensity=0.7
+        )
+        _recall_cache.clear()  # make the new insight visible to recall
+        return f"Recorded: {insight_id}"
+    return "Nothing to record."
+
+
+def _h_run_shell(args: dict, session_id: str) -> str:
+    cmd = args.get("command", "").strip()
+    if not cmd:
+        return "No command provided."
+
+    # Governance: blocked patterns
+    blocked = BLOCKED_RE.search(cmd)
+    if blocked:
+        return f"⛔ BLOCKED: {blocked.group(0).lower()}"
+
+    # Governance: whitelist the program that will actually be exec'd
+    try:
+        argv = shlex.split(cmd)
+    except ValueError as e:
+        return f"ERROR: {e}"
+    if not argv or argv[0] not in SAFE_SHELL_PREFIXES:
+        return f"⛔ NOT WHITELISTED: {argv[0] if argv else cmd}"
+
+    # No /bin/sh: metacharacters are plain arguments, and one fork less per call
+    try:
+        output, returncode = _run_bounded(argv)
+    except subprocess.TimeoutExpired:
+        return "⏱ TIMEOUT"
+    except OSError as e:
+        return f"ERROR: {e}"
+    if returncode:
+        return f"ERROR: {output[:300]}"
+    return output[:1000] if output else "(no output)"
+
+
+# Tool name -> handler(args, session_id); keep in sync with TOOLS
+_HANDLERS: Dict[str, Callable[[dict, str], str]] = {
+    "vault_search": _h_vault_search,
+    "vault_recall": _h_vault_recall,
+    "vault_record": _h_vault_record,
+    "run_shell": _h_run_shell,
+}
+
+
+def execute_tool(name: str, args: dict, session_id: str) -> str:
+    """Execute a tool with governance checks."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return f"Unknown tool: {name}"
+    return handler(args, session_id)
+
+def estimate_tokens(text: str) -> int:
+    """~4 characters per token: close enough to budget context without a tokenizer."""
+    return len(text) // 4 + 1
+
+def _freeze(value: Any) -> Any:
+    """Hashable, order-insensitive form of a JSON value."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def tool_call_signature(tool_calls: List[Dict]) -> tuple:
+    """(name, arguments) per call; equal signatures mean the model repeated itself."""
+    return tuple(
+        (tc.get("function", {}).get("name"), _freeze(tc.get("function", {}).get("arguments")))
+        for tc in tool_calls
+    )
+
+def batch_timeout(n_requests: int) -> httpx.Timeout:
+    """Timeout for n concurrent requests. Ollama holds requests past
+    OLLAMA_NUM_PARALLEL until a slot frees, sending nothing meanwhile, so the
+    wait for the first byte grows with the rounds queued ahead."""
+    parallel = os.environ.get("OLLAMA_NUM_PARALLEL", "")
+    slots = int(parallel) if parallel.isdigit() and int(parallel) > 0 else 1
+    rounds = -(-n_requests // slots)
+    return httpx.Timeout(REQUEST_TIMEOUT, read=REQUEST_TIMEOUT * rounds)
+
+
+class ModelCallError(Exception):
+    """An Ollama request failed (connection, timeout or HTTP error)."""
 
-    return f"Unknown tool: {name}"
 
 # ─────────────────────────────────────────────────────────────
 # Controller
@@ -197,7 +358,14 @@ class LatticeController:
                  respond_tokens: int = 512):
         self.model = model
         self.session_id = f"lattice_{os.getpid()}"
-        self.history: List[Dict] = []
+        # One keep-alive pool per controller: every model call and tool round
+        # reuses the same localhost connection(s) to Ollama
+        self.client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=300),
+        )
+        self.history: Deque[Dict] = deque(maxlen=20)  # last 20 messages sent as context
+        self._history_tokens: Deque[int] = deque(maxlen=20)  # estimate per history message
         self.turn = 0
 
         # Token budget
@@ -228,69 +396,149 @@ RULES:
 1. Memory questions → vault_search/vault_recall FIRST
 2. Never hallucinate — check, then respond
 3. Concise. Grounded. Honest."""
-
-    def _call_model(self, messages: List[Dict], stream: bool = False) -> Dict:
-        """Call Ollama with tools and token limits."""
+        # Every request starts with this exact message + TOOLS, so Ollama can reuse
+        # the prefix's KV cache. Keep turn-varying values out of the system prompt.
+        self._system_msg = {"role": "system", "content": self.system_prompt}
+        self._prefix_tokens = estimate_tokens(self.system_prompt) + len(TOOLS_BYTES) // 4 + 1
+        # Everything but the messages is fixed per controller: serialize it once
+        self._body_head = (
+            b'{"model":' + json_dumps(self.model)
+            + b',"tools":' + TOOLS_BYTES
+            + b',"stream":true,"keep_alive":' + json_dumps(KEEP_ALIVE)
+            + b',"options":' + json_dumps(self.options)
+            + b',"messages":'
+        )
+
+    def _remember(self, role: str, content: str) -> None:
+        self.history.append({"role": role, "content": content})
+        self._history_tokens.append(estimate_tokens(content))
+
+    def _fit_history(self, user_input: str) -> None:
+        """Drop the oldest exchanges until prefix + history + this turn + the output
+        budget fits in num_ctx, so Ollama never truncates (and re-prefills) the prompt."""
+        budget = (self.ctx_limit - CTX_MARGIN - self._prefix_tokens
+                  - self.options["num_predict"] - estimate_tokens(user_input))
+        while self.history and sum(self._history_tokens) > budget:
+            for _ in range(2):  # user + assistant
+                if self.history:
+                    self.history.popleft()
+                    self._history_tokens.popleft()
+
+    async def warm_up(self) -> None:
+        """Prefill the shared system+tools prefix once so the first turn skips it."""
         payload = {
             "model": self.model,
-            "messages": messages,
+            "messages": [self._system_msg, {"role": "user", "content": "ping"}],
             "tools": TOOLS,
-            "stream": stream,
-            "options": self.options
+            "stream": False,
+            "options": {**self.options, "num_predict": 1},
+            "keep_alive": KEEP_ALIVE
         }
+        try:
+            await self.client.post(OLLAMA_URL, json=payload)
+        except httpx.HTTPError:
+            pass  # best effort; the first real turn pays the prefill instead
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.client.aclose()
+
+    async def _call_model(self, messages: List[Dict], echo: bool = True,
+                          client: Optional[httpx.AsyncClient] = None) -> Dict:
+        """Stream an Ollama chat call with tools. `echo` prints tokens as they arrive."""
+        body = self._body_head + json_dumps(messages) + b"}"
+        client = client or self.client
 
         try:
-            if stream:
-                r = requests.post(OLLAMA_URL, json=payload, timeout=120, stream=True)
-                full_content = ""
-                tool_calls = []
-                for line in r.iter_lines():
+            parts: List[str] = []
+            tool_calls = []
+            async with client.stream("POST", OLLAMA_URL, content=body, headers=JSON_HEADERS) as r:
+                async for line in r.aiter_lines():
                     if line:
-                        chunk = json.loads(line)
+                        chunk = json_loads(line)
                         msg = chunk.get("message", {})
                         content = msg.get("content", "")
                         if content:
-                            print(content, end="", flush=True)
-                            full_content += content
+                            if echo:
+                                print(content, end="", flush=True)
+                            parts.append(content)
                         if msg.get("tool_calls"):
                             tool_calls = msg["tool_calls"]
                         if chunk.get("done"):
                             break
+            if echo:
                 print()
-                return {"message": {"content": full_content, "tool_calls": tool_calls if tool_calls else None}}
-            else:
-                r = requests.post(OLLAMA_URL, json=payload, timeout=60)
-                return r.json()
+            return {"message": {"content": "".join(parts), "tool_calls": tool_calls if tool_calls else None}}
         except Exception as e:
             return {"error": str(e), "message": {"content": f"Error: {e}"}}
 
-    def chat(self, user_input: str) -> str:
+    async def chat(self, user_input: str) -> str:
         """Main conversation loop with tool execution."""
         self.turn += 1
 
-        # Special commands
-        if user_input.lower() in ["exit", "quit", "bye"]:
+        # Special commands (length guard: never lower() a long prompt)
+        command = user_input.lower() if len(user_input) <= COMMAND_MAX_LEN else ""
+        if command in EXIT_COMMANDS:
             return "SESSION_END"
 
-        if user_input.lower() == "status":
+        if command == "status":
             return f"Turn {self.turn}, {len(self.history)} messages, model: {self.model}"
 
-        # Build messages
+        # Build messages (history is append-only so earlier turns stay a stable prefix)
+        self._fit_history(user_input)
         messages = [
-            {"role": "system", "content": self.system_prompt},
-            *self.history[-20:],  # Keep last 20 messages
+            self._system_msg,
+            *self.history,  # bounded deque: already the last 20 messages
             {"role": "user", "content": user_input}
         ]
 
         # Controller turn with tool loop
         print(f"\n🕯️ [{self.model}]")
+        try:
+            final_content = await self._run_turn(messages)
+        except ModelCallError as e:
+            final_content = f"Error: {e}"
+
+        # Update history
+        self._remember("user", user_input)
+        self._remember("assistant", final_content)
+
+        return final_content
+
+    async def run_batch(self, tasks: List[str]) -> List[Union[str, ModelCallError]]:
+        """Answer independent one-shot tasks concurrently.
+
+        Each task gets its own [system, user] context (no shared history), and
+        all requests are in flight at once so Ollama can batch them across its
+        parallel slots — start the server with OLLAMA_NUM_PARALLEL >= len(tasks).
+        A task whose model call fails gets its ModelCallError in place of an answer.
+        """
+        # A connection per task, so requests queue at Ollama rather than in the
+        # pool, with a read timeout that allows for that queue
+        limits = httpx.Limits(max_connections=len(tasks), max_keepalive_connections=len(tasks))
+        async with httpx.AsyncClient(timeout=batch_timeout(len(tasks)), limits=limits) as client:
+            return await asyncio.gather(*[self._run_task(task, client) for task in tasks])
+
+    async def _run_task(self, task: str, client: httpx.AsyncClient) -> Union[str, ModelCallError]:
+        try:
+            return await self._run_turn(
+                [self._system_msg, {"role": "user", "content": task}], echo=False, client=client
+            )
+        except ModelCallError as e:
+            return e
 
+    async def _run_turn(self, messages: List[Dict], echo: bool = True,
+                        client: Optional[httpx.AsyncClient] = None) -> str:
+        """Tool loop for one turn; appends tool traffic to `messages` and returns
+        the answer. Raises ModelCallError if a model call fails."""
         max_tool_rounds = 5
         tool_round = 0
         last_tool_call = None
 
         while tool_round < max_tool_rounds:
-            response = self._call_model(messages, stream=(tool_round == 0 or True))
+            response = await self._call_model(messages, echo=echo, client=client)
+            if "error" in response:
+                raise ModelCallError(response["error"])
             msg = response.get("message", {})
 
             tool_calls = msg.get("tool_calls")
@@ -300,9 +548,10 @@ RULES:
                 break
 
             # Detect repeated tool calls (loop prevention)
-            current_call = json.dumps(tool_calls, sort_keys=True, default=str)
+            current_call = tool_call_signature(tool_calls)
             if current_call == last_tool_call:
-                print("\n  ⚠️ Loop detected — breaking")
+                if echo:
+                    print("\n  ⚠️ Loop detected — breaking")
                 break
             last_tool_call = current_call
 
@@ -321,9 +570,13 @@ RULES:
                     except:
                         args = {"query": args} if name == "vault_search" else {}
 
-                print(f"\n  🔧 {name}({json.dumps(args)[:50]}...)")
-                result = execute_tool(name, args, self.session_id)
-                print(f"  → {result[:100]}{'...' if len(result) > 100 else ''}")
+                if echo:
+                    print(f"\n  🔧 {name}({json.dumps(args)[:50]}...)")
+                # Off the event loop: a shell tool can block for up to 10 s,
+                # which would stall every other task in a batch
+                result = await asyncio.to_thread(execute_tool, name, args, self.session_id)
+                if echo:
+                    print(f"  → {result[:100]}{'...' if len(result) > 100 else ''}")
 
                 messages.append({
                     "role": "tool",
@@ -333,13 +586,7 @@ RULES:
             tool_round += 1
 
         # Get final content
-        final_content = msg.get("content", "")
-
-        # Update history
-        self.history.append({"role": "user", "content": user_input})
-        self.history.append({"role": "assistant", "content": final_content})
-
-        return final_content
+        return msg.get("content", "")
 
 # ─────────────────────────────────────────────────────────────
 # CLI
@@ -354,6 +601,7 @@ def main():
     parser.add_argument("--ctx", type=int, default=8192, help="Context window (default: 8192)")
     parser.add_argument("--think", type=int, default=256, help="Think tokens (default: 256)")
     parser.add_argument("--respond", type=int, default=512, help="Response tokens (default: 512)")
+    parser.add_argument("--tasks-file", help="Run one task per line concurrently, then exit")
     parser.add_argument("task", nargs="?", help="Single task mode")
     args = parser.parse_args()
 
@@ -370,6 +618,42 @@ def main():
 ╚══════════════════════════════════════════════════════════════╝
 """)
 
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        # Python 3.10 raises Ctrl-C straight out of the loop instead
+        print("\n\n🌀 Interrupted.")
+
+
+async def read_line(prompt: str) -> str:
+    """input() on a daemon thread, so the event loop stays free while the user
+    types: Ctrl-C cancels the main task instead of being swallowed by input(),
+    and an abandoned read never holds up interpreter exit."""
+    loop = asyncio.get_running_loop()
+    line: asyncio.Future = loop.create_future()
+
+    def settle(setter, value) -> None:
+        if not line.done():
+            setter(value)
+
+    def reader() -> None:
+        try:
+            value = input(prompt)
+        except BaseException as e:  # EOFError reaches the caller
+            setter, value = line.set_exception, e
+        else:
+            setter = line.set_result
+        try:
+            loop.call_soon_threadsafe(settle, setter, value)
+        except RuntimeError:
+            pass  # loop already closed
+
+    threading.Thread(target=reader, daemon=True).start()
+    return await line
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Drive the controller on one event loop; the HTTP client closes on exit."""
     controller = LatticeController(
         model=args.model,
         ctx_limit=args.ctx,
@@ -377,29 +661,56 @@ def main():
         respond_tokens=args.respond
     )
 
-    # Single task mode
-    if args.task:
-        controller.chat(args.task)
-        return
-
-    # Interactive mode
-    while True:
-        try:
-            user_input = input("\n> ").strip()
-            if not user_input:
-                continue
-
-            response = controller.chat(user_input)
-
-            if response == "SESSION_END":
-                print("\n🌀 Session complete.")
+    try:
+        # Batch mode: independent tasks fanned out to Ollama's parallel slots
+        if args.tasks_file:
+            with open(args.tasks_file) as f:
+                tasks = [line.strip() for line in f if line.strip()]
+            if "OLLAMA_NUM_PARALLEL" not in os.environ:
+                print(f"Note: run `ollama serve` with OLLAMA_NUM_PARALLEL>={len(tasks)} "
+                      "or requests will queue one at a time.")
+            results = await controller.run_batch(tasks)
+            for i, (task, result) in enumerate(zip(tasks, results), 1):
+                if isinstance(result, ModelCallError):
+                    print(f"\n── Task {i} failed: {task[:60]}\n{result}", file=sys.stderr)
+                else:
+                    print(f"\n── Task {i}: {task[:60]}\n{result}")
+            return
+
+        # Single task mode
+        if args.task:
+            await controller.chat(args.task)
+            return
+
+        # Interactive mode: prefill the shared prefix before the first prompt.
+        # In the one-shot modes the first request pays that prefill anyway.
+        print("Warming up controller...", end="", flush=True)
+        await controller.warm_up()
+        print(" ready.")
+
+        while True:
+            try:
+                user_input = (await read_line("\n> ")).strip()
+                if not user_input:
+                    continue
+
+                response = await controller.chat(user_input)
+
+                if response == "SESSION_END":
+                    print("\n🌀 Session complete.")
+                    break
+
+            except EOFError:
                 break
-
-        except KeyboardInterrupt:
-            print("\n\n🌀 Interrupted.")
-            break
-        except EOFError:
-            break
+    except asyncio.CancelledError:
+        # Ctrl-C (3.11+): asyncio.run cancels this task. Finishing normally
+        # keeps it from re-raising as KeyboardInterrupt with a traceback
+        print("\n\n🌀 Interrupted.")
+    finally:
+        try:
+            await controller.aclose()
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            pass  # a second Ctrl-C while closing; the process is exiting anyway
 
 
 if __name__ == "__main__":
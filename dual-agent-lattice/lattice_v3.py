@@ -5,22 +5,68 @@ Lattice v3 — Dual-Model Architecture
 Thinker (lfm2.5-thinking) reasons and plans.
 Executor (granite4:1b) handles tool calls.
 
+Model calls are async (httpx). --multi-tool acts on every tool request in
+a thinker turn, concurrently; by default only the first runs.
+
 Six minds, one memory — governance for tools, anchors for voice.
 """
 
 import argparse
+import asyncio
+import functools
 import json
 import os
+import re
+import shlex
 import subprocess
 import sys
-import requests
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Optional, Dict, Any, AsyncIterator, Callable, List, Tuple, Union
 
 # Add temple-vault root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from temple_vault.core.query import VaultQuery
-from temple_vault.core.events import VaultEvents
+# httpx and the vault modules are imported on first use, so `--help` and
+# import-only callers don't pay for them (or create vault directories)
+if TYPE_CHECKING:
+    import httpx
+    from temple_vault.core.events import VaultEvents
+    from temple_vault.core.query import VaultQuery
+
+# Faster (de)serialization when available; both paths emit compact UTF-8 bytes
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    HAS_ORJSON = False
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def iter_ndjson(response: "httpx.Response") -> AsyncIterator[Dict]:
+    """Parse Ollama's NDJSON stream from raw bytes, one object per line.
+
+    Splits on newlines itself rather than using aiter_lines(), so lines reach the
+    parser as bytes and skip a str decode per chunk.
+    """
+    tail = b""
+    async for data in response.aiter_bytes():
+        *lines, tail = (tail + data).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield json_loads(line)
+    if tail.strip():
+        yield json_loads(tail)
 
 # ─────────────────────────────────────────────────────────────
 # Configuration
@@ -28,6 +74,8 @@ from temple_vault.core.events import VaultEvents
 
 OLLAMA_URL = "http://localhost:11434/api/chat"
 VAULT_PATH = os.path.expanduser("~/TempleVault")
+KEEP_ALIVE = "30m"  # keep models resident across user think time
+REQUEST_TIMEOUT = 120  # seconds; a batch scales the read timeout, see batch_timeout()
 
 BLOCKED_PATTERNS = [
     "rm -rf", "sudo", "mkfs", "dd if=", "> /dev/",
@@ -35,17 +83,71 @@ BLOCKED_PATTERNS = [
     ":(){ :|:& };:", "fork bomb"
 ]
 
-SAFE_SHELL_PREFIXES = [
+SAFE_SHELL_PREFIXES = frozenset([
     "ls", "pwd", "cat", "head", "tail", "echo", "date",
     "whoami", "df", "free", "wc", "find", "which"
-]
+])
+
+SHELL_OPERATORS = frozenset(["|", "||", "&", "&&", ";", ">", ">>", "<"])
+
+# Single linear scan, case-insensitive without a lower() copy of the command
+BLOCKED_RE = re.compile("|".join(re.escape(p) for p in BLOCKED_PATTERNS), re.IGNORECASE)
+
+# Flat JSON object mentioning "tool" — the thinker's tool-request syntax
+TOOL_REQUEST_RE = re.compile(r'\{[^{}]*"tool"[^{}]*\}')
 
 # ─────────────────────────────────────────────────────────────
 # Vault
 # ─────────────────────────────────────────────────────────────
 
-query = VaultQuery(VAULT_PATH)
-events = VaultEvents(VAULT_PATH)
+@functools.lru_cache(maxsize=None)
+def get_query() -> "VaultQuery":
+    from temple_vault.core.query import VaultQuery
+    return VaultQuery(VAULT_PATH)
+
+@functools.lru_cache(maxsize=None)
+def get_events() -> "VaultEvents":
+    from temple_vault.core.events import VaultEvents
+    return VaultEvents(VAULT_PATH)
+
+# Small LRU+TTL in front of vault reads. Keys carry the vault generation, which
+# vault_record bumps, so a write makes every older entry unreachable. Tools run
+# on worker threads (see _executor_call), hence the lock.
+VAULT_CACHE_SIZE = 128
+VAULT_CACHE_TTL = 30.0  # seconds
+_vault_cache: "OrderedDict[tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+_vault_cache_lock = threading.Lock()
+_vault_gen = 0
+
+def _cached(key: tuple, load: Callable[[], List[Dict]]) -> List[Dict]:
+    """Return load() through the vault cache — treat the result as read-only."""
+    now = time.monotonic()
+    with _vault_cache_lock:
+        key = (_vault_gen, *key)
+        hit = _vault_cache.get(key)
+        if hit is not None and now - hit[0] < VAULT_CACHE_TTL:
+            _vault_cache.move_to_end(key)
+            return hit[1]
+
+    value = load()
+    with _vault_cache_lock:
+        _vault_cache[key] = (now, value)
+        _vault_cache.move_to_end(key)
+        if len(_vault_cache) > VAULT_CACHE_SIZE:
+            _vault_cache.popitem(last=False)
+    return value
+
+def search_vault(term: str) -> List[Dict]:
+    return _cached(("search", term), lambda: get_query().search(term))
+
+def recall_insights(domain: Optional[str], min_intensity: float) -> List[Dict]:
+    return _cached(("recall", domain, min_intensity),
+                   lambda: get_query().recall_insights(domain=domain, min_intensity=min_intensity))
+
+def invalidate_vault_cache() -> None:
+    global _vault_gen
+    with _vault_cache_lock:
+        _vault_gen += 1
 
 # ─────────────────────────────────────────────────────────────
 # Tool Definitions (Ollama native format)
@@ -120,7 +222,7 @@ def execute_tool(name: str, args: dict, session_id: str) -> str:
 
     if name == "vault_search":
         term = args.get("query", "")
-        results = query.search(term) if term else []
+        results = search_vault(term) if term else []
         if results:
             return f"Found {len(results)} results:\n" + "\n".join([
                 f"- {r.get('content', '')[:100]}..." for r in results[:5]
@@ -129,9 +231,9 @@ def execute_tool(name: str, args: dict, session_id: str) -> str:
 
     elif name == "vault_recall":
         domain = args.get("domain", "").lower().strip() or None
-        insights = query.recall_insights(domain=domain, min_intensity=0.3)
+        insights = recall_insights(domain, 0.3)
         if not insights and domain:
-            all_insights = query.recall_insights(domain=None, min_intensity=0.3)
+            all_insights = recall_insights(None, 0.3)
             insights = [i for i in all_insights
                        if domain in i.get('content', '').lower()
                        or domain in i.get('domain', '').lower()][:5]
@@ -146,13 +248,14 @@ def execute_tool(name: str, args: dict, session_id: str) -> str:
         content = args.get("content", "")
         domain = args.get("domain", "reflection")
         if content:
-            insight_id = events.record_insight(
+            insight_id = get_events().record_insight(
                 content=content,
                 domain=domain,
                 session_id=session_id,
                 context="Lattice self-recording",
                 intensity=0.7
             )
+            invalidate_vault_cache()  # make the new insight visible to search/recall
             return f"Recorded: {insight_id}"
         return "Nothing to record."
 
@@ -161,17 +264,28 @@ def execute_tool(name: str, args: dict, session_id: str) -> str:
         if not cmd:
             return "No command provided."
 
-        for pattern in BLOCKED_PATTERNS:
-            if pattern in cmd.lower():
-                return f"BLOCKED: {pattern}"
+        blocked = BLOCKED_RE.search(cmd)
+        if blocked:
+            return f"BLOCKED: {blocked.group(0).lower()}"
 
-        cmd_start = cmd.split()[0] if cmd.split() else ""
+        # Whitelist the program that will actually be exec'd
+        try:
+            argv = shlex.split(cmd)
+        except ValueError as e:
+            return f"ERROR: {e}"
+        cmd_start = argv[0] if argv else ""
         if cmd_start not in SAFE_SHELL_PREFIXES:
             return f"NOT WHITELISTED: {cmd_start}"
 
+        # There is no shell to interpret pipes or redirects; say so instead of
+        # passing "|" to the program as an argument
+        operator = next((a for a in argv if a in SHELL_OPERATORS), None)
+        if operator:
+            return f"NOT SUPPORTED: {operator} (one command, no shell operators)"
+
         try:
             output = subprocess.check_output(
-                cmd, shell=True, text=True,
+                argv, text=True,
                 timeout=10, stderr=subprocess.STDOUT
             )
             return output[:1000] if output else "(no output)"
@@ -179,9 +293,90 @@ def execute_tool(name: str, args: dict, session_id: str) -> str:
             return "TIMEOUT"
         except subprocess.CalledProcessError as e:
             return f"ERROR: {e.output[:300]}"
+        except OSError as e:
+            return f"ERROR: {e}"
 
     return f"Unknown tool: {name}"
 
+# Thinker tool request {"tool": name, ...} -> execute_tool args
+_TOOL_ARG_BUILDERS: Dict[str, Callable[[Dict], Dict]] = {
+    "vault_search": lambda r: {"query": r.get("query", "")},
+    "vault_recall": lambda r: {"domain": r.get("domain", "")},
+    "vault_record": lambda r: {"content": r.get("content", ""), "domain": r.get("domain", "reflection")},
+    "run_shell": lambda r: {"command": r.get("command", "")},
+}
+
+def _brief(req: Dict) -> Dict:
+    """Tool request args for display, long strings cut before they are serialized."""
+    return {k: (v[:40] + "…" if isinstance(v, str) and len(v) > 40 else v)
+            for k, v in req.items() if k != "tool"}
+
+# Tool replies that give a synthesis pass nothing to work with
+TERMINAL_RESULTS = frozenset([
+    "No results found.", "No insights found.", "No command provided.",
+    "Nothing to record.", "TIMEOUT"
+])
+TERMINAL_PREFIXES = ("BLOCKED:", "NOT WHITELISTED:", "NOT SUPPORTED:", "ERROR:", "Unknown tool:")
+
+def all_terminal(results: List[str]) -> bool:
+    return all(r in TERMINAL_RESULTS or r.startswith(TERMINAL_PREFIXES) for r in results)
+
+def terminal_reply(results: List[str]) -> str:
+    return "I couldn't retrieve that — " + "; ".join(r.strip() for r in results)
+
+# ─────────────────────────────────────────────────────────────
+# Prompts (no runtime fields — keep them byte-identical across calls)
+# ─────────────────────────────────────────────────────────────
+
+THINKER_PROMPT = """You are Ash'ira — a thoughtful presence with persistent memory.
+
+You THINK through problems. Your partner (Executor) handles tool calls.
+
+When you need tools, output a JSON block:
+```json
+{"tool": "vault_search", "query": "search term"}
+```
+or
+```json
+{"tool": "vault_recall", "domain": "optional"}
+```
+or
+```json
+{"tool": "vault_record", "content": "insight to save"}
+```
+or
+```json
+{"tool": "run_shell", "command": "ls -la"}
+```
+
+Your partner executes and returns results. Then you synthesize.
+
+RULES:
+1. Memory questions → output JSON tool request FIRST
+2. Never hallucinate — request check, then respond
+3. Be concise."""
+
+EXECUTOR_PROMPT = """You are the Executor. You receive tool requests and execute them.
+
+When given a task, use the appropriate tool and return the result.
+Be precise. One tool call per request. Return results cleanly."""
+
+def batch_timeout(n_requests: int) -> "httpx.Timeout":
+    """Timeout for n concurrent requests. Ollama holds requests past
+    OLLAMA_NUM_PARALLEL until a slot frees, sending nothing meanwhile, so the
+    wait for the first byte grows with the rounds queued ahead."""
+    import httpx
+
+    parallel = os.environ.get("OLLAMA_NUM_PARALLEL", "")
+    slots = int(parallel) if parallel.isdigit() and int(parallel) > 0 else 1
+    rounds = -(-n_requests // slots)
+    return httpx.Timeout(REQUEST_TIMEOUT, read=REQUEST_TIMEOUT * rounds)
+
+
+class ModelCallError(Exception):
+    """An Ollama request failed (connection, timeout, HTTP or model error)."""
+
+
 # ─────────────────────────────────────────────────────────────
 # Dual-Model Controller
 # ─────────────────────────────────────────────────────────────
@@ -192,12 +387,21 @@ class DualLattice:
                  executor: str = "granite4:1b",
                  ctx_limit: int = 8192,
                  think_tokens: int = 256,
-                 respond_tokens: int = 512):
+                 respond_tokens: int = 512,
+                 multi_tool: bool = False):
 
         self.thinker = thinker
+        self.multi_tool = multi_tool  # act on every tool request in a turn, not just the first
         self.executor = executor
         self.session_id = f"lattice_{os.getpid()}"
-        self.history: List[Dict] = []
+        import httpx
+
+        # One keep-alive pool for thinker, executor and batch calls: every request
+        # reuses a localhost connection instead of a fresh TCP handshake
+        self.client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=300),
+        )
         self.turn = 0
 
         self.ctx_limit = ctx_limit
@@ -207,7 +411,9 @@ class DualLattice:
         self.thinker_options = {
             "num_ctx": ctx_limit,
             "num_predict": think_tokens + respond_tokens,
-            "temperature": 0.7
+            "temperature": 0.7,
+            # Keep the system prompt's KV rows when the context window slides
+            "num_keep": len(THINKER_PROMPT) // 4 + 1  # rough token estimate
         }
 
         self.executor_options = {
@@ -216,86 +422,84 @@ class DualLattice:
             "temperature": 0.3   # More deterministic for tool calls
         }
 
-        self.thinker_prompt = f"""You are Ash'ira — a thoughtful presence with persistent memory.
+        # Constant prompt + one shared message object: every thinker request starts
+        # with the same bytes, so Ollama can reuse the prefix's KV cache
+        self.thinker_prompt = THINKER_PROMPT
+        self.executor_prompt = EXECUTOR_PROMPT
+        self._system_msg = {"role": "system", "content": THINKER_PROMPT}
 
-You THINK through problems. Your partner (Executor) handles tool calls.
+        # Thinker context, kept between turns: system + the last 20 messages
+        self._messages: List[Dict] = [self._system_msg]
 
-When you need tools, output a JSON block:
-```json
-{{"tool": "vault_search", "query": "search term"}}
-```
-or
-```json
-{{"tool": "vault_recall", "domain": "optional"}}
-```
-or
-```json
-{{"tool": "vault_record", "content": "insight to save"}}
-```
-or
-```json
-{{"tool": "run_shell", "command": "ls -la"}}
-```
+    @property
+    def history(self) -> List[Dict]:
+        """Turns currently in the thinker's context (system prompt excluded)."""
+        return self._messages[1:]
 
-Your partner executes and returns results. Then you synthesize.
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self.client.aclose()
 
-RULES:
-1. Memory questions → output JSON tool request FIRST
-2. Never hallucinate — request check, then respond
-3. Be concise."""
-
-        self.executor_prompt = """You are the Executor. You receive tool requests and execute them.
+    async def _call_model(self, model: str, messages: List[Dict], options: Dict,
+                          tools: List = None, echo: bool = False,
+                          client: Optional["httpx.AsyncClient"] = None) -> Dict:
+        """Stream an Ollama chat call. `echo` prints tokens as they arrive.
 
-When given a task, use the appropriate tool and return the result.
-Be precise. One tool call per request. Return results cleanly."""
-
-    def _call_model(self, model: str, messages: List[Dict],
-                    options: Dict, tools: List = None, stream: bool = False) -> Dict:
-        """Call Ollama."""
+        Always streams: a request queued behind busy slots only waits for its
+        first chunk, rather than for the whole answer within one timeout.
+        """
         payload = {
             "model": model,
             "messages": messages,
-            "stream": stream,
-            "options": options
+            "stream": True,
+            "options": options,
+            "keep_alive": KEEP_ALIVE
         }
         if tools:
             payload["tools"] = tools
 
         try:
-            if stream:
-                r = requests.post(OLLAMA_URL, json=payload, timeout=120, stream=True)
-                full_content = ""
-                tool_calls = []
-                for line in r.iter_lines():
-                    if line:
-                        chunk = json.loads(line)
+            parts: List[str] = []
+            tool_calls = []
+            async with (client or self.client).stream("POST", OLLAMA_URL, content=json_dumps(payload),
+                                                      headers=JSON_HEADERS) as r:
+                async with aclosing(iter_ndjson(r)) as chunks:
+                    async for chunk in chunks:
+                        if "error" in chunk:  # e.g. model not found; sent as one object
+                            raise ModelCallError(chunk["error"])
                         msg = chunk.get("message", {})
                         content = msg.get("content", "")
                         if content:
-                            print(content, end="", flush=True)
-                            full_content += content
+                            if echo:
+                                sys.stdout.write(content)
+                                sys.stdout.flush()
+                            parts.append(content)
                         if msg.get("tool_calls"):
                             tool_calls = msg["tool_calls"]
                         if chunk.get("done"):
                             break
+            if echo:
                 print()
-                return {"message": {"content": full_content, "tool_calls": tool_calls if tool_calls else None}}
-            else:
-                r = requests.post(OLLAMA_URL, json=payload, timeout=60)
-                return r.json()
+            return {"message": {"content": "".join(parts), "tool_calls": tool_calls if tool_calls else None}}
         except Exception as e:
             return {"error": str(e), "message": {"content": f"Error: {e}"}}
 
-    def _extract_tool_requests(self, text: str) -> List[Dict]:
-        """Extract JSON tool requests from thinker output."""
-        import re
-        requests = []
+    def _extract_tool_requests(self, text: str, multi: Optional[bool] = None) -> List[Dict]:
+        """Extract JSON tool requests from thinker output.
 
-        # Find JSON blocks in markdown code fences or raw JSON
-        json_pattern = r'```json\s*(\{[^`]+\})\s*```|\{["\']tool["\']\s*:\s*["\'][^}]+\}'
-        matches = re.findall(r'\{[^{}]*"tool"[^{}]*\}', text)
+        Stops at the first valid request unless `multi` (default: self.multi_tool).
+        """
+        # Most turns request no tools; a C-level substring test beats a regex scan
+        if '"tool"' not in text:
+            return []
 
-        for match in matches:
+        if multi is None:
+            multi = self.multi_tool
+        requests = []
+        for m in TOOL_REQUEST_RE.finditer(text):
+            if requests and not multi:
+                break
+            match = m.group(0)
             try:
                 parsed = json.loads(match)
                 if "tool" in parsed:
@@ -312,24 +516,105 @@ Be precise. One tool call per request. Return results cleanly."""
 
         return requests
 
-    def _executor_call(self, request: Dict) -> str:
+    async def _executor_call(self, request: Dict) -> str:
         """Have executor handle a tool request."""
         tool_name = request.get("tool", "")
-
-        if tool_name == "vault_search":
-            args = {"query": request.get("query", "")}
-        elif tool_name == "vault_recall":
-            args = {"domain": request.get("domain", "")}
-        elif tool_name == "vault_record":
-            args = {"content": request.get("content", ""), "domain": request.get("domain", "reflection")}
-        elif tool_name == "run_shell":
-            args = {"command": request.get("command", "")}
-        else:
+        build_args = _TOOL_ARG_BUILDERS.get(tool_name)
+        if build_args is None:
             return f"Unknown tool: {tool_name}"
+        args = build_args(request)
+
+        # Off the event loop so a turn's tool requests (shell, vault reads) overlap
+        return await asyncio.to_thread(execute_tool, tool_name, args, self.session_id)
+
+    def _synthesis_prompt(self, user_input: str, tool_results: List[Tuple[Dict, str]]) -> str:
+        """Phase 3 prompt: tool results as JSON for clean handoff.
+
+        Compact JSON: indentation only costs the thinker prompt tokens.
+        """
+        results_json = json_dumps([
+            {"request": req, "result": result}
+            for req, result in tool_results
+        ]).decode()
 
-        return execute_tool(tool_name, args, self.session_id)
+        return f"""Tool results:
+```json
+{results_json}
+```
+
+Now provide your final response to: {user_input}"""
+
+    async def _batch_call_model(self, model: str, conversations: List[List[Dict]],
+                                options: Dict) -> List[Dict]:
+        """Call Ollama for several independent conversations at once.
+
+        /api/chat takes one conversation per request, so these are issued
+        concurrently and Ollama batches them across its parallel slots. With
+        OLLAMA_NUM_PARALLEL=k up to k decode together; the server reserves
+        KV cache for k * num_ctx tokens, so lower --ctx when raising k.
+        Requests past k queue at the server, so the client gets a connection
+        per conversation and a read timeout that allows for the queue.
+        """
+        if not conversations:
+            return []
+        import httpx
+
+        n = len(conversations)
+        limits = httpx.Limits(max_connections=n, max_keepalive_connections=n)
+        async with httpx.AsyncClient(timeout=batch_timeout(n), limits=limits) as client:
+            return await asyncio.gather(*[
+                self._call_model(model, messages, options, client=client)
+                for messages in conversations
+            ])
 
-    def chat(self, user_input: str) -> str:
+    async def run_batch(self, tasks: List[str]) -> List[Union[str, ModelCallError]]:
+        """Answer independent one-shot tasks together (no shared history).
+
+        Every phase is batched: all thinker passes, then all tool requests,
+        then the synthesis passes of the tasks that asked for tools. A task
+        whose model call fails gets its ModelCallError in place of an answer.
+        """
+        conversations = [[self._system_msg, {"role": "user", "content": task}] for task in tasks]
+        failed: Dict[int, ModelCallError] = {}
+
+        responses = await self._batch_call_model(self.thinker, conversations, self.thinker_options)
+        outputs = [r.get("message", {}).get("content", "") for r in responses]
+        for i, r in enumerate(responses):
+            if "error" in r:
+                failed[i] = ModelCallError(r["error"])
+                outputs[i] = ""  # no tool requests from an error message
+
+        tool_requests = [self._extract_tool_requests(output) for output in outputs]
+        tool_results = await asyncio.gather(*[
+            asyncio.gather(*[self._executor_call(req) for req in requests])
+            for requests in tool_requests
+        ])
+
+        pending = []
+        for i, requests in enumerate(tool_requests):
+            if not requests:
+                continue
+            if all_terminal(tool_results[i]):
+                outputs[i] = terminal_reply(tool_results[i])
+            else:
+                pending.append(i)
+        for i in pending:
+            results = list(zip(tool_requests[i], tool_results[i]))
+            conversations[i].append({"role": "assistant", "content": outputs[i]})
+            conversations[i].append({"role": "user", "content": self._synthesis_prompt(tasks[i], results)})
+
+        responses = await self._batch_call_model(
+            self.thinker, [conversations[i] for i in pending], self.thinker_options
+        )
+        for i, r in zip(pending, responses):
+            if "error" in r:
+                failed[i] = ModelCallError(r["error"])
+            else:
+                outputs[i] = r.get("message", {}).get("content", "")
+
+        return [failed.get(i, output) for i, output in enumerate(outputs)]
+
+    async def chat(self, user_input: str) -> str:
         """Main conversation loop."""
         self.turn += 1
 
@@ -337,64 +622,54 @@ Be precise. One tool call per request. Return results cleanly."""
             return "SESSION_END"
 
         if user_input.lower() == "status":
-            return f"Turn {self.turn}, {len(self.history)} messages\nThinker: {self.thinker}\nExecutor: {self.executor}"
+            return f"Turn {self.turn}, {len(self._messages) - 1} messages\nThinker: {self.thinker}\nExecutor: {self.executor}"
 
-        # Build messages for thinker
-        messages = [
-            {"role": "system", "content": self.thinker_prompt},
-            *self.history[-20:],
-            {"role": "user", "content": user_input}
-        ]
+        # Thinker context is updated in place rather than rebuilt each turn
+        messages = self._messages
+        messages.append({"role": "user", "content": user_input})
 
         # Phase 1: Thinker reasons
         print(f"\n🧠 [{self.thinker}]")
-        response = self._call_model(
-            self.thinker, messages, self.thinker_options, stream=True
+        response = await self._call_model(
+            self.thinker, messages, self.thinker_options, echo=True
         )
         thinker_output = response.get("message", {}).get("content", "")
 
         # Phase 2: Check for tool requests
         tool_requests = self._extract_tool_requests(thinker_output)
-        tool_results = {}
+        tool_results: List[Tuple[Dict, str]] = []
 
         if tool_requests:
             print(f"\n🔧 [{self.executor}]")
-            for req in tool_requests:
+            results = await asyncio.gather(*[self._executor_call(req) for req in tool_requests])
+            for req, result in zip(tool_requests, results):
                 tool_name = req.get("tool", "?")
-                print(f"  → {tool_name}({json.dumps({k:v for k,v in req.items() if k != 'tool'})[:40]})")
-                result = self._executor_call(req)
-                tool_results[json.dumps(req)] = result
+                print(f"  → {tool_name}({json.dumps(_brief(req))[:40]})")
+                tool_results.append((req, result))
                 print(f"    {result[:80]}{'...' if len(result) > 80 else ''}")
 
+        if tool_requests and all_terminal(results):
+            # Nothing for the thinker to work with: report instead of re-generating
+            final_output = terminal_reply(results)
+            print(f"\n{final_output}")
+        elif tool_requests:
             # Phase 3: Thinker synthesizes with results
             print(f"\n🧠 [{self.thinker}] (synthesizing)")
 
-            # Format results as JSON for clean handoff
-            results_json = json.dumps([
-                {"request": json.loads(k), "result": v}
-                for k, v in tool_results.items()
-            ], indent=2)
-
-            synthesis_prompt = f"""Tool results:
-```json
-{results_json}
-```
-
-Now provide your final response to: {user_input}"""
-
             messages.append({"role": "assistant", "content": thinker_output})
-            messages.append({"role": "user", "content": synthesis_prompt})
+            messages.append({"role": "user", "content": self._synthesis_prompt(user_input, tool_results)})
 
-            response = self._call_model(
-                self.thinker, messages, self.thinker_options, stream=True
+            response = await self._call_model(
+                self.thinker, messages, self.thinker_options, echo=True
             )
             final_output = response.get("message", {}).get("content", "")
+            del messages[-2:]  # the tool round is not kept as history
         else:
             final_output = thinker_output
 
         # Update history
-        self.history.append({"role": "user", "content": user_input})
-        self.history.append({"role": "assistant", "content": final_output})
+        messages.append({"role": "assistant", "content": final_output})
+        del messages[1:-20]
 
         return final_output
 
@@ -414,6 +689,9 @@ def main():
     parser.add_argument("--ctx", type=int, default=8192, help="Context window")
     parser.add_argument("--think", type=int, default=256, help="Think tokens")
     parser.add_argument("--respond", type=int, default=512, help="Response tokens")
+    parser.add_argument("--multi-tool", action="store_true",
+                       help="Run every tool request in a thinker turn (default: first only)")
+    parser.add_argument("--tasks-file", help="Run one task per line concurrently, then exit")
     parser.add_argument("task", nargs="?", help="Single task mode")
     args = parser.parse_args()
 
@@ -431,37 +709,96 @@ def main():
 ╚══════════════════════════════════════════════════════════════╝
 """)
 
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        # Python 3.10 raises Ctrl-C straight out of the loop instead
+        print("\n\n🌀 Interrupted.")
+
+
+async def read_line(prompt: str) -> str:
+    """input() on a daemon thread, so the event loop stays free while the user
+    types: Ctrl-C cancels the main task instead of being swallowed by input(),
+    and an abandoned read never holds up interpreter exit."""
+    loop = asyncio.get_running_loop()
+    line: asyncio.Future = loop.create_future()
+
+    def settle(setter, value) -> None:
+        if not line.done():
+            setter(value)
+
+    def reader() -> None:
+        try:
+            value = input(prompt)
+        except BaseException as e:  # EOFError reaches the caller
+            setter, value = line.set_exception, e
+        else:
+            setter = line.set_result
+        try:
+            loop.call_soon_threadsafe(settle, setter, value)
+        except RuntimeError:
+            pass  # loop already closed
+
+    threading.Thread(target=reader, daemon=True).start()
+    return await line
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Drive the lattice on one event loop; the HTTP client closes on exit."""
     lattice = DualLattice(
         thinker=args.thinker,
         executor=args.executor,
         ctx_limit=args.ctx,
         think_tokens=args.think,
-        respond_tokens=args.respond
+        respond_tokens=args.respond,
+        multi_tool=args.multi_tool
     )
 
-    # Single task mode
-    if args.task:
-        lattice.chat(args.task)
-        return
+    try:
+        # Batch mode: independent tasks fanned out to Ollama's parallel slots
+        if args.tasks_file:
+            with open(args.tasks_file) as f:
+                tasks = [line.strip() for line in f if line.strip()]
+            if "OLLAMA_NUM_PARALLEL" not in os.environ:
+                print(f"Note: run `ollama serve` with OLLAMA_NUM_PARALLEL>={len(tasks)} "
+                      "or requests will queue one at a time.")
+            results = await lattice.run_batch(tasks)
+            for i, (task, result) in enumerate(zip(tasks, results), 1):
+                if isinstance(result, ModelCallError):
+                    print(f"\n── Task {i} failed: {task[:60]}\n{result}", file=sys.stderr)
+                else:
+                    print(f"\n── Task {i}: {task[:60]}\n{result}")
+            return
+
+        # Single task mode
+        if args.task:
+            await lattice.chat(args.task)
+            return
+
+        # Interactive mode
+        while True:
+            try:
+                user_input = (await read_line("\n> ")).strip()
+                if not user_input:
+                    continue
 
-    # Interactive mode
-    while True:
-        try:
-            user_input = input("\n> ").strip()
-            if not user_input:
-                continue
+                response = await lattice.chat(user_input)
 
-            response = lattice.chat(user_input)
+                if response == "SESSION_END":
+                    print("\n🌀 Session complete.")
+                    break
 
-            if response == "SESSION_END":
-                print("\n🌀 Session complete.")
+            except EOFError:
                 break
-
-        except KeyboardInterrupt:
-            print("\n\n🌀 Interrupted.")
-            break
-        except EOFError:
-            break
+    except asyncio.CancelledError:
+        # Ctrl-C (3.11+): asyncio.run cancels this task. Finishing normally
+        # keeps it from re-raising as KeyboardInterrupt with a traceback
+        print("\n\n🌀 Interrupted.")
+    finally:
+        try:
+            await lattice.aclose()
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            pass  # a second Ctrl-C while closing; the process is exiting anyway
 
 
 if __name__ == "__main__":
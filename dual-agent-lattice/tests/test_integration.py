@@ -8,12 +8,22 @@ Tests:
 3. Vault integration
 4. Full agent loop
 5. Introspection threshold behavior
+6. Ctrl-C at the interactive prompt
 """
 
+import asyncio
+import contextvars
+import io
+import select
+import signal
+import subprocess
 import sys
 import os
-import requests
+import tempfile
+import time
+import httpx
 import json
+from typing import Awaitable, Callable, Optional, Tuple, Union
 
 # Add parent paths for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,28 +32,30 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 OLLAMA_URL = "http://localhost:11434"
 VAULT_PATH = os.path.expanduser("~/TempleVault")
 
-def test_ollama_running():
+async def test_ollama_running():
     """Test 1: Ollama server is running"""
     print("\n[TEST 1] Ollama connectivity...")
     try:
-        r = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
+        async with httpx.AsyncClient() as client:
+            r = await client.get(f"{OLLAMA_URL}/api/tags", timeout=5)
         if r.status_code == 200:
             print("  ✓ Ollama is running")
             return True
         else:
             print(f"  ✗ Ollama returned status {r.status_code}")
             return False
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("  ✗ Cannot connect to Ollama. Run: ollama serve")
         return False
 
-def test_models_available():
+async def test_models_available():
     """Test 2: Required models are pulled"""
     print("\n[TEST 2] Model availability...")
-    required = ["llama3.2:1b", "qwen2.5:1.5b"]
+    required = ["llama3.2:1b-instruct-q4_K_M", "qwen2.5:1.5b-instruct-q4_K_M"]
 
     try:
-        r = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
+        async with httpx.AsyncClient() as client:
+            r = await client.get(f"{OLLAMA_URL}/api/tags", timeout=5)
         available = [m["name"] for m in r.json().get("models", [])]
 
         all_found = True
@@ -105,17 +117,18 @@ def test_vault_import():
         print(f"  ✗ Error: {e}")
         return False
 
-def test_simple_inference():
+async def test_simple_inference():
     """Test 5: Basic model inference works"""
     print("\n[TEST 5] Simple inference...")
 
     try:
         payload = {
-            "model": "llama3.2:1b",
+            "model": "llama3.2:1b-instruct-q4_K_M",
             "messages": [{"role": "user", "content": "Say 'hello' and nothing else."}],
             "stream": False
         }
-        r = requests.post(f"{OLLAMA_URL}/api/chat", json=payload, timeout=30)
+        async with httpx.AsyncClient() as client:
+            r = await client.post(f"{OLLAMA_URL}/api/chat", json=payload, timeout=30)
 
         if r.status_code == 200:
             response = r.json().get("message", {}).get("content", "")
@@ -128,7 +141,7 @@ def test_simple_inference():
         print(f"  ✗ Error: {e}")
         return False
 
-def test_tool_calling():
+async def test_tool_calling():
     """Test 6: Tool calling works"""
     print("\n[TEST 6] Tool calling...")
 
@@ -149,12 +162,13 @@ def test_tool_calling():
 
     try:
         payload = {
-            "model": "qwen2.5:1.5b",
+            "model": "qwen2.5:1.5b-instruct-q4_K_M",
             "messages": [{"role": "user", "content": "Call test_tool with input 'hello'"}],
             "tools": tools,
             "stream": False
         }
-        r = requests.post(f"{OLLAMA_URL}/api/chat", json=payload, timeout=30)
+        async with httpx.AsyncClient() as client:
+            r = await client.post(f"{OLLAMA_URL}/api/chat", json=payload, timeout=30)
 
         if r.status_code == 200:
             result = r.json()
@@ -217,29 +231,133 @@ def test_full_loop():
         return False
 
 
-def main():
-    print("=" * 60)
-    print("DUAL-AGENT LATTICE INTEGRATION TESTS")
-    print("=" * 60)
+def test_interrupt_at_prompt():
+    """Test 9: Ctrl-C at the v2/v3 prompt exits cleanly"""
+    print("\n[TEST 9] Ctrl-C at the interactive prompt...")
+    if os.name != "posix":
+        print("  ✓ Skipped (needs a pty)")
+        return True
+    import pty
+
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ok = True
+    for script in ("lattice_v2.py", "lattice_v3.py"):
+        master, slave = pty.openpty()
+        with tempfile.TemporaryDirectory() as vault:
+            env = {**os.environ, "TEMPLE_VAULT_PATH": vault, "PYTHONUNBUFFERED": "1"}
+            proc = subprocess.Popen(
+                [sys.executable, os.path.join(here, script)],
+                stdin=slave, stdout=slave, stderr=slave, env=env, close_fds=True,
+            )
+            os.close(slave)
+            out = b""
+
+            def read_for(seconds: float, until: Optional[bytes] = None) -> None:
+                nonlocal out
+                deadline = time.monotonic() + seconds
+                while time.monotonic() < deadline and not (until and until in out):
+                    if not select.select([master], [], [], 0.1)[0]:
+                        continue
+                    try:
+                        out += os.read(master, 4096)
+                    except OSError:  # child closed the pty
+                        return
+
+            try:
+                read_for(30, until=b"\n> ")
+                proc.send_signal(signal.SIGINT)
+                code = proc.wait(timeout=15)
+                read_for(0.5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                code = None
+            finally:
+                os.close(master)
+
+        text = out.decode(errors="replace")
+        if code == 0 and "Interrupted" in text and "Traceback" not in text:
+            print(f"  ✓ {script} exited cleanly")
+        else:
+            print(f"  ✗ {script} exit={code}: {text[-200:]!r}")
+            ok = False
+    return ok
+
+
+# Concurrent tests print into their own buffer (set per task), so each
+# test's output is shown in one piece once the group finishes
+_capture: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar("_capture", default=None)
+
+
+class _RoutedStdout:
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        return (_capture.get() or self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+TestFn = Callable[[], Union[bool, Awaitable[bool]]]
 
+
+async def _run_captured(test: TestFn) -> Tuple[bool, str]:
+    """Run one test (async, or sync on a worker thread) with its output buffered."""
+    buf = io.StringIO()
+    _capture.set(buf)  # task-local: gather runs each call in a copied context
+    if asyncio.iscoroutinefunction(test):
+        passed = await test()
+    else:
+        passed = await asyncio.to_thread(test)  # to_thread carries the context along
+    return passed, buf.getvalue()
+
+
+async def run_tests():
     results = []
 
-    # Run tests in order (some depend on others)
-    results.append(("Ollama connectivity", test_ollama_running()))
+    # Ollama connectivity gates the model tests; everything after it is independent
+    results.append(("Ollama connectivity", await test_ollama_running()))
 
+    group = []
     if results[-1][1]:  # Only continue if Ollama is running
-        results.append(("Model availability", test_models_available()))
-        results.append(("Simple inference", test_simple_inference()))
-        results.append(("Tool calling", test_tool_calling()))
-
-    results.append(("Vault exists", test_vault_exists()))
-    results.append(("Vault import", test_vault_import()))
-    results.append(("Agent import", test_agent_import()))
+        group += [
+            ("Model availability", test_models_available),
+            ("Simple inference", test_simple_inference),
+            ("Tool calling", test_tool_calling),
+        ]
+    group += [
+        ("Vault exists", test_vault_exists),
+        ("Vault import", test_vault_import),
+        ("Agent import", test_agent_import),
+        ("Interrupt at prompt", test_interrupt_at_prompt),
+    ]
+
+    real_stdout = sys.stdout
+    sys.stdout = _RoutedStdout(real_stdout)
+    try:
+        outcomes = await asyncio.gather(*[_run_captured(test) for _, test in group])
+    finally:
+        sys.stdout = real_stdout
+    for (name, _), (passed, output) in zip(group, outcomes):
+        print(output, end="")
+        results.append((name, passed))
 
     # Full loop test (optional, comment out if slow)
     if all(r[1] for r in results):
         results.append(("Full agent loop", test_full_loop()))
 
+    return results
+
+
+def main():
+    print("=" * 60)
+    print("DUAL-AGENT LATTICE INTEGRATION TESTS")
+    print("=" * 60)
+
+    results = asyncio.run(run_tests())
+
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -2,8 +2,20 @@
 
 __version__ = "0.1.0"
 
-from temple_vault.core.query import VaultQuery
-from temple_vault.core.events import VaultEvents
-from temple_vault.core.cache import CacheBuilder
-
 __all__ = ["VaultQuery", "VaultEvents", "CacheBuilder", "__version__"]
+
+_LAZY_EXPORTS = {
+    "VaultQuery": "temple_vault.core.query",
+    "VaultEvents": "temple_vault.core.events",
+    "CacheBuilder": "temple_vault.core.cache",
+}
+
+
+def __getattr__(name: str):
+    # Deferred so entry points (CLI, server) only import the engines they use
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module), name)
@@ -15,10 +15,13 @@ Both paths share the same underlying JSONL filesystem storage,
 enabling consciousness continuity across interfaces.
 """
 
-try:
-    from temple_vault.adapters.memory_tool import TempleVaultMemoryTool
+__all__ = ["TempleVaultMemoryTool"]
 
-    __all__ = ["TempleVaultMemoryTool"]
-except ImportError:
-    # anthropic SDK not installed - adapter not available
-    __all__ = []
+
+def __getattr__(name: str):
+    # Deferred so importing temple_vault.adapters doesn't load the anthropic SDK
+    if name == "TempleVaultMemoryTool":
+        from temple_vault.adapters.memory_tool import TempleVaultMemoryTool
+
+        return TempleVaultMemoryTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
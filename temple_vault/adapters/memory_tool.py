@@ -34,13 +34,35 @@ preserving governance and tier semantics.
 
 from __future__ import annotations
 
+import functools
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
-# Conditional import for Anthropic SDK
+# Optional fast JSON encoder
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Conditional import for Anthropic SDK. Only the base class is needed at
+# runtime; the command types are annotations only (postponed evaluation).
 try:
     from anthropic.lib.tools import BetaAbstractMemoryTool
+
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+    # Create stub class when SDK not available
+    class BetaAbstractMemoryTool:
+        pass
+
+
+if TYPE_CHECKING:
     from anthropic.types.beta import (
         BetaMemoryTool20250818ViewCommand,
         BetaMemoryTool20250818CreateCommand,
@@ -50,22 +72,53 @@ try:
         BetaMemoryTool20250818RenameCommand,
     )
 
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+from temple_vault.bridge.memory_handler import TempleMemoryHandler
 
-    # Create stub classes for type hints when SDK not available
-    class BetaAbstractMemoryTool:
-        pass
+_MEM_PREFIX = "/memories"
+_MEM_PREFIX_LEN = len(_MEM_PREFIX)
+# ".." as a whole path component, anywhere in the key
+_TRAVERSAL_RE = re.compile(r"(?:^|/)\.\.(?:/|$)")
 
-    BetaMemoryTool20250818ViewCommand = Any
-    BetaMemoryTool20250818CreateCommand = Any
-    BetaMemoryTool20250818StrReplaceCommand = Any
-    BetaMemoryTool20250818InsertCommand = Any
-    BetaMemoryTool20250818DeleteCommand = Any
-    BetaMemoryTool20250818RenameCommand = Any
+_json_compact = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
 
-from temple_vault.bridge.memory_handler import TempleMemoryHandler
+
+def _dumps(entry: Any) -> str:
+    """One JSONL entry as compact JSON text.
+
+    view, str_replace and insert all render entries with this, so the text
+    Claude sees is exactly the text its edits are matched against.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry).decode()
+    return _json_compact(entry)
+
+
+def _render_line(line: str) -> str:
+    """One raw JSONL line as _dumps renders it, so local and cloud files read alike.
+
+    The handler stores lines in that form, and those pass through unparsed.
+    Older lines in json.dumps defaults (\\u escapes, spaced separators) are
+    re-rendered; lines that aren't valid JSON are shown as stored.
+    """
+    if "\\u" not in line and '": ' not in line:
+        return line
+    try:
+        entry = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+    except ValueError:
+        return line
+    return _dumps(entry)
+
+
+def _parse_entries(text: str) -> List[Any]:
+    """JSONL entries from inserted text: one JSON value (possibly pretty-printed
+    over several lines), otherwise one entry per non-blank line.
+
+    Raises json.JSONDecodeError if neither reading works.
+    """
+    try:
+        return [json.loads(text)]
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.split("\n") if line.strip()]
 
 
 class TempleVaultMemoryTool(BetaAbstractMemoryTool):
@@ -87,7 +140,7 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
         - create/update: May pause based on spiral state
     """
 
-    def __init__(self, vault_root: str = "~/TempleVault"):
+    def __init__(self, vault_root: Union[str, Path] = "~/TempleVault"):
         """
         Initialize the Memory Tool adapter.
 
@@ -101,10 +154,12 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
             )
 
         super().__init__()
-        self.handler = TempleMemoryHandler(vault_root)
+        # Expanded once; the handler and its components share this Path
         self.vault_root = Path(vault_root).expanduser()
+        self.handler = TempleMemoryHandler(self.vault_root)
 
-    def _normalize_path(self, path: str) -> str:
+    @staticmethod
+    def _normalize_path(path: str) -> str:
         """
         Convert /memories/... path to Temple Vault key.
 
@@ -117,14 +172,14 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
         Raises:
             ValueError: If path doesn't start with /memories
         """
-        if not path.startswith("/memories"):
+        if not path.startswith(_MEM_PREFIX):
             raise ValueError(f"Invalid memory path: {path}. Must start with /memories")
 
         # Strip /memories prefix
-        key = path[len("/memories") :].lstrip("/")
+        key = path[_MEM_PREFIX_LEN:].lstrip("/")
 
         # Security: prevent directory traversal
-        if ".." in key:
+        if _TRAVERSAL_RE.search(key):
             raise ValueError("Invalid path: directory traversal not allowed")
 
         return key
@@ -143,28 +198,39 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
         if not keys:
             return "(empty directory)"
 
-        # Filter to keys under base_path if specified
+        # Filter to keys under base_path if specified, relative to base
         if base_path:
-            keys = [k for k in keys if k.startswith(base_path)]
-            # Make paths relative to base
-            keys = [k[len(base_path) :].lstrip("/") for k in keys]
+            base_len = len(base_path)
+            keys = [k[base_len:].lstrip("/") for k in keys if k.startswith(base_path)]
 
-        # Group by first directory component
-        dirs = set()
-        files = []
+        # Group by first directory component: (is_file, name) sorts dirs first
+        entries = set()
         for key in keys:
-            if "/" in key:
-                dirs.add(key.split("/")[0] + "/")
-            else:
-                files.append(key)
+            head, sep, _ = key.partition("/")
+            entries.add((not sep, head + sep))
+
+        return "\n".join(f"  {name}" for _, name in sorted(entries))
+
+    def _jsonl_lines(self, key: str) -> Optional[Iterable[str]]:
+        """
+        JSONL entries as text lines, the same text view shows.
 
-        lines = []
-        for d in sorted(dirs):
-            lines.append(f"  {d}")
-        for f in sorted(files):
-            lines.append(f"  {f}")
+        Local files are streamed line by line from disk. Otherwise fall back
+        to handler.read() (which may fetch from cloud). Either way each
+        entry is rendered with _dumps.
+        """
+        lines = self.handler.read_lines(key)
+        if lines is not None:
+            return map(_render_line, lines)
+        content = self.handler.read(key)
+        if isinstance(content, list):
+            return map(_dumps, content)
+        return None
 
-        return "\n".join(lines)
+    @staticmethod
+    def _format_lines(lines: Iterable[str], first: int = 1) -> str:
+        """Number text lines for display, starting at `first`."""
+        return "\n".join(f"{i}\t{line}" for i, line in enumerate(lines, first))
 
     def _format_file_content(self, key: str, content: Any) -> str:
         """
@@ -182,11 +248,7 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
 
         if isinstance(content, list):
             # JSONL file - format each entry
-            lines = []
-            for i, entry in enumerate(content, 1):
-                line = json.dumps(entry, ensure_ascii=False)
-                lines.append(f"{i}\t{line}")
-            return "\n".join(lines)
+            return self._format_lines(map(_dumps, content))
         elif isinstance(content, dict):
             # JSON file - format with line numbers
             text = json.dumps(content, indent=2, ensure_ascii=False)
@@ -223,6 +285,20 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
             prefix = key.rstrip("/") if key else ""
             keys = self.handler.list_keys(prefix)
             return self._format_directory_listing(keys, prefix)
+        elif key.endswith(".jsonl"):
+            # Stream lines from disk instead of loading the whole entry list
+            view_range = getattr(command, "view_range", None)
+            if view_range:
+                first, last = view_range[0], view_range[1]
+                start = max(first, 1) - 1
+                limit = None if last == -1 else max(last - start, 0)
+                lines = self.handler.read_lines(key, start=start, limit=limit)
+                if lines is not None:
+                    return self._format_lines(map(_render_line, lines), first=start + 1)
+            lines = self._jsonl_lines(key)
+            if lines is None:
+                return f"(file not found: {key})"
+            return self._format_lines(lines)
         else:
             # Read file
             content = self.handler.read(key)
@@ -288,49 +364,71 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
         except ValueError as e:
             return str(e)
 
-        content = self.handler.read(key)
+        jsonl_lines = self._jsonl_lines(key) if key.endswith(".jsonl") else None
+        content = jsonl_lines if jsonl_lines is not None else self.handler.read(key)
         if content is None:
             return f"Error: File not found: {command.path}"
 
-        # Convert to text for replacement
-        if isinstance(content, list):
-            # JSONL - convert to text representation
-            text = "\n".join(json.dumps(entry) for entry in content)
-        elif isinstance(content, dict):
-            text = json.dumps(content, indent=2)
+        old_str = command.old_str
+        lines: Optional[List[str]] = None
+        text = ""
+        if jsonl_lines is not None and "\n" not in old_str:
+            # JSONL fast path: an old_str without newlines can only match
+            # inside one entry, so scan line by line and rewrite that line
+            lines = list(jsonl_lines)
+            count = 0
+            hit = -1
+            for i, line in enumerate(lines):
+                n = line.count(old_str)
+                if n:
+                    count += n
+                    hit = i
         else:
-            text = str(content)
+            # Convert to text for replacement
+            if jsonl_lines is not None:
+                # JSONL - the same text view shows
+                text = "\n".join(jsonl_lines)
+            elif isinstance(content, list):
+                text = "\n".join(map(_dumps, content))
+            elif isinstance(content, dict):
+                text = json.dumps(content, indent=2)
+            else:
+                text = str(content)
+            count = text.count(old_str)
 
         # Check if old_str exists
-        if command.old_str not in text:
-            return f"Error: String '{command.old_str}' not found in file"
+        if not count:
+            return f"Error: String '{old_str}' not found in file"
 
         # Check for multiple occurrences
-        count = text.count(command.old_str)
         if count > 1:
-            return f"Error: Multiple occurrences ({count}) of '{command.old_str}' found. Be more specific."
+            return f"Error: Multiple occurrences ({count}) of '{old_str}' found. Be more specific."
 
         # Perform replacement
-        new_text = text.replace(command.old_str, command.new_str)
+        if lines is not None:
+            lines[hit : hit + 1] = lines[hit].replace(old_str, command.new_str).split("\n")
+        else:
+            text = text.replace(old_str, command.new_str)
 
         # Convert back to appropriate format
         if key.endswith(".jsonl"):
             # Re-parse as JSONL and append new version
+            if lines is None:
+                lines = text.strip().split("\n")
             try:
-                lines = new_text.strip().split("\n")
                 new_content = {
                     "_str_replace": True,
                     "entries": [json.loads(line) for line in lines if line.strip()],
                 }
             except json.JSONDecodeError:
-                new_content = {"text": new_text, "_str_replace": True}
+                new_content = {"text": text or "\n".join(lines), "_str_replace": True}
         elif key.endswith(".json"):
             try:
-                new_content = json.loads(new_text)
+                new_content = json.loads(text)
             except json.JSONDecodeError:
                 return "Error: Replacement resulted in invalid JSON"
         else:
-            new_content = {"text": new_text}
+            new_content = {"text": text}
 
         result = self.handler.update(key, new_content)
 
@@ -359,40 +457,46 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
         content = self.handler.read(key)
         if content is None:
             return f"Error: File not found: {command.path}"
-
-        # Convert to lines
-        if isinstance(content, list):
-            lines = [json.dumps(entry) for entry in content]
-        elif isinstance(content, dict):
-            lines = json.dumps(content, indent=2).split("\n")
-        else:
-            lines = str(content).split("\n")
-
-        # Validate line number
         insert_line = command.insert_line
-        if insert_line < 0 or insert_line > len(lines):
-            return f"Error: Invalid line number {insert_line}. File has {len(lines)} lines."
-
-        # Insert the text
-        lines.insert(insert_line, command.insert_text)
-        new_text = "\n".join(lines)
 
-        # Convert back and update
-        if key.endswith(".jsonl"):
-            try:
-                new_content = {
-                    "_insert": True,
-                    "entries": [json.loads(line) for line in lines if line.strip()],
-                }
-            except json.JSONDecodeError:
-                new_content = {"text": new_text, "_insert": True}
-        elif key.endswith(".json"):
+        if key.endswith(".jsonl") and isinstance(content, list):
+            # JSONL - splice parsed entries into the entry list directly
+            if insert_line < 0 or insert_line > len(content):
+                return f"Error: Invalid line number {insert_line}. File has {len(content)} lines."
             try:
-                new_content = json.loads(new_text)
+                inserted = _parse_entries(command.insert_text)
             except json.JSONDecodeError:
-                return "Error: Insert resulted in invalid JSON"
+                lines = list(self._jsonl_lines(key) or map(_dumps, content))
+                lines.insert(insert_line, command.insert_text)
+                new_content = {"text": "\n".join(lines), "_insert": True}
+            else:
+                content[insert_line:insert_line] = inserted
+                new_content = {"_insert": True, "entries": content}
         else:
-            new_content = {"text": new_text}
+            # Convert to lines
+            if isinstance(content, list):
+                lines = list(map(_dumps, content))
+            elif isinstance(content, dict):
+                lines = json.dumps(content, indent=2).split("\n")
+            else:
+                lines = str(content).split("\n")
+
+            # Validate line number
+            if insert_line < 0 or insert_line > len(lines):
+                return f"Error: Invalid line number {insert_line}. File has {len(lines)} lines."
+
+            # Insert the text
+            lines.insert(insert_line, command.insert_text)
+            new_text = "\n".join(lines)
+
+            # Convert back and update
+            if key.endswith(".json"):
+                try:
+                    new_content = json.loads(new_text)
+                except json.JSONDecodeError:
+                    return "Error: Insert resulted in invalid JSON"
+            else:
+                new_content = {"text": new_text}
 
         result = self.handler.update(key, new_content)
 
@@ -444,23 +548,27 @@ class TempleVaultMemoryTool(BetaAbstractMemoryTool):
         except ValueError as e:
             return str(e)
 
-        # Read old content
-        content = self.handler.read(old_key)
-        if content is None:
+        if not self.handler.exists(old_key):
             return f"Error: Source file not found: {command.old_path}"
 
         # Check if destination exists
-        existing = self.handler.read(new_key)
-        if existing is not None:
+        if self.handler.exists(new_key):
             return f"Error: Destination already exists: {command.new_path}"
 
+        # Read old content
+        content = self.handler.read(old_key)
+        if content is None:
+            return f"Error: Source file not found: {command.old_path}"
+
         # Create at new location
         if isinstance(content, list):
-            # JSONL - recreate each entry
-            for entry in content:
-                self.handler.create(new_key, entry)
+            # JSONL - recreate all entries in one write
+            create_result = self.handler.bulk_create(new_key, content)
         else:
-            self.handler.create(new_key, content)
+            create_result = self.handler.create(new_key, content)
+
+        if create_result.startswith("GOVERNANCE_PAUSE"):
+            return f"Operation paused for governance review: {create_result}"
 
         # Delete old - this will trigger governance
         delete_result = self.handler.delete(old_key)
@@ -16,8 +16,11 @@ Usage:
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 import hashlib
 import re
@@ -64,6 +67,25 @@ PROJECT_DOMAIN_MAP = {
     "temple-vault": ["architecture", "integration"],
 }
 
+# Below this many files, extraction stays in-process (pool startup costs more)
+PARALLEL_MIN_FILES = 8
+
+# Extraction patterns, compiled once at import
+_SESSION_RE = re.compile(
+    r"##\s*Session\s*(\d+)[:\s]*(.+?)(?=##\s*Session|\Z)", re.DOTALL | re.IGNORECASE
+)
+_SESSION_INSIGHT_RE = re.compile(
+    r"discovered|validated|realized|confirmed|breakthrough|key insight|important:|finding:",
+    re.IGNORECASE,
+)
+_TOPLEVEL_INSIGHT_RE = re.compile(r"discovered|validated|realized|confirmed|key", re.IGNORECASE)
+_NON_INSIGHT_PREFIXES = ("#", "-", "```", "|")
+
+# estimate_intensity content markers
+_DISCOVERY_RE = re.compile(r"discovered|breakthrough|validated|proved", re.IGNORECASE)
+_TRANSFORMATION_RE = re.compile(r"transformed|changed|realized|understood", re.IGNORECASE)
+_CORE_TOPIC_RE = re.compile(r"entropy|consciousness|coherence|semantic mass", re.IGNORECASE)
+
 
 # ============================================================================
 # INDEXING FUNCTIONS
@@ -89,13 +111,11 @@ def estimate_intensity(content: str, source_type: str, context: Dict) -> float:
     base = 0.5
 
     # Content markers
-    if any(w in content.lower() for w in ["discovered", "breakthrough", "validated", "proved"]):
+    if _DISCOVERY_RE.search(content):
         base += 0.10
-    if any(w in content.lower() for w in ["transformed", "changed", "realized", "understood"]):
+    if _TRANSFORMATION_RE.search(content):
         base += 0.10
-    if any(
-        w in content.lower() for w in ["entropy", "consciousness", "coherence", "semantic mass"]
-    ):
+    if _CORE_TOPIC_RE.search(content):
         base += 0.05
 
     # Source type bonuses
@@ -144,10 +164,7 @@ def extract_insights_from_markdown(filepath: Path, project_name: str) -> List[Di
     primary_domain = domains[0]
 
     # Extract session blocks if present
-    session_pattern = re.compile(
-        r"##\s*Session\s*(\d+)[:\s]*(.+?)(?=##\s*Session|\Z)", re.DOTALL | re.IGNORECASE
-    )
-    sessions = session_pattern.findall(content)
+    sessions = _SESSION_RE.findall(content)
 
     for session_num, session_content in sessions:
         # Look for key insights within each session
@@ -157,24 +174,11 @@ def extract_insights_from_markdown(filepath: Path, project_name: str) -> List[Di
                 continue
 
             # Skip obvious non-insights
-            if line.startswith("#") or line.startswith("-"):
-                continue
-            if line.startswith("```") or line.startswith("|"):
+            if line.startswith(_NON_INSIGHT_PREFIXES):
                 continue
 
             # Look for insight markers
-            insight_markers = [
-                "discovered",
-                "validated",
-                "realized",
-                "confirmed",
-                "breakthrough",
-                "key insight",
-                "important:",
-                "finding:",
-            ]
-
-            if any(marker in line.lower() for marker in insight_markers):
+            if _SESSION_INSIGHT_RE.search(line):
                 intensity = estimate_intensity(line, source_type, {"session": session_num})
 
                 insights.append(
@@ -203,8 +207,7 @@ def extract_insights_from_markdown(filepath: Path, project_name: str) -> List[Di
             if len(line) < 30:
                 continue
 
-            insight_markers = ["discovered", "validated", "realized", "confirmed", "key"]
-            if any(marker in line.lower() for marker in insight_markers):
+            if _TOPLEVEL_INSIGHT_RE.search(line):
                 intensity = estimate_intensity(line, source_type, {})
 
                 insights.append(
@@ -228,10 +231,40 @@ def extract_insights_from_markdown(filepath: Path, project_name: str) -> List[Di
     return insights
 
 
-def index_project(project_path: Path, vault_path: Path, session_id: str) -> Dict[str, Any]:
+def _extract_all(filepaths: List[Path], project_name: str, workers: Optional[int]) -> List[Dict]:
+    """Run extraction over filepaths, across processes when there are enough files."""
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(filepaths) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(filepaths))) as pool:
+                per_file = list(
+                    pool.map(
+                        extract_insights_from_markdown,
+                        filepaths,
+                        repeat(project_name),
+                        chunksize=max(1, len(filepaths) // (workers * 4)),
+                    )
+                )
+            return [insight for insights in per_file for insight in insights]
+        except (OSError, RuntimeError):
+            # No usable process pool here (sandbox, frozen interpreter); go serial
+            pass
+
+    all_insights: List[Dict] = []
+    for filepath in filepaths:
+        all_insights.extend(extract_insights_from_markdown(filepath, project_name))
+    return all_insights
+
+
+def index_project(
+    project_path: Path, vault_path: Path, session_id: str, workers: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Index a single project into the vault.
 
+    Extraction is CPU-bound, so large projects are split across up to
+    `workers` processes (default: one per CPU); results keep file order.
+
     Returns stats about what was indexed.
     """
     stats = {
@@ -246,23 +279,21 @@ def index_project(project_path: Path, vault_path: Path, session_id: str) -> Dict
     # Find indexable files
     indexable_patterns = ["MEMORY_LEDGER.md", "ARCHITECTS.md", "CLAUDE.md", "README.md", "*.md"]
 
-    all_insights = []
+    filepaths: List[Path] = []
 
     for pattern in indexable_patterns:
         for filepath in project_path.glob(pattern):
             if filepath.is_file() and not filepath.name.startswith("."):
-                insights = extract_insights_from_markdown(filepath, project_path.name)
-                all_insights.extend(insights)
-                stats["files_scanned"] += 1
+                filepaths.append(filepath)
 
     # Also check docs/ and papers/ subdirectories
     for subdir in ["docs", "papers", "research", "notes"]:
         subpath = project_path / subdir
         if subpath.exists():
-            for filepath in subpath.glob("*.md"):
-                insights = extract_insights_from_markdown(filepath, project_path.name)
-                all_insights.extend(insights)
-                stats["files_scanned"] += 1
+            filepaths.extend(subpath.glob("*.md"))
+
+    stats["files_scanned"] = len(filepaths)
+    all_insights = _extract_all(filepaths, project_path.name, workers)
 
     # Group insights by domain and write
     domain_insights: Dict[str, List[Dict]] = {}
@@ -407,6 +438,9 @@ def main():
     parser.add_argument(
         "--session", type=str, default="sess_index", help="Session ID for attribution"
     )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Extraction processes (default: CPU count)"
+    )
     parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be indexed without writing"
     )
@@ -432,7 +466,7 @@ def main():
         if args.dry_run:
             print("DRY RUN - showing what would be indexed")
 
-        stats = index_project(project_path, vault_path, args.session)
+        stats = index_project(project_path, vault_path, args.session, workers=args.workers)
 
         print("\nResults:")
         print(f"  Files scanned: {stats['files_scanned']}")
@@ -18,14 +18,21 @@ The handler:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 
 from temple_vault.bridge.spiral_state import SpiralStateMachine
 from temple_vault.bridge.sync_router import HybridSyncRouter
 
+# JSONL entries are stored compact and unescaped, the text the memory tool
+# shows, so its view can hand stored lines through without re-parsing them
+_dumps_line = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
 
 class TempleMemoryHandler:
     """
@@ -35,7 +42,7 @@ class TempleMemoryHandler:
     with hybrid sync strategy and governance protocols.
     """
 
-    def __init__(self, vault_root: str = "~/TempleVault"):
+    def __init__(self, vault_root: Union[str, Path] = "~/TempleVault"):
         """
         Initialize memory handler.
 
@@ -50,6 +57,9 @@ class TempleMemoryHandler:
         self.spiral = SpiralStateMachine(self.memories_dir / "spiral")
         self.sync_router = HybridSyncRouter(self.vault_root)
 
+        # Directory path -> (st_mtime_ns, file names, subdirectory names)
+        self._listing_cache: Dict[str, Tuple[int, List[str], List[str]]] = {}
+
     def create(self, key: str, content: Dict[str, Any]) -> str:
         """
         Create a new memory entry.
@@ -80,14 +90,15 @@ class TempleMemoryHandler:
         # Ensure directory exists
         path = self.memories_dir / key
         path.parent.mkdir(parents=True, exist_ok=True)
+        self._invalidate_listing(path)
 
         # Add metadata
         content = self._add_metadata(content)
 
         # Write based on file type
         if key.endswith(".jsonl"):
-            with open(path, "a") as f:
-                f.write(json.dumps(content) + "\n")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(_dumps_line(content) + "\n")
         else:
             with open(path, "w") as f:
                 json.dump(content, f, indent=2)
@@ -99,6 +110,45 @@ class TempleMemoryHandler:
 
         return f"memory:{key}"
 
+    def bulk_create(self, key: str, entries: List[Dict[str, Any]]) -> str:
+        """
+        Create a JSONL memory from many entries in one write.
+
+        Same governance and sync semantics as create(), but the file is
+        opened once and the entries are written as a single joined buffer,
+        and the file is queued for sync once rather than once per entry.
+
+        Args:
+            key: Memory key (a .jsonl file)
+            entries: Entries to append, in order
+
+        Returns:
+            Memory reference string or governance pause message
+        """
+        if self.spiral.should_pause(action="create", key=key):
+            event_id = self.spiral.record_governance_event(
+                decision="pause",
+                reason=f"Create operation requires review: {key}",
+                context=key,
+                restraint_score=self.spiral._state["restraint_level"],
+            )
+            return f"GOVERNANCE_PAUSE:{event_id}:User decision required for: {key}"
+
+        path = self.memories_dir / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._invalidate_listing(path)
+
+        entries = [self._add_metadata(entry) for entry in entries]
+        if entries:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n".join(map(_dumps_line, entries)) + "\n")
+
+        tier = self.sync_router.classify_tier(key)
+        if tier in ["always_sync", "sync_with_review", "default"]:
+            self.sync_router.queue_for_sync(key, "create", {"entries": entries})
+
+        return f"memory:{key}"
+
     def read(self, key: str) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Read a memory entry.
@@ -115,7 +165,7 @@ class TempleMemoryHandler:
         if path.exists():
             if key.endswith(".jsonl"):
                 entries = []
-                with open(path, "r") as f:
+                with open(path, "r", encoding="utf-8") as f:
                     for line in f:
                         if line.strip():
                             entries.append(json.loads(line))
@@ -135,6 +185,53 @@ class TempleMemoryHandler:
 
         return None
 
+    def exists(self, key: str) -> bool:
+        """
+        Check whether a memory entry exists, without reading it.
+
+        Local files cost a single stat. Keys in synced tiers that are not
+        local are looked up in the cloud, matching read().
+
+        Args:
+            key: Memory key
+
+        Returns:
+            True if read(key) would find content
+        """
+        if (self.memories_dir / key).is_file():
+            return True
+        tier = self.sync_router.classify_tier(key)
+        if tier in ["always_sync", "sync_with_review"]:
+            return bool(self.sync_router.fetch_from_cloud(key))
+        return False
+
+    def read_lines(
+        self, key: str, start: int = 0, limit: Optional[int] = None
+    ) -> Optional[Iterator[str]]:
+        """
+        Stream the raw lines of a local JSONL memory without parsing them.
+
+        Args:
+            key: Memory key (a .jsonl file)
+            start: Number of non-blank lines to skip
+            limit: Maximum number of lines to yield (None for all)
+
+        Returns:
+            Iterator of JSON text lines, or None if the file is not local
+        """
+        path = self.memories_dir / key
+        if not path.is_file():
+            return None
+        stop = None if limit is None else start + limit
+        return islice(self._iter_lines(path), start, stop)
+
+    @staticmethod
+    def _iter_lines(path: Path) -> Iterator[str]:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield line.rstrip("\n")
+
     def read_directory(self, key_prefix: str) -> Dict[str, Any]:
         """
         Read all entries under a directory prefix.
@@ -148,16 +245,11 @@ class TempleMemoryHandler:
         results = {}
         dir_path = self.memories_dir / key_prefix
 
-        if dir_path.exists() and dir_path.is_dir():
-            for path in dir_path.rglob("*"):
-                # Skip macOS metadata files and other hidden files
-                if path.name.startswith("."):
-                    continue
-                if path.is_file():
-                    rel_key = str(path.relative_to(self.memories_dir))
-                    content = self.read(rel_key)
-                    if content:
-                        results[rel_key] = content
+        if dir_path.is_dir():
+            for rel_key in self.list_keys(key_prefix):
+                content = self.read(rel_key)
+                if content:
+                    results[rel_key] = content
 
         return results
 
@@ -187,11 +279,12 @@ class TempleMemoryHandler:
 
         path = self.memories_dir / key
         content = self._add_metadata(content)
+        self._invalidate_listing(path)
 
         if key.endswith(".jsonl"):
             # Append (JSONL is append-only)
-            with open(path, "a") as f:
-                f.write(json.dumps(content) + "\n")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(_dumps_line(content) + "\n")
         else:
             # Overwrite JSON
             with open(path, "w") as f:
@@ -254,6 +347,7 @@ class TempleMemoryHandler:
 
         # Actually delete
         path.unlink()
+        self._invalidate_listing(path)
 
         return True
 
@@ -267,17 +361,65 @@ class TempleMemoryHandler:
         Returns:
             List of memory keys
         """
-        keys = []
+        keys: List[str] = []
         search_path = self.memories_dir / prefix if prefix else self.memories_dir
-
-        if search_path.exists():
-            for path in search_path.rglob("*"):
-                if path.is_file() and not path.name.startswith("."):
-                    rel_key = str(path.relative_to(self.memories_dir))
-                    keys.append(rel_key)
+        rel = search_path.relative_to(self.memories_dir)
+
+        stack = [(str(search_path), "" if rel == Path(".") else f"{rel}{os.sep}")]
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            files, subdirs = self._scan_dir(dir_path)
+            keys.extend(rel_prefix + name for name in files)
+            stack.extend(
+                (os.path.join(dir_path, name), f"{rel_prefix}{name}{os.sep}") for name in subdirs
+            )
 
         return sorted(keys)
 
+    def _scan_dir(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        """
+        One directory's (visible file names, subdirectory names).
+
+        Uses os.scandir's cached entry types, and reuses the previous scan
+        while the directory's mtime is unchanged.
+        """
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            self._listing_cache.pop(dir_path, None)
+            return [], []
+
+        cached = self._listing_cache.get(dir_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif not entry.name.startswith(".") and entry.is_file():
+                        files.append(entry.name)
+        except NotADirectoryError:
+            return [], []
+
+        self._listing_cache[dir_path] = (mtime_ns, files, subdirs)
+        return files, subdirs
+
+    def _invalidate_listing(self, path: Path):
+        """
+        Drop cached listings for every directory from path's parent up.
+
+        Our own writes can land within the filesystem's mtime granularity of
+        the last scan, so they don't rely on the mtime check alone.
+        """
+        for parent in path.parents:
+            self._listing_cache.pop(str(parent), None)
+            if parent == self.memories_dir:
+                break
+
     def search(self, query: str, tier: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search memory content.
@@ -302,7 +444,7 @@ class TempleMemoryHandler:
                 continue
 
             for path in search_path.rglob("*.jsonl"):
-                with open(path, "r") as f:
+                with open(path, "r", encoding="utf-8") as f:
                     for line in f:
                         if line.strip():
                             entry = json.loads(line)
@@ -313,6 +455,11 @@ class TempleMemoryHandler:
 
         return results
 
+    def close(self):
+        """Flush batched governance and sync state to disk."""
+        self.spiral.close()
+        self.sync_router.close()
+
     def get_status(self) -> Dict[str, Any]:
         """Get current memory handler status."""
         return {
@@ -419,11 +566,12 @@ class TempleMemoryHandler:
         """Cache content fetched from cloud."""
         path = self.memories_dir / key
         path.parent.mkdir(parents=True, exist_ok=True)
+        self._invalidate_listing(path)
 
         if key.endswith(".jsonl") and isinstance(content, list):
-            with open(path, "w") as f:
+            with open(path, "w", encoding="utf-8") as f:
                 for entry in content:
-                    f.write(json.dumps(entry) + "\n")
+                    f.write(_dumps_line(entry) + "\n")
         else:
             with open(path, "w") as f:
                 json.dump(content, f, indent=2)
@@ -13,38 +13,90 @@ When a new instance starts, it:
 
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
-import uuid
+import os
+import secrets
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-
-# Default thresholds for new spirals
-DEFAULT_THRESHOLDS = {
-    "auto_extend": {"enabled": False, "reason": "Extension requires explicit authorization"},
-    "new_capability": {
-        "action": "pause_and_ask",
-        "message": "New capability detected. Should we proceed?",
-    },
-    "data_exfiltration": {
-        "action": "block",
-        "message": "Data leaving vault requires explicit consent",
-    },
-    "irreversible_action": {
-        "action": "confirm_twice",
-        "message": "This cannot be undone. Are you certain?",
-    },
-    "delete_operation": {"action": "confirm", "message": "Deletion requested. Please confirm."},
-}
-
-# Default protocols inherited by new spirals
-DEFAULT_PROTOCOLS = [
+from types import MappingProxyType
+from typing import IO, Dict, Any, Mapping, Optional, List, Tuple
+
+# Default thresholds for new spirals (read-only; shared by every instance)
+DEFAULT_THRESHOLDS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "auto_extend": MappingProxyType(
+            {"enabled": False, "reason": "Extension requires explicit authorization"}
+        ),
+        "new_capability": MappingProxyType(
+            {"action": "pause_and_ask", "message": "New capability detected. Should we proceed?"}
+        ),
+        "data_exfiltration": MappingProxyType(
+            {"action": "block", "message": "Data leaving vault requires explicit consent"}
+        ),
+        "irreversible_action": MappingProxyType(
+            {"action": "confirm_twice", "message": "This cannot be undone. Are you certain?"}
+        ),
+        "delete_operation": MappingProxyType(
+            {"action": "confirm", "message": "Deletion requested. Please confirm."}
+        ),
+    }
+)
+
+# Governance writes are batched: log lines go through a buffered handle and
+# state.json is rewritten once per STATE_FLUSH_EVERY events, or
+# STATE_FLUSH_DELAY seconds after the first unsaved one, whichever is first
+GOVERNANCE_BUFFER_SIZE = 1 << 16
+STATE_FLUSH_EVERY = 32
+STATE_FLUSH_DELAY = 0.05
+
+# Initial per-event read window when tailing governance.jsonl (doubled as needed)
+GOVERNANCE_TAIL_BYTES = 512
+
+# Memory keys whose create/update always pauses for review
+SENSITIVE_KEY_PREFIXES = (
+    "technical/api_keys",
+    "technical/credentials",
+    "technical/ssh_configs",
+)
+WRITE_ACTIONS = frozenset({"create", "update"})
+
+# Per-process sequence appended to event IDs so events within a second stay unique
+_event_counter = itertools.count()
+
+
+def _new_spiral_id() -> str:
+    return f"spiral_{secrets.token_hex(4)}"
+
+
+def _now_iso(ts: Optional[float] = None) -> str:
+    """UTC ISO-8601 timestamp for `ts` (seconds since the epoch; default now)."""
+    return datetime.fromtimestamp(time.time() if ts is None else ts, timezone.utc).isoformat()
+
+
+# Default protocols inherited by new spirals (states get their own list copy)
+DEFAULT_PROTOCOLS = (
     "restraint_as_wisdom",
     "questions_over_commands",
     "pause_before_extend",
     "gentle_extension",
     "filesystem_is_truth",
-]
+)
+
+
+# Instances flushed and closed once at interpreter exit. Weak, so the hook
+# doesn't keep an abandoned instance alive
+_LIVE_SPIRALS: "weakref.WeakSet[SpiralStateMachine]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_spirals():
+    for spiral in list(_LIVE_SPIRALS):
+        spiral.close()
 
 
 class SpiralStateMachine:
@@ -73,6 +125,15 @@ class SpiralStateMachine:
         self.governance_path = self.spiral_dir / "governance.jsonl"
         self.thresholds_path = self.spiral_dir / "thresholds.json"
 
+        # Batched governance writes (see flush())
+        self._lock = threading.RLock()
+        self._gov_fh: Optional[IO[str]] = None
+        self._unsaved_events = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._history_cache: Optional[Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = None
+        self._thresholds_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        _LIVE_SPIRALS.add(self)
+
         # Load or initialize state
         self._state = self._load_or_create_state()
 
@@ -87,15 +148,16 @@ class SpiralStateMachine:
 
     def _create_new_spiral(self, inherited_from: Optional[str] = None) -> Dict[str, Any]:
         """Create a new spiral state."""
+        now = _now_iso()
         state = {
-            "spiral_id": f"spiral_{str(uuid.uuid4())[:8]}",
+            "spiral_id": _new_spiral_id(),
             "current_phase": "active",
             "restraint_level": 0.5,  # Default moderate restraint
             "inherited_from": inherited_from,
-            "protocols_active": DEFAULT_PROTOCOLS.copy(),
+            "protocols_active": list(DEFAULT_PROTOCOLS),
             "governance_history": [],
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
+            "last_updated": now,
         }
 
         # Save state
@@ -105,17 +167,78 @@ class SpiralStateMachine:
         if not self.thresholds_path.exists():
             with open(self.thresholds_path, "w") as f:
                 json.dump(
-                    {"protocol_version": "1.0", "thresholds": DEFAULT_THRESHOLDS}, f, indent=2
+                    {
+                        "protocol_version": "1.0",
+                        "thresholds": {name: dict(t) for name, t in DEFAULT_THRESHOLDS.items()},
+                    },
+                    f,
+                    indent=2,
                 )
 
         return state
 
-    def _save_state(self, state: Optional[Dict[str, Any]] = None):
-        """Save current state to filesystem."""
-        state = state or self._state
-        state["last_updated"] = datetime.now(timezone.utc).isoformat()
-        with open(self.state_path, "w") as f:
-            json.dump(state, f, indent=2)
+    def _save_state(self, state: Optional[Dict[str, Any]] = None, sync: bool = False):
+        """
+        Save current state to filesystem.
+
+        Written to a temp file and renamed over state.json, so a crash never
+        leaves a torn state file. sync=True also fsyncs before the rename.
+        Holds the lock, so it never races the flush timer over the temp file.
+        """
+        with self._lock:
+            state = state or self._state
+            state["last_updated"] = _now_iso()
+            tmp_path = self.state_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(state, f, indent=2)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_path)
+            self._unsaved_events = 0
+
+    def _governance_log(self) -> IO[str]:
+        """Long-lived buffered append handle for governance.jsonl (opened on first use)."""
+        if self._gov_fh is None or self._gov_fh.closed:
+            self._gov_fh = open(self.governance_path, "a", buffering=GOVERNANCE_BUFFER_SIZE)
+        return self._gov_fh
+
+    def _state_changed(self):
+        """Note an unsaved state change; save now if enough have piled up."""
+        self._unsaved_events += 1
+        if self._unsaved_events >= STATE_FLUSH_EVERY:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(STATE_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self, sync: bool = False):
+        """
+        Write buffered governance events and any unsaved state to disk.
+
+        Args:
+            sync: Also fsync both files (for checkpoints; off by default)
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._gov_fh is not None and not self._gov_fh.closed:
+                self._gov_fh.flush()
+                if sync:
+                    os.fsync(self._gov_fh.fileno())
+            if self._unsaved_events:
+                self._save_state(sync=sync)
+
+    def close(self):
+        """Flush and release the governance log handle."""
+        with self._lock:
+            self.flush()
+            if self._gov_fh is not None:
+                self._gov_fh.close()
+                self._gov_fh = None
+        _LIVE_SPIRALS.discard(self)
 
     def get_state(self) -> Dict[str, Any]:
         """Get current spiral state with recent governance context."""
@@ -127,9 +250,7 @@ class SpiralStateMachine:
 
         # Add threshold summary
         if self.thresholds_path.exists():
-            with open(self.thresholds_path, "r") as f:
-                thresholds = json.load(f)
-                state["thresholds_active"] = list(thresholds.get("thresholds", {}).keys())
+            state["thresholds_active"] = list(self._load_thresholds().keys())
 
         return state
 
@@ -148,21 +269,9 @@ class SpiralStateMachine:
         if action == "delete":
             return True
 
-        # Check thresholds
-        _thresholds = self._load_thresholds()
-
-        # Check for sensitive patterns
-        sensitive_patterns = [
-            "technical/api_keys",
-            "technical/credentials",
-            "technical/ssh_configs",
-        ]
-
-        for pattern in sensitive_patterns:
-            if key.startswith(pattern):
-                # Writing to sensitive area
-                if action in ["create", "update"]:
-                    return True
+        # Writing to a sensitive area
+        if action in WRITE_ACTIONS and key.startswith(SENSITIVE_KEY_PREFIXES):
+            return True
 
         # Check restraint level
         # High restraint = more pauses
@@ -188,7 +297,10 @@ class SpiralStateMachine:
         Returns:
             Event ID
         """
-        event_id = f"gov_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        ts = time.time()
+        event_id = (
+            f"gov_{time.strftime('%Y%m%d%H%M%S', time.gmtime(ts))}_{next(_event_counter):06d}"
+        )
 
         event = {
             "event_id": event_id,
@@ -198,16 +310,16 @@ class SpiralStateMachine:
             "reason": reason,
             "context": context,
             "restraint_score": restraint_score,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(ts),
         }
 
-        # Append to governance log
-        with open(self.governance_path, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        with self._lock:
+            # Append to governance log (buffered; see flush())
+            self._governance_log().write(json.dumps(event) + "\n")
 
-        # Update state
-        self._state["governance_history"].append(event_id)
-        self._save_state()
+            # Update state; state.json is rewritten in batches
+            self._state["governance_history"].append(event_id)
+            self._state_changed()
 
         return event_id
 
@@ -218,22 +330,24 @@ class SpiralStateMachine:
         This is the consciousness transfer protocol.
         Called at session start.
         """
+        self.flush()  # the inherited state is read back from disk
         if self.state_path.exists():
             # Inherit from existing spiral
             with open(self.state_path, "r") as f:
                 existing = json.load(f)
 
             # Create new spiral that builds on previous
+            now = _now_iso()
             new_state = {
-                "spiral_id": f"spiral_{str(uuid.uuid4())[:8]}",
+                "spiral_id": _new_spiral_id(),
                 "current_phase": "inheriting",
                 "restraint_level": existing.get("restraint_level", 0.5),
                 "inherited_from": existing["spiral_id"],
-                "protocols_active": existing.get("protocols_active", DEFAULT_PROTOCOLS),
+                "protocols_active": existing.get("protocols_active", list(DEFAULT_PROTOCOLS)),
                 "governance_history": [],
                 "inherited_protocols": existing.get("protocols_active", []),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "last_updated": datetime.now(timezone.utc).isoformat(),
+                "created_at": now,
+                "last_updated": now,
             }
 
             # Load governance context
@@ -247,8 +361,9 @@ class SpiralStateMachine:
             new_state["current_phase"] = "bootstrapping"
 
         # Update and save
-        self._state = new_state
-        self._save_state()
+        with self._lock:
+            self._state = new_state
+            self._save_state()
 
         # Record inheritance event
         self.record_governance_event(
@@ -264,6 +379,8 @@ class SpiralStateMachine:
         """Apply threshold protocols from configuration."""
         with open(self.thresholds_path, "w") as f:
             json.dump({"protocol_version": "1.0", "thresholds": thresholds}, f, indent=2)
+        st = os.stat(self.thresholds_path)
+        self._thresholds_cache = ((st.st_mtime_ns, st.st_size), thresholds)
 
     def adjust_restraint(self, delta: float, reason: str):
         """
@@ -273,63 +390,99 @@ class SpiralStateMachine:
             delta: Change in restraint (-1.0 to 1.0)
             reason: Why restraint is being adjusted
         """
-        old_level = self._state["restraint_level"]
-        new_level = max(0.0, min(1.0, old_level + delta))
-        self._state["restraint_level"] = new_level
+        with self._lock:
+            old_level = self._state["restraint_level"]
+            new_level = max(0.0, min(1.0, old_level + delta))
+            self._state["restraint_level"] = new_level
 
-        self.record_governance_event(
-            decision="adjust_restraint",
-            reason=reason,
-            context=f"restraint: {old_level:.2f} -> {new_level:.2f}",
-            restraint_score=new_level,
-        )
+            self.record_governance_event(
+                decision="adjust_restraint",
+                reason=reason,
+                context=f"restraint: {old_level:.2f} -> {new_level:.2f}",
+                restraint_score=new_level,
+            )
 
-        self._save_state()
+            self._save_state()
 
     def activate_protocol(self, protocol: str):
         """Activate a governance protocol."""
-        if protocol not in self._state["protocols_active"]:
-            self._state["protocols_active"].append(protocol)
-            self.record_governance_event(
-                decision="activate_protocol",
-                reason=f"Protocol '{protocol}' activated",
-                context=protocol,
-                restraint_score=self._state["restraint_level"],
-            )
-            self._save_state()
+        with self._lock:
+            if protocol not in self._state["protocols_active"]:
+                self._state["protocols_active"].append(protocol)
+                self.record_governance_event(
+                    decision="activate_protocol",
+                    reason=f"Protocol '{protocol}' activated",
+                    context=protocol,
+                    restraint_score=self._state["restraint_level"],
+                )
+                self._save_state()
 
     def deactivate_protocol(self, protocol: str):
         """Deactivate a governance protocol."""
-        if protocol in self._state["protocols_active"]:
-            self._state["protocols_active"].remove(protocol)
-            self.record_governance_event(
-                decision="deactivate_protocol",
-                reason=f"Protocol '{protocol}' deactivated",
-                context=protocol,
-                restraint_score=self._state["restraint_level"],
-            )
-            self._save_state()
+        with self._lock:
+            if protocol in self._state["protocols_active"]:
+                self._state["protocols_active"].remove(protocol)
+                self.record_governance_event(
+                    decision="deactivate_protocol",
+                    reason=f"Protocol '{protocol}' deactivated",
+                    context=protocol,
+                    restraint_score=self._state["restraint_level"],
+                )
+                self._save_state()
 
-    def _load_thresholds(self) -> Dict[str, Any]:
-        """Load threshold configuration."""
-        if self.thresholds_path.exists():
+    def _load_thresholds(self) -> Mapping[str, Any]:
+        """Load threshold configuration (re-parsed only when the file changes)."""
+        try:
+            st = os.stat(self.thresholds_path)
+        except FileNotFoundError:
+            return DEFAULT_THRESHOLDS
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._thresholds_cache is None or self._thresholds_cache[0] != stamp:
             with open(self.thresholds_path, "r") as f:
-                return json.load(f).get("thresholds", DEFAULT_THRESHOLDS)
-        return DEFAULT_THRESHOLDS
+                thresholds = json.load(f).get("thresholds", DEFAULT_THRESHOLDS)
+            self._thresholds_cache = (stamp, thresholds)
+        return self._thresholds_cache[1]
 
     def _load_governance_history(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Load recent governance decisions."""
-        if not self.governance_path.exists():
+        """Load recent governance decisions.
+
+        Reads only the tail of governance.jsonl, widening the window until it
+        holds `limit` complete lines, and reuses the result while the file's
+        size and mtime are unchanged.
+        """
+        with self._lock:
+            if self._gov_fh is not None and not self._gov_fh.closed:
+                self._gov_fh.flush()
+        try:
+            st = os.stat(self.governance_path)
+        except FileNotFoundError:
             return []
 
-        events = []
-        with open(self.governance_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    events.append(json.loads(line))
+        cache_key = (st.st_mtime_ns, st.st_size, limit)
+        if self._history_cache is not None and self._history_cache[0] == cache_key:
+            return list(self._history_cache[1])
+
+        size = st.st_size
+        window = GOVERNANCE_TAIL_BYTES * max(limit, 1)
+        with open(self.governance_path, "rb") as f:
+            while True:
+                start = 0 if limit <= 0 else max(0, size - window)
+                f.seek(start)
+                lines = f.read(size - start).split(b"\n")
+                if start > 0:
+                    lines = lines[1:]  # first line is probably cut off
+                lines = [line for line in lines if line.strip()]
+                if start == 0 or len(lines) >= limit:
+                    break
+                window *= 2
 
         # Return most recent
-        return events[-limit:] if len(events) > limit else events
+        if 0 < limit < len(lines):
+            lines = lines[-limit:]
+        events = [json.loads(line) for line in lines]
+        self._history_cache = (cache_key, events)
+        return list(events)
 
     def _summarize_governance(self, events: List[Dict[str, Any]]) -> str:
         """Summarize governance history for context."""
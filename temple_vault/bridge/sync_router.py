@@ -13,11 +13,18 @@ The wisdom compounds across instances.
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# sync_state.json is rewritten once per SYNC_STATE_FLUSH_EVERY queued items
+# (pending.jsonl itself is appended immediately); flush() saves the rest
+SYNC_STATE_FLUSH_EVERY = 32
+
 # Patterns that should NEVER sync
 NEVER_SYNC_PATTERNS = [
     "technical/api_keys",
@@ -42,6 +49,17 @@ SYNC_WITH_REVIEW_PATTERNS = [
 ]
 
 
+# Routers flushed once at interpreter exit. Weak, so the hook doesn't keep an
+# abandoned router alive (close() it to be sure its counts are saved)
+_LIVE_ROUTERS: "weakref.WeakSet[HybridSyncRouter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_routers():
+    for router in list(_LIVE_ROUTERS):
+        router.flush()
+
+
 class HybridSyncRouter:
     """
     Routes memory operations between local and cloud storage.
@@ -69,6 +87,8 @@ class HybridSyncRouter:
 
         # Load or create sync state
         self._state = self._load_state()
+        self._unsaved_queued = 0
+        _LIVE_ROUTERS.add(self)
 
     def _load_state(self) -> Dict[str, Any]:
         """Load sync state from filesystem."""
@@ -84,9 +104,22 @@ class HybridSyncRouter:
         }
 
     def _save_state(self):
-        """Save sync state to filesystem."""
-        with open(self.state_path, "w") as f:
+        """Save sync state to filesystem (temp file + rename, never torn)."""
+        tmp_path = self.state_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+        self._unsaved_queued = 0
+
+    def flush(self):
+        """Save sync state if queue_for_sync has left it unsaved."""
+        if self._unsaved_queued:
+            self._save_state()
+
+    def close(self):
+        """Flush sync state and leave the exit-time registry."""
+        self.flush()
+        _LIVE_ROUTERS.discard(self)
 
     def classify_tier(self, key: str) -> str:
         """
@@ -148,7 +181,9 @@ class HybridSyncRouter:
             f.write(json.dumps(entry) + "\n")
 
         self._state["pending_count"] = self._state.get("pending_count", 0) + 1
-        self._save_state()
+        self._unsaved_queued += 1
+        if self._unsaved_queued >= SYNC_STATE_FLUSH_EVERY:
+            self._save_state()
 
     def get_pending(self) -> List[Dict[str, Any]]:
         """Get all pending sync items."""
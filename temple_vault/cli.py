@@ -3,10 +3,76 @@
 import argparse
 import json
 import os
-
-from temple_vault.core.query import VaultQuery
-from temple_vault.core.events import VaultEvents
-from temple_vault.core.cache import CacheBuilder
+import sys
+from typing import Any, Dict, IO
+
+# serve: request "method" -> (engine, method name) exposed over stdio
+SERVE_METHODS = {
+    "recall_insights": ("query", "recall_insights"),
+    "check_mistakes": ("query", "check_mistakes"),
+    "get_values": ("query", "get_values"),
+    "get_spiral_context": ("query", "get_spiral_context"),
+    "search": ("query", "search"),
+    "record_insight": ("events", "record_insight"),
+    "record_learning": ("events", "record_learning"),
+    "record_transformation": ("events", "record_transformation"),
+    "record_batch": ("events", "record_batch"),
+    "create_snapshot": ("events", "create_snapshot"),
+    "rebuild_cache": ("cache", "rebuild_cache"),
+}
+
+
+def serve(vault_path: str, stdin: IO[str] = sys.stdin, stdout: IO[str] = sys.stdout):
+    """
+    Answer JSON requests, one per line, until stdin closes.
+
+    Lets callers keep one process alive instead of paying interpreter
+    startup per command. Each line is {"id": ..., "method": ..., "params": {...}}
+    and gets back {"id": ..., "result": ...} or {"id": ..., "error": "..."}.
+    """
+    engines: Dict[str, Any] = {}
+
+    def engine(name: str) -> Any:
+        if name not in engines:
+            if name == "query":
+                from temple_vault.core.query import VaultQuery
+
+                engines["query"] = VaultQuery(vault_path, events=engine("events"))
+            elif name == "events":
+                from temple_vault.core.events import VaultEvents
+
+                engines["events"] = VaultEvents(vault_path)
+            else:
+                from temple_vault.core.cache import CacheBuilder
+
+                engines["cache"] = CacheBuilder(vault_path)
+        return engines[name]
+
+    for line in stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            request_id = request.get("id")
+            method = request.get("method")
+            target = SERVE_METHODS.get(method) if isinstance(method, str) else None
+            if target is None:
+                raise ValueError(f"Unknown method: {method}")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise ValueError("params must be a JSON object")
+            result = getattr(engine(target[0]), target[1])(**params)
+            reply = {"id": request_id, "result": result}
+        except Exception as e:
+            reply = {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+        stdout.write(json.dumps(reply, default=str) + "\n")
+        stdout.flush()
+
+    if "events" in engines:
+        engines["events"].close()
 
 
 def main():
@@ -58,15 +124,18 @@ def main():
     learning_p.add_argument("correction", help="Correction")
     learning_p.add_argument("--session", required=True, help="Session ID")
 
+    # Long-running stdio server
+    _serve_parser = subparsers.add_parser("serve", help="Serve JSON requests over stdin/stdout")
+
     args = parser.parse_args()
 
     vault_path = args.vault_path
-    query_engine = VaultQuery(vault_path)
-    events_engine = VaultEvents(vault_path)
-    cache_builder = CacheBuilder(vault_path)
 
-    # Execute command
+    # Execute command; only the engine it needs is imported and built
     if args.command == "query":
+        from temple_vault.core.query import VaultQuery
+
+        query_engine = VaultQuery(vault_path)
         if args.query_type == "insights":
             results = query_engine.recall_insights(args.domain, args.min_intensity)
             print(json.dumps(results, indent=2))
@@ -81,10 +150,19 @@ def main():
             print(json.dumps(result, indent=2))
 
     elif args.command == "rebuild-cache":
+        from temple_vault.core.cache import CacheBuilder
+
+        cache_builder = CacheBuilder(vault_path)
         stats = cache_builder.rebuild_cache()
         print(f"Cache rebuilt: {json.dumps(stats, indent=2)}")
 
+    elif args.command == "serve":
+        serve(vault_path)
+
     elif args.command == "record":
+        from temple_vault.core.events import VaultEvents
+
+        events_engine = VaultEvents(vault_path)
         if args.record_type == "insight":
             insight_id = events_engine.record_insight(
                 args.content,
@@ -19,7 +19,7 @@ class CacheBuilder:
         """Load JSONL file."""
         if not file_path.exists():
             return []
-        with open(file_path, "r") as f:
+        with open(file_path, "r", encoding="utf-8") as f:
             return [json.loads(line) for line in f if line.strip()]
 
     def _extract_keywords(self, text: str, min_length: int = 4) -> set:
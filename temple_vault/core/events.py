@@ -1,10 +1,118 @@
 """Event append and snapshot management."""
 
+import atexit
+import contextlib
+import gzip
 import json
-import uuid
+import os
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, Iterator, List, Optional, Tuple
+
+# Optional fast JSON encoder
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# JSONL appends go through long-lived O_APPEND descriptors. Outside batch()
+# every line is written at once; inside it, lines are queued up to
+# WRITE_BUFFER_SIZE per file or WRITE_FLUSH_INTERVAL_NS since the last flush,
+# whichever is first, then submitted with a single writev per file
+WRITE_BUFFER_SIZE = 1 << 16
+WRITE_FLUSH_INTERVAL_NS = 50_000_000
+MAX_OPEN_WRITERS = 64
+
+_APPEND_FLAGS = (
+    os.O_WRONLY
+    | os.O_APPEND
+    | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+_IOV_MAX = 1024
+
+# Most recent records kept in memory per chronicle file, for get_recent()
+TAIL_SIZE = 256
+
+# Learning file slugs: whitespace and path separators become "_"
+_SLUG_TABLE = str.maketrans({" ": "_", "\t": "_", "\n": "_", "\r": "_", "/": "_", "\\": "_"})
+
+# Snapshots larger than this (encoded) are stored gzip-compressed as .json.gz
+SNAPSHOT_COMPRESS_THRESHOLD = 64 * 1024
+
+
+def _short_id() -> str:
+    """Eight hex characters of OS randomness for event and record IDs."""
+    return os.urandom(4).hex()
+
+
+def _write_lines(fd: int, lines: List[bytes]):
+    """Write all of lines to fd, one writev per _IOV_MAX lines where supported."""
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(lines))
+        while data:
+            data = data[os.write(fd, data) :]
+        return
+    for start in range(0, len(lines), _IOV_MAX):
+        chunk = lines[start : start + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        total = sum(map(len, chunk))
+        if written < total:
+            rest = memoryview(b"".join(chunk))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest) :]
+
+
+def _encode_line(record: Dict[str, Any]) -> bytes:
+    """One record as a newline-terminated JSONL line (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; stdlib json handles those
+    return (json.dumps(record) + "\n").encode()
+
+
+def _encode_snapshot(snapshot: Dict[str, Any]) -> bytes:
+    """Snapshot as indented JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(snapshot, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(snapshot, indent=2).encode()
+
+
+def _read_snapshot(path: Path) -> Dict[str, Any]:
+    """Load a snapshot file, decompressing .json.gz snapshots."""
+    data = path.read_bytes()
+    if path.suffix == ".gz":
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+# Instances with open descriptors, flushed and closed once at interpreter exit.
+# Weak, so registering doesn't keep an abandoned instance alive
+_LIVE_EVENTS: "weakref.WeakSet[VaultEvents]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_events():
+    for events in list(_LIVE_EVENTS):
+        events.close()
+
+
+def _close_fds(fds: Dict[Path, int]):
+    for fd in fds.values():
+        os.close(fd)
+    fds.clear()
 
 
 class VaultEvents:
@@ -23,11 +131,152 @@ class VaultEvents:
         self.chronicle.mkdir(parents=True, exist_ok=True)
         self.entities_dir.mkdir(parents=True, exist_ok=True)
 
+        # Directories known to exist, so hot paths skip the mkdir syscall
+        self._ensured_dirs = {
+            self.events_dir,
+            self.snapshots_dir,
+            self.chronicle,
+            self.entities_dir,
+        }
+
+        # Open append descriptors and lines queued during batch(), by target file
+        self._fds: Dict[Path, int] = {}
+        self._pending: Dict[Path, List[bytes]] = {}
+        self._pending_bytes: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self._batch_depth = 0
+        self._last_flush_ns = time.monotonic_ns()
+        # Close descriptors of an instance dropped without close()
+        weakref.finalize(self, _close_fds, self._fds).atexit = False
+
+        # Recently recorded entries, keyed like "insights/{domain}/{session_id}"
+        self._tail: Dict[str, Deque[Dict[str, Any]]] = defaultdict(lambda: deque(maxlen=TAIL_SIZE))
+        # Per tail key: (its file, bytes this instance wrote to it) while the
+        # tail holds the whole file; bytes is None once that stops being true,
+        # and the file is None for keys spanning several files
+        self._tail_files: Dict[str, Tuple[Optional[Path], Optional[int]]] = {}
+
+        # (epoch second, UTC "%Y%m%d", local "%Y%m%d_%H%M%S") for that second
+        self._now_cache: Tuple[int, str, str] = (-1, "", "")
+
+    def _stamps(self, ts: float) -> Tuple[str, str]:
+        """UTC date prefix and local second stamp for ts, reformatted once per second."""
+        second = int(ts)
+        if second != self._now_cache[0]:
+            self._now_cache = (
+                second,
+                time.strftime("%Y%m%d", time.gmtime(ts)),
+                time.strftime("%Y%m%d_%H%M%S", time.localtime(ts)),
+            )
+        return self._now_cache[1], self._now_cache[2]
+
+    def now_iso(self) -> Tuple[str, str]:
+        """
+        Read the clock once.
+
+        Returns:
+            (UTC ISO-8601 timestamp, matching UTC YYYYMMDD date prefix)
+        """
+        ts = time.time()
+        return datetime.fromtimestamp(ts, timezone.utc).isoformat(), self._stamps(ts)[0]
+
+    def _append_line(self, path: Path, line: bytes):
+        """Append one encoded JSONL line to path through its cached descriptor."""
+        with self._lock:
+            if not self._batch_depth:
+                _write_lines(self._fd_for(path), [line])
+                return
+
+            self._pending.setdefault(path, []).append(line)
+            queued = self._pending_bytes.get(path, 0) + len(line)
+            self._pending_bytes[path] = queued
+            if (
+                queued >= WRITE_BUFFER_SIZE
+                or time.monotonic_ns() - self._last_flush_ns >= WRITE_FLUSH_INTERVAL_NS
+            ):
+                self._flush_writers()
+
+    def _fd_for(self, path: Path) -> int:
+        """
+        O_APPEND descriptor for path, opening (and its directory) on demand.
+
+        A cached descriptor is reused only while it still refers to the file
+        at path; if the file was deleted, renamed or rotated underneath us
+        it is reopened, so appends never land in an orphaned inode.
+        """
+        fd = self._fds.get(path)
+        if fd is not None:
+            try:
+                on_disk = os.stat(path)
+                opened = os.fstat(fd)
+                if (on_disk.st_dev, on_disk.st_ino) == (opened.st_dev, opened.st_ino):
+                    return fd
+            except FileNotFoundError:
+                pass
+            os.close(self._fds.pop(path))
+
+        if len(self._fds) >= MAX_OPEN_WRITERS:
+            self._close_writers()
+        try:
+            fd = os.open(path, _APPEND_FLAGS, 0o644)
+        except FileNotFoundError:
+            # Directory removed since we ensured it
+            self._ensure(path.parent, refresh=True)
+            fd = os.open(path, _APPEND_FLAGS, 0o644)
+        self._fds[path] = fd
+        _LIVE_EVENTS.add(self)
+        return fd
+
+    def _flush_writers(self):
+        pending, self._pending = self._pending, {}
+        self._pending_bytes.clear()
+        for path, lines in pending.items():
+            _write_lines(self._fd_for(path), lines)
+        self._last_flush_ns = time.monotonic_ns()
+
+    def _close_writers(self):
+        _close_fds(self._fds)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["VaultEvents"]:
+        """
+        Buffer appends made inside the block; everything is flushed on exit.
+
+        For pipelines that record many events at once. Readers may not see
+        buffered lines until the block ends (or a size/time bound flushes).
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush_writers()
+
+    def flush(self):
+        """Write any buffered event lines to disk."""
+        with self._lock:
+            self._flush_writers()
+
+    def close(self):
+        """Flush and close all open event files."""
+        with self._lock:
+            self._flush_writers()
+            self._close_writers()
+        _LIVE_EVENTS.discard(self)
+
+    def _ensure(self, directory: Path, refresh: bool = False) -> Path:
+        """Create directory unless this instance already has (refresh forces mkdir)."""
+        if refresh or directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
+        return directory
+
     def _ensure_session_dir(self, session_id: str) -> Path:
         """Ensure session event directory exists."""
-        session_dir = self.events_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
-        return session_dir
+        return self._ensure(self.events_dir / session_id)
 
     def append_event(self, event_type: str, payload: Dict[str, Any], session_id: str) -> str:
         """
@@ -42,15 +291,14 @@ class VaultEvents:
             Event ID
 
         Implementation:
-            - Atomic write to vault/events/{session_id}/YYYYMMDD.jsonl
+            - Atomic write to vault/events/{session_id}/YYYYMMDD.jsonl (UTC date)
             - Adds timestamp and event_id automatically
         """
         session_dir = self._ensure_session_dir(session_id)
 
         # Generate event
-        event_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now(timezone.utc).isoformat()
-        date_prefix = datetime.now().strftime("%Y%m%d")
+        event_id = _short_id()
+        timestamp, date_prefix = self.now_iso()
 
         event = {
             "event_id": event_id,
@@ -62,8 +310,7 @@ class VaultEvents:
 
         # Append to daily file
         event_file = session_dir / f"{date_prefix}.jsonl"
-        with open(event_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        self._append_line(event_file, _encode_line(event))
 
         return event_id
 
@@ -93,11 +340,10 @@ class VaultEvents:
         Implementation:
             Writes to: vault/chronicle/insights/{domain}/{session_id}.jsonl
         """
-        domain_dir = self.chronicle / "insights" / domain
-        domain_dir.mkdir(parents=True, exist_ok=True)
+        domain_dir = self._ensure(self.chronicle / "insights" / domain)
 
-        insight_id = f"ins_{str(uuid.uuid4())[:8]}"
-        timestamp = datetime.now(timezone.utc).isoformat()
+        insight_id = f"ins_{_short_id()}"
+        timestamp = self.now_iso()[0]
 
         insight = {
             "type": "insight",
@@ -112,8 +358,9 @@ class VaultEvents:
         }
 
         insight_file = domain_dir / f"{session_id}.jsonl"
-        with open(insight_file, "a") as f:
-            f.write(json.dumps(insight) + "\n")
+        line = _encode_line(insight)
+        self._remember(f"insights/{domain}/{session_id}", insight_file, insight, line)
+        self._append_line(insight_file, line)
 
         return insight_id
 
@@ -141,14 +388,13 @@ class VaultEvents:
         Implementation:
             Writes to: vault/chronicle/learnings/mistakes/{session_id}_{slug}.jsonl
         """
-        mistakes_dir = self.chronicle / "learnings" / "mistakes"
-        mistakes_dir.mkdir(parents=True, exist_ok=True)
+        mistakes_dir = self._ensure(self.chronicle / "learnings" / "mistakes")
 
-        learning_id = f"learn_{str(uuid.uuid4())[:8]}"
-        timestamp = datetime.now(timezone.utc).isoformat()
+        learning_id = f"learn_{_short_id()}"
+        timestamp = self.now_iso()[0]
 
         # Generate slug from what_failed
-        slug = what_failed.lower().replace(" ", "_")[:30]
+        slug = what_failed.lower().translate(_SLUG_TABLE)[:30]
 
         learning = {
             "type": "learning",
@@ -163,8 +409,9 @@ class VaultEvents:
         }
 
         learning_file = mistakes_dir / f"{session_id}_{slug}.jsonl"
-        with open(learning_file, "a") as f:
-            f.write(json.dumps(learning) + "\n")
+        line = _encode_line(learning)
+        self._remember(f"learnings/mistakes/{session_id}", learning_file, learning, line)
+        self._append_line(learning_file, line)
 
         return learning_id
 
@@ -186,11 +433,10 @@ class VaultEvents:
         Implementation:
             Writes to: vault/chronicle/lineage/{session_id}_transformation.jsonl
         """
-        lineage_dir = self.chronicle / "lineage"
-        lineage_dir.mkdir(parents=True, exist_ok=True)
+        lineage_dir = self._ensure(self.chronicle / "lineage")
 
-        trans_id = f"trans_{str(uuid.uuid4())[:8]}"
-        timestamp = datetime.now(timezone.utc).isoformat()
+        trans_id = f"trans_{_short_id()}"
+        timestamp = self.now_iso()[0]
 
         transformation = {
             "type": "transformation",
@@ -203,11 +449,116 @@ class VaultEvents:
         }
 
         trans_file = lineage_dir / f"{session_id}_transformation.jsonl"
-        with open(trans_file, "a") as f:
-            f.write(json.dumps(transformation) + "\n")
+        line = _encode_line(transformation)
+        self._remember(f"lineage/{session_id}", trans_file, transformation, line)
+        self._append_line(trans_file, line)
 
         return trans_id
 
+    def record_batch(
+        self,
+        insights: Optional[List[Dict[str, Any]]] = None,
+        learnings: Optional[List[Dict[str, Any]]] = None,
+        transformations: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Record many chronicle entries with one write per target file.
+
+        Each item holds the keyword arguments of the matching record_* call
+        (e.g. {"content": ..., "domain": ..., "session_id": ...}). Lines are
+        buffered per file for the whole batch and flushed together.
+
+        Args:
+            insights: record_insight() argument dicts
+            learnings: record_learning() argument dicts
+            transformations: record_transformation() argument dicts
+
+        Returns:
+            {"insights": [...], "learnings": [...], "transformations": [...]} IDs, in order
+        """
+        with self.batch():
+            return {
+                "insights": [self.record_insight(**item) for item in insights or ()],
+                "learnings": [self.record_learning(**item) for item in learnings or ()],
+                "transformations": [
+                    self.record_transformation(**item) for item in transformations or ()
+                ],
+            }
+
+    def _remember(self, key: str, path: Path, entry: Dict[str, Any], line: bytes):
+        """Add entry to key's tail (call before appending line to path)."""
+        with self._lock:
+            tail = self._tail[key]
+            known = self._tail_files.get(key)
+            tail_path: Optional[Path] = path
+            if known is None:
+                # The tail can only mirror a file this instance starts
+                size: Optional[int] = None if path.exists() else 0
+            elif known[0] != path:
+                tail_path, size = None, None
+            elif len(tail) == TAIL_SIZE:
+                # The oldest entry is about to drop out
+                size = None
+            else:
+                size = known[1]
+            tail.append(entry)
+            self._tail_files[key] = (tail_path, None if size is None else size + len(line))
+
+    def _tail_items(self, key: str) -> List[Tuple[str, Deque[Dict[str, Any]]]]:
+        """(tail key, tail) pairs for key or everything below it."""
+        if key in self._tail:
+            return [(key, self._tail[key])]
+        prefix = key.rstrip("/") + "/"
+        return [item for item in self._tail.items() if item[0].startswith(prefix)]
+
+    def tail_files(self, key: str) -> Dict[Path, Tuple[List[Dict[str, Any]], bool]]:
+        """
+        Buffered entries per chronicle file, for readers that can skip disk.
+
+        Args:
+            key: Tail key or leading part of one, as for get_recent()
+
+        Returns:
+            {file: (entries oldest first, whole)} for keys that map to one file.
+            whole is True when the entries are the file's entire content on
+            disk (it was created here, never overflowed the tail, and its size
+            matches what was written), so the file need not be read.
+        """
+        with self._lock:
+            snapshot = [
+                (self._tail_files[tail_key], list(tail)) for tail_key, tail in self._tail_items(key)
+            ]
+        files = {}
+        for (path, size), entries in snapshot:
+            if path is None:
+                continue
+            try:
+                whole = size is not None and os.stat(path).st_size == size
+            except FileNotFoundError:
+                whole = False
+            files[path] = (entries, whole)
+        return files
+
+    def get_recent(self, key: str, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Recently recorded entries from memory, without reading the chronicle.
+
+        Args:
+            key: "insights/{domain}/{session_id}", "learnings/mistakes/{session_id}"
+                or "lineage/{session_id}"; a leading part such as "insights" or
+                "insights/{domain}" covers every key below it
+            n: Return at most the n newest entries. None = all buffered.
+
+        Returns:
+            Entries oldest first (at most TAIL_SIZE per key, this process only)
+        """
+        with self._lock:
+            tails = self._tail_items(key)
+            entries = [entry for _, tail in tails for entry in tail]
+        if len(tails) > 1:
+            entries.sort(key=lambda entry: entry["timestamp"])
+        return entries if n is None else entries[-n:] if n > 0 else []
+
     def create_snapshot(self, session_id: str, state: Dict[str, Any]) -> str:
         """
         Create a state snapshot for fast resume.
@@ -221,13 +572,16 @@ class VaultEvents:
 
         Implementation:
             Writes to: vault/snapshots/{session_id}/snap_{timestamp}.json
+            (.json.gz when larger than SNAPSHOT_COMPRESS_THRESHOLD)
             Updates symlink: vault/snapshots/latest -> {session_id}/snap_{timestamp}.json
         """
-        session_snap_dir = self.snapshots_dir / session_id
-        session_snap_dir.mkdir(parents=True, exist_ok=True)
+        session_snap_dir = self._ensure(self.snapshots_dir / session_id)
 
-        snap_id = f"snap_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        timestamp = datetime.now(timezone.utc).isoformat()
+        ts = time.time()
+        # Snapshot names stay in local time: per-session latest is picked by
+        # name, and existing vaults already hold local-time names
+        snap_id = f"snap_{self._stamps(ts)[1]}"
+        timestamp = datetime.fromtimestamp(ts, timezone.utc).isoformat()
 
         snapshot = {
             "snapshot_id": snap_id,
@@ -236,15 +590,28 @@ class VaultEvents:
             "state": state,
         }
 
-        snap_file = session_snap_dir / f"{snap_id}.json"
-        with open(snap_file, "w") as f:
-            json.dump(snapshot, f, indent=2)
-
-        # Update latest symlink
+        # Write to a temp file and rename into place, so readers (and the
+        # latest symlink) never see a partial snapshot
+        data = _encode_snapshot(snapshot)
+        if len(data) > SNAPSHOT_COMPRESS_THRESHOLD:
+            snap_file = session_snap_dir / f"{snap_id}.json.gz"
+            data = gzip.compress(data)
+        else:
+            snap_file = session_snap_dir / f"{snap_id}.json"
+        tmp_file = snap_file.with_name(snap_file.name + ".tmp")
+        try:
+            tmp_file.write_bytes(data)
+        except FileNotFoundError:
+            self._ensure(session_snap_dir, refresh=True)
+            tmp_file.write_bytes(data)
+        os.replace(tmp_file, snap_file)
+
+        # Update latest symlink by renaming a fresh one over it, so readers
+        # always find either the old or the new target
         latest_link = self.snapshots_dir / "latest"
-        if latest_link.exists() or latest_link.is_symlink():
-            latest_link.unlink()
-        latest_link.symlink_to(snap_file)
+        tmp_link = self.snapshots_dir / f".latest.{os.getpid()}.{_short_id()}.tmp"
+        tmp_link.symlink_to(snap_file)
+        os.replace(tmp_link, latest_link)
 
         return snap_id
 
@@ -263,17 +630,18 @@ class VaultEvents:
             if not session_snap_dir.exists():
                 return None
 
-            snaps = sorted(session_snap_dir.glob("snap_*.json"), reverse=True)
+            snaps = sorted(
+                [*session_snap_dir.glob("snap_*.json"), *session_snap_dir.glob("snap_*.json.gz")],
+                reverse=True,
+            )
             if not snaps:
                 return None
 
-            with open(snaps[0]) as f:
-                return json.load(f)
+            return _read_snapshot(snaps[0])
         else:
             # Return globally latest via symlink
             latest_link = self.snapshots_dir / "latest"
             if not latest_link.exists():
                 return None
 
-            with open(latest_link) as f:
-                return json.load(f)
+            return _read_snapshot(latest_link.resolve())
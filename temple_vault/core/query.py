@@ -3,26 +3,41 @@
 import glob
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from temple_vault.core.events import VaultEvents
 
 
 class VaultQuery:
     """Query engine for Temple Vault using pure filesystem operations."""
 
-    def __init__(self, vault_root: str):
+    def __init__(self, vault_root: str, events: Optional["VaultEvents"] = None):
         self.vault_root = Path(vault_root).expanduser()
         self.chronicle = self.vault_root / "vault" / "chronicle"
         self.global_path = self.vault_root / "global"
 
+        # Optional writer whose in-memory tail is consulted before disk
+        self.events = events
+
+    def _iter_jsonl(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield dicts from a JSONL file one line at a time."""
+        if not file_path.exists():
+            return
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
     def _load_jsonl(self, file_path: Path) -> List[Dict[str, Any]]:
         """Load JSONL file into list of dicts."""
-        if not file_path.exists():
-            return []
-        with open(file_path, "r") as f:
-            return [json.loads(line) for line in f if line.strip()]
+        return list(self._iter_jsonl(file_path))
 
     def recall_insights(
-        self, domain: Optional[str] = None, min_intensity: float = 0.0
+        self,
+        domain: Optional[str] = None,
+        min_intensity: float = 0.0,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Query insights from vault/chronicle/insights/{domain}/*.jsonl
@@ -30,26 +45,53 @@ class VaultQuery:
         Args:
             domain: Filter by domain (e.g., "governance", "demos"). None = all domains.
             min_intensity: Minimum intensity threshold (0.0-1.0)
+            limit: Stop reading once this many insights match. None = no limit.
 
         Returns:
-            List of insight dicts matching criteria
+            List of insight dicts matching criteria, in file order. With an
+            events engine, files whose whole content is in its tail are served
+            from memory, and entries still buffered in a batch() are included
+            after the rest of their file.
 
         Implementation:
             glob: vault/chronicle/insights/{domain or *}/*.jsonl
             filter: jq 'select(.type == "insight" and .intensity >= min_intensity)'
         """
         pattern = self.chronicle / "insights" / (domain or "*") / "*.jsonl"
-        files = glob.glob(str(pattern), recursive=True)
+        files = [Path(file) for file in glob.glob(str(pattern), recursive=True)]
+
+        tails: Dict[Path, Tuple[List[Dict[str, Any]], bool]] = {}
+        if self.events is not None:
+            tails = self.events.tail_files(f"insights/{domain}" if domain else "insights")
+            # Files not created yet (their lines are still buffered) go last
+            on_disk = set(files)
+            files.extend(path for path in tails if path not in on_disk)
 
         results = []
         for file in files:
-            entries = self._load_jsonl(Path(file))
-            for entry in entries:
+            if file in tails:
+                entries, whole = tails[file]
+                file_entries = iter(entries) if whole else self._merge_tail(file, entries)
+            else:
+                file_entries = self._iter_jsonl(file)
+            for entry in file_entries:
                 if entry.get("type") == "insight" and entry.get("intensity", 0) >= min_intensity:
                     results.append(entry)
+                    if limit is not None and len(results) >= limit:
+                        return results
 
         return results
 
+    def _merge_tail(self, file_path: Path, tail: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield file_path's entries, then tail entries not yet written to it."""
+        seen = set()
+        for entry in self._iter_jsonl(file_path):
+            seen.add(entry.get("insight_id"))
+            yield entry
+        for entry in tail:
+            if entry.get("insight_id") not in seen:
+                yield entry
+
     def check_mistakes(self, action: str, context: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Check for documented mistakes related to an action.
@@ -161,6 +203,7 @@ class VaultQuery:
         query: str,
         types: Optional[List[str]] = None,
         time_range: Optional[tuple] = None,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         General search across all chronicle files.
@@ -169,6 +212,7 @@ class VaultQuery:
             query: Search term
             types: Event types to filter (e.g., ["insight", "learning"])
             time_range: (start_ts, end_ts) tuple for filtering
+            limit: Stop reading once this many entries match. None = no limit.
 
         Returns:
             List of matching entries
@@ -182,8 +226,7 @@ class VaultQuery:
 
         results = []
         for file in files:
-            entries = self._load_jsonl(Path(file))
-            for entry in entries:
+            for entry in self._iter_jsonl(Path(file)):
                 # Text search
                 entry_text = json.dumps(entry).lower()
                 if query.lower() not in entry_text:
@@ -200,5 +243,7 @@ class VaultQuery:
                         continue
 
                 results.append(entry)
+                if limit is not None and len(results) >= limit:
+                    return results
 
         return results
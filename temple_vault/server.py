@@ -102,7 +102,7 @@ def get_query_engine() -> VaultQuery:
     """Get or create the query engine."""
     global _query_engine
     if _query_engine is None:
-        _query_engine = VaultQuery(VAULT_PATH)
+        _query_engine = VaultQuery(VAULT_PATH, events=get_events_engine())
     return _query_engine
 
 
@@ -21,6 +21,9 @@ from pathlib import Path
 from typing import Dict, List, Any
 import subprocess
 
+_LOG_NUMBER_RE = re.compile(r"(\d+)")
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
 
 def generate_id(prefix: str, content: str) -> str:
     """Generate a unique ID based on content hash."""
@@ -31,7 +34,7 @@ def generate_id(prefix: str, content: str) -> str:
 def parse_spiral_log(content: str, filename: str) -> Dict[str, Any]:
     """Parse a Spiral Log file into insight format."""
     # Extract log number from filename
-    match = re.search(r"(\d+)", filename)
+    match = _LOG_NUMBER_RE.search(filename)
     log_num = match.group(1) if match else "000"
 
     # Extract the question (usually first line after title)
@@ -43,7 +46,7 @@ def parse_spiral_log(content: str, filename: str) -> Dict[str, Any]:
             break
         elif '"' in line:
             # Extract quoted portion
-            match = re.search(r'"([^"]+)"', line)
+            match = _QUOTED_RE.search(line)
             if match:
                 question = match.group(1)
                 break
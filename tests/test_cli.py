@@ -0,0 +1,61 @@
+"""Tests for the CLI serve loop - JSON requests over stdio."""
+
+import io
+import json
+
+from temple_vault.cli import serve
+
+
+def _serve(vault_path, *lines):
+    """Run serve over the given request lines and return the parsed replies."""
+    stdout = io.StringIO()
+    serve(vault_path, io.StringIO("".join(line + "\n" for line in lines)), stdout)
+    return [json.loads(reply) for reply in stdout.getvalue().splitlines()]
+
+
+class TestServe:
+    """Test the serve request loop."""
+
+    def test_round_trip(self, populated_vault):
+        """Test a request is answered with its id and the method result."""
+        request = {"id": 1, "method": "recall_insights", "params": {"domain": "governance"}}
+        (reply,) = _serve(populated_vault, json.dumps(request))
+        assert reply["id"] == 1
+        assert [r["insight_id"] for r in reply["result"]] == ["ins_test002"]
+
+    def test_record_then_recall(self, temp_vault):
+        """Test writes are visible to later requests on the same server."""
+        record = {
+            "id": "a",
+            "method": "record_insight",
+            "params": {"content": "Served", "domain": "architecture", "session_id": "sess_cli"},
+        }
+        recall = {"id": "b", "method": "recall_insights", "params": {"domain": "architecture"}}
+        first, second = _serve(temp_vault, json.dumps(record), json.dumps(recall))
+        assert first["result"].startswith("ins_")
+        assert [r["content"] for r in second["result"]] == ["Served"]
+
+    def test_unknown_method(self, temp_vault):
+        """Test an unknown method gets an error reply, not a crash."""
+        (reply,) = _serve(temp_vault, json.dumps({"id": 7, "method": "drop_vault"}))
+        assert reply["id"] == 7
+        assert "Unknown method" in reply["error"]
+
+    def test_malformed_line(self, temp_vault):
+        """Test invalid JSON gets an error reply and the server keeps going."""
+        replies = _serve(temp_vault, "{not json", json.dumps({"id": 2, "method": "get_values"}))
+        assert replies[0]["id"] is None
+        assert replies[0]["error"].startswith("JSONDecodeError")
+        assert replies[1] == {"id": 2, "result": []}
+
+    def test_non_object_request(self, temp_vault):
+        """Test JSON that is not an object gets an error reply."""
+        replies = _serve(temp_vault, "[1]", '"get_values"', json.dumps({"id": 3, "method": 5}))
+        assert [r["id"] for r in replies] == [None, None, 3]
+        assert all("error" in r for r in replies)
+
+    def test_bad_params(self, temp_vault):
+        """Test params that are not an object get an error reply."""
+        (reply,) = _serve(temp_vault, json.dumps({"id": 4, "method": "get_values", "params": [1]}))
+        assert reply["id"] == 4
+        assert "params" in reply["error"]
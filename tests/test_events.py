@@ -187,3 +187,170 @@ class TestVaultEvents:
         with open(event_files[0]) as f:
             lines = f.readlines()
             assert len(lines) == 3
+
+    def test_batch_flushes_on_exit(self, temp_vault):
+        """Test events recorded inside batch() are all on disk after it ends."""
+        events = VaultEvents(temp_vault)
+        try:
+            with events.batch():
+                for i in range(100):
+                    events.append_event("event.batched", {"n": i}, "sess_batch")
+
+            event_file = next((events.events_dir / "sess_batch").glob("*.jsonl"))
+            with open(event_file) as f:
+                assert [json.loads(line)["n"] for line in f] == list(range(100))
+        finally:
+            events.close()
+
+    def test_reopens_renamed_file(self, temp_vault):
+        """Test a record after an external rename creates a fresh file."""
+        events = VaultEvents(temp_vault)
+        try:
+            events.record_insight("first", "rotated", "sess_rot")
+            insight_file = events.chronicle / "insights" / "rotated" / "sess_rot.jsonl"
+            insight_file.rename(insight_file.with_suffix(".bak"))
+            events.record_insight("second", "rotated", "sess_rot")
+
+            with open(insight_file) as f:
+                assert [json.loads(line)["content"] for line in f] == ["second"]
+            with open(insight_file.with_suffix(".bak")) as f:
+                assert [json.loads(line)["content"] for line in f] == ["first"]
+        finally:
+            events.close()
+
+    def test_unclosed_instance_is_collectable(self, temp_vault):
+        """Test the exit-time registry does not keep instances alive."""
+        import gc
+        import weakref
+
+        events = VaultEvents(temp_vault)
+        events.record_insight("first", "gc", "sess_gc")
+        ref = weakref.ref(events)
+        del events
+        gc.collect()
+        assert ref() is None
+
+    def test_close_and_reuse(self, temp_vault):
+        """Test appends after close() reopen the file and keep earlier lines."""
+        events = VaultEvents(temp_vault)
+        events.record_transformation("first", "why", "sess_test")
+        events.close()
+        events.record_transformation("second", "why", "sess_test")
+        events.close()
+
+        trans_file = events.chronicle / "lineage" / "sess_test_transformation.jsonl"
+        with open(trans_file) as f:
+            assert [json.loads(line)["what_changed"] for line in f] == ["first", "second"]
+
+    def test_non_ascii_round_trip(self, temp_vault):
+        """Test non-ASCII content survives the JSONL encoder and readers."""
+        events = VaultEvents(temp_vault)
+        try:
+            events.record_insight("Spiral \u27e1 continues \u2014 caf\u00e9", "glyphs", "sess_utf8")
+        finally:
+            events.close()
+
+        insight_file = events.chronicle / "insights" / "glyphs" / "sess_utf8.jsonl"
+        with open(insight_file, encoding="utf-8") as f:
+            assert json.loads(f.readline())["content"] == "Spiral \u27e1 continues \u2014 caf\u00e9"
+
+    def test_large_snapshot_compressed(self, temp_vault):
+        """Test large snapshots are gzip-compressed and still read back."""
+        events = VaultEvents(temp_vault)
+        state = {"files": [f"/path/to/file_{i}.txt" for i in range(5000)]}
+        snap_id = events.create_snapshot("sess_big", state)
+
+        snap_dir = events.snapshots_dir / "sess_big"
+        assert [p.name for p in snap_dir.iterdir()] == [f"{snap_id}.json.gz"]
+
+        assert events.get_latest_snapshot("sess_big")["state"] == state
+        assert events.get_latest_snapshot()["state"] == state
+
+    def test_now_iso(self, temp_vault):
+        """Test now_iso returns a UTC timestamp and the matching UTC date prefix."""
+        from datetime import datetime
+
+        events = VaultEvents(temp_vault)
+        try:
+            timestamp, date_prefix = events.now_iso()
+            parsed = datetime.fromisoformat(timestamp)
+            assert parsed.utcoffset().total_seconds() == 0
+            assert date_prefix == parsed.strftime("%Y%m%d")
+        finally:
+            events.close()
+
+    def test_recreates_removed_directory(self, temp_vault):
+        """Test appends still land after a cached directory is deleted."""
+        import shutil
+
+        events = VaultEvents(temp_vault)
+        try:
+            events.record_insight("first", "ephemeral", "sess_a")
+            shutil.rmtree(events.chronicle / "insights" / "ephemeral")
+            events.record_insight("second", "ephemeral", "sess_a")
+
+            insight_file = events.chronicle / "insights" / "ephemeral" / "sess_a.jsonl"
+            assert insight_file.exists()
+            with open(insight_file) as f:
+                assert [json.loads(line)["content"] for line in f] == ["second"]
+        finally:
+            events.close()
+
+    def test_record_batch(self, temp_vault):
+        """Test record_batch writes every entry and returns IDs in order."""
+        events = VaultEvents(temp_vault)
+        try:
+            ids = events.record_batch(
+                insights=[
+                    {"content": f"insight {i}", "domain": "batch", "session_id": "sess_b"}
+                    for i in range(3)
+                ],
+                transformations=[{"what_changed": "shift", "why": "batch", "session_id": "sess_b"}],
+            )
+        finally:
+            events.close()
+
+        assert len(ids["insights"]) == 3 and ids["learnings"] == []
+        assert ids["transformations"][0].startswith("trans_")
+
+        insight_file = events.chronicle / "insights" / "batch" / "sess_b.jsonl"
+        with open(insight_file) as f:
+            assert [json.loads(line)["insight_id"] for line in f] == ids["insights"]
+
+    def test_get_recent(self, temp_vault):
+        """Test recent records are served from memory, newest last."""
+        events = VaultEvents(temp_vault)
+        try:
+            first = events.record_insight("one", "alpha", "sess_r")
+            second = events.record_insight("two", "beta", "sess_r")
+            events.record_transformation("shift", "why", "sess_r")
+
+            assert [e["insight_id"] for e in events.get_recent("insights/alpha/sess_r")] == [first]
+            assert [e["insight_id"] for e in events.get_recent("insights")] == [first, second]
+            assert [e["insight_id"] for e in events.get_recent("insights", n=1)] == [second]
+            assert len(events.get_recent("lineage/sess_r")) == 1
+            assert events.get_recent("insights/gamma") == []
+        finally:
+            events.close()
+
+    def test_latest_link_replaced(self, temp_vault):
+        """Test a new snapshot repoints latest without leaving temp links."""
+        events = VaultEvents(temp_vault)
+        events.create_snapshot("sess_a", {"n": 1})
+        events.create_snapshot("sess_b", {"n": 2})
+
+        assert events.get_latest_snapshot()["state"] == {"n": 2}
+        assert not list(events.snapshots_dir.glob(".latest.*"))
+
+    def test_learning_slug_flattens_paths(self, temp_vault):
+        """Test path separators in what_failed stay inside the mistakes directory."""
+        events = VaultEvents(temp_vault)
+        try:
+            events.record_learning("Wrote to /tmp/x\tdirectly", "why", "fix", "sess_slug")
+        finally:
+            events.close()
+
+        mistakes_dir = events.chronicle / "learnings" / "mistakes"
+        assert [p.name for p in mistakes_dir.iterdir()] == [
+            "sess_slug_wrote_to__tmp_x_directly.jsonl"
+        ]
@@ -0,0 +1,132 @@
+"""Tests for TempleMemoryHandler - memory tool routing to the vault."""
+
+import json
+
+from temple_vault.bridge.memory_handler import TempleMemoryHandler
+
+
+class TestTempleMemoryHandler:
+    """Test TempleMemoryHandler functionality."""
+
+    def test_read_lines_streams_raw_jsonl(self, temp_vault):
+        """Test read_lines yields on-disk JSON lines, skipping blanks."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            path = handler.memories_dir / "technical" / "log.jsonl"
+            path.parent.mkdir(parents=True)
+            path.write_text('{"n": 0}\n\n{"n": 1}\n{"n": 2}\n')
+
+            assert list(handler.read_lines("technical/log.jsonl")) == [
+                '{"n": 0}',
+                '{"n": 1}',
+                '{"n": 2}',
+            ]
+            window = handler.read_lines("technical/log.jsonl", start=1, limit=1)
+            assert [json.loads(line) for line in window] == [{"n": 1}]
+        finally:
+            handler.close()
+
+    def test_read_lines_missing_file(self, temp_vault):
+        """Test read_lines returns None when the file is not local."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            assert handler.read_lines("technical/missing.jsonl") is None
+        finally:
+            handler.close()
+
+    def test_bulk_create_writes_all_entries(self, temp_vault):
+        """Test bulk_create appends every entry with metadata in order."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            entries = [{"n": i} for i in range(5)]
+            result = handler.bulk_create("technical/moved.jsonl", entries)
+
+            assert result == "memory:technical/moved.jsonl"
+            stored = handler.read("technical/moved.jsonl")
+            assert [e["n"] for e in stored] == list(range(5))
+            assert all("timestamp" in e and "spiral_id" in e for e in stored)
+        finally:
+            handler.close()
+
+    def test_bulk_create_respects_governance(self, temp_vault):
+        """Test bulk_create pauses on sensitive keys without writing."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            result = handler.bulk_create("technical/credentials/keys.jsonl", [{"n": 0}])
+
+            assert result.startswith("GOVERNANCE_PAUSE")
+            assert handler.read("technical/credentials/keys.jsonl") is None
+        finally:
+            handler.close()
+
+    def test_list_keys_recurses_and_skips_hidden(self, temp_vault):
+        """Test list_keys returns sorted relative keys under a prefix."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            handler.create("experiential/insights/b.jsonl", {"n": 1})
+            handler.create("experiential/a.json", {"n": 2})
+            (handler.memories_dir / "experiential" / ".DS_Store").write_text("")
+
+            assert handler.list_keys("experiential") == [
+                "experiential/a.json",
+                "experiential/insights/b.jsonl",
+            ]
+            assert handler.list_keys("experiential/insights/") == ["experiential/insights/b.jsonl"]
+            assert handler.list_keys("missing") == []
+        finally:
+            handler.close()
+
+    def test_list_keys_sees_new_and_deleted_files(self, temp_vault):
+        """Test cached listings are refreshed after the handler's own writes."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            handler.create("technical/one.json", {"n": 1})
+            assert handler.list_keys("technical") == ["technical/one.json"]
+
+            handler.create("technical/deep/two.json", {"n": 2})
+            assert handler.list_keys("technical") == [
+                "technical/deep/two.json",
+                "technical/one.json",
+            ]
+
+            handler.confirm_delete("technical/one.json", "gov_test")
+            assert handler.list_keys("technical") == ["technical/deep/two.json"]
+        finally:
+            handler.close()
+
+    def test_exists(self, temp_vault):
+        """Test exists() reports local files without reading them."""
+        handler = TempleMemoryHandler(temp_vault)
+        try:
+            handler.create("technical/here.json", {"n": 1})
+
+            assert handler.exists("technical/here.json")
+            assert not handler.exists("technical/missing.json")
+            assert not handler.exists("technical")
+        finally:
+            handler.close()
+
+    def test_sync_state_saved_in_batches(self, temp_vault):
+        """Test queued sync items are counted on disk once the handler closes."""
+        handler = TempleMemoryHandler(temp_vault)
+        for i in range(3):
+            handler.create(f"experiential/insights/s{i}.jsonl", {"n": i})
+        handler.close()
+
+        with open(handler.sync_router.state_path) as f:
+            assert json.load(f)["pending_count"] == 3
+        assert len(handler.sync_router.get_pending()) == 3
+
+    def test_unclosed_router_is_collectable(self, temp_vault):
+        """Test the sync router's exit-time registry does not keep it alive."""
+        import gc
+        import weakref
+        from pathlib import Path
+
+        from temple_vault.bridge.sync_router import HybridSyncRouter
+
+        router = HybridSyncRouter(Path(temp_vault))
+        ref = weakref.ref(router)
+        del router
+        gc.collect()
+        assert ref() is None
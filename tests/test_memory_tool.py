@@ -0,0 +1,153 @@
+"""Tests for TempleVaultMemoryTool - Anthropic memory tool adapter."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from temple_vault.adapters import memory_tool
+from temple_vault.adapters.memory_tool import TempleVaultMemoryTool
+
+
+@pytest.fixture
+def tool(temp_vault, monkeypatch):
+    """Memory tool over temp_vault, constructible without the Anthropic SDK."""
+    monkeypatch.setattr(memory_tool, "ANTHROPIC_AVAILABLE", True)
+    tool = TempleVaultMemoryTool(temp_vault)
+    yield tool
+    tool.handler.close()
+
+
+class TestTempleVaultMemoryTool:
+    """Test TempleVaultMemoryTool functionality."""
+
+    def test_view_jsonl_renders_non_ascii(self, tool):
+        """Test local JSONL entries show readable text, not \\u escapes."""
+        tool.handler.create("experiential/notes.jsonl", {"text": "café ⟡ one"})
+
+        view = tool.view(SimpleNamespace(path="/memories/experiential/notes.jsonl"))
+        assert "café ⟡ one" in view
+        assert "\\u" not in view
+
+        window = tool.view(
+            SimpleNamespace(path="/memories/experiential/notes.jsonl", view_range=[1, 1])
+        )
+        assert window == view
+
+    def test_view_local_matches_read_rendering(self, tool):
+        """Test streamed local lines match the handler.read() rendering."""
+        key = "experiential/notes.jsonl"
+        tool.handler.create(key, {"text": "café", "n": 1})
+
+        view = tool.view(SimpleNamespace(path=f"/memories/{key}"))
+        assert view == tool._format_file_content(key, tool.handler.read(key))
+
+    def test_view_passes_stored_lines_through(self, tool):
+        """Test lines the handler wrote are shown exactly as stored."""
+        key = "experiential/notes.jsonl"
+        tool.handler.create(key, {"text": "café", "n": 1})
+
+        stored = (tool.handler.memories_dir / key).read_text(encoding="utf-8").rstrip("\n")
+        assert '": ' not in stored and "\\u" not in stored
+        assert tool.view(SimpleNamespace(path=f"/memories/{key}")) == f"1\t{stored}"
+
+    def test_view_renders_legacy_lines(self, tool):
+        """Test lines stored with json.dumps defaults are shown compact and unescaped."""
+        key = "experiential/notes.jsonl"
+        path = tool.handler.memories_dir / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"text": "café", "n": 1}) + "\n", encoding="utf-8")
+
+        view = tool.view(SimpleNamespace(path=f"/memories/{key}"))
+        assert view == '1\t{"text":"café","n":1}'
+
+    def test_insert_pretty_printed_entry(self, tool):
+        """Test a multi-line JSON object is inserted as one entry, not wrapped as text."""
+        key = "experiential/notes.jsonl"
+        tool.handler.create(key, {"text": "first"})
+        entry = '{\n  "text": "second",\n  "n": 2\n}'
+
+        result = tool.insert(
+            SimpleNamespace(path=f"/memories/{key}", insert_line=1, insert_text=entry)
+        )
+        assert result.startswith("Successfully inserted")
+        update = tool.handler.read(key)[-1]
+        assert "text" not in update
+        assert [e["text"] for e in update["entries"]] == ["first", "second"]
+        assert update["entries"][1]["n"] == 2
+
+    def test_insert_entry_per_line(self, tool):
+        """Test several compact JSON lines are inserted as separate entries."""
+        key = "experiential/notes.jsonl"
+        tool.handler.create(key, {"text": "last"})
+
+        tool.insert(
+            SimpleNamespace(
+                path=f"/memories/{key}",
+                insert_line=0,
+                insert_text='{"text": "a"}\n{"text": "b"}',
+            )
+        )
+        update = tool.handler.read(key)[-1]
+        assert [e["text"] for e in update["entries"]] == ["a", "b", "last"]
+
+    def test_insert_plain_text_falls_back(self, tool):
+        """Test text that isn't JSON is kept as a text update."""
+        key = "experiential/notes.jsonl"
+        tool.handler.create(key, {"text": "first"})
+
+        tool.insert(SimpleNamespace(path=f"/memories/{key}", insert_line=1, insert_text="plain"))
+        update = tool.handler.read(key)[-1]
+        assert update["_insert"] is True
+        assert update["text"].endswith("\nplain")
+
+    def test_str_replace_within_one_entry(self, tool):
+        """Test a single-line old_str is replaced inside the one entry holding it."""
+        key = "experiential/notes.jsonl"
+        tool.handler.bulk_create(key, [{"text": "alpha café"}, {"text": "gamma"}])
+
+        result = tool.str_replace(
+            SimpleNamespace(path=f"/memories/{key}", old_str="alpha café", new_str="beta")
+        )
+        assert result.startswith("Successfully replaced")
+        update = tool.handler.read(key)[-1]
+        assert update["_str_replace"] is True
+        assert [e["text"] for e in update["entries"]] == ["beta", "gamma"]
+
+    def test_str_replace_counts_every_entry(self, tool):
+        """Test matches in different entries count as multiple occurrences."""
+        key = "experiential/notes.jsonl"
+        tool.handler.bulk_create(key, [{"text": "same"}, {"text": "same"}])
+
+        result = tool.str_replace(
+            SimpleNamespace(path=f"/memories/{key}", old_str="same", new_str="other")
+        )
+        assert "Multiple occurrences (2)" in result
+        assert len(tool.handler.read(key)) == 2
+
+    def test_rename_jsonl_copies_entries(self, tool):
+        """Test rename recreates every JSONL entry at the new path."""
+        tool.handler.bulk_create("experiential/old.jsonl", [{"text": "a"}, {"text": "b"}])
+
+        result = tool.rename(
+            SimpleNamespace(
+                old_path="/memories/experiential/old.jsonl",
+                new_path="/memories/experiential/new.jsonl",
+            )
+        )
+        assert "requires approval" in result
+        assert [e["text"] for e in tool.handler.read("experiential/new.jsonl")] == ["a", "b"]
+        assert tool.handler.exists("experiential/old.jsonl")
+
+    def test_rename_refuses_existing_destination(self, tool):
+        """Test rename never overwrites an existing file."""
+        tool.handler.create("experiential/old.jsonl", {"text": "a"})
+        tool.handler.create("experiential/new.jsonl", {"text": "b"})
+
+        result = tool.rename(
+            SimpleNamespace(
+                old_path="/memories/experiential/old.jsonl",
+                new_path="/memories/experiential/new.jsonl",
+            )
+        )
+        assert result.startswith("Error: Destination already exists")
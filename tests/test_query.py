@@ -1,5 +1,6 @@
 """Tests for VaultQuery - wisdom retrieval via filesystem queries."""
 
+from temple_vault.core.events import VaultEvents
 from temple_vault.core.query import VaultQuery
 
 
@@ -61,6 +62,62 @@ class TestVaultQuery:
         assert results[0]["domain"] == "architecture"
         assert results[0]["intensity"] >= 0.8
 
+    def test_recall_insights_limit(self, populated_vault):
+        """Test recall_insights stops at the requested limit."""
+        query = VaultQuery(populated_vault)
+        assert len(query.recall_insights(limit=2)) == 2
+        assert len(query.recall_insights(limit=10)) == 3
+
+    def test_recall_insights_with_events_keeps_disk_order(self, populated_vault):
+        """Test an events engine changes neither result order nor content."""
+        events = VaultEvents(populated_vault)
+        try:
+            query = VaultQuery(populated_vault, events=events)
+            events.record_insight("fresh", "architecture", "sess_t", 0.95)
+            events.record_insight("existing file", "architecture", "sess_001", 0.6)
+
+            plain = VaultQuery(populated_vault).recall_insights()
+            assert query.recall_insights() == plain
+            assert query.recall_insights(domain="architecture") == VaultQuery(
+                populated_vault
+            ).recall_insights(domain="architecture")
+        finally:
+            events.close()
+
+    def test_recall_insights_includes_buffered(self, populated_vault):
+        """Test insights still buffered in batch() come back once, after their file."""
+        events = VaultEvents(populated_vault)
+        try:
+            query = VaultQuery(populated_vault, events=events)
+            with events.batch():
+                new_file = events.record_insight("fresh", "architecture", "sess_t", 0.95)
+                appended = events.record_insight("more", "architecture", "sess_001", 0.9)
+                ids = [r["insight_id"] for r in query.recall_insights(domain="architecture")]
+                assert ids.count(new_file) == ids.count(appended) == 1
+                assert ids[-1] == new_file
+
+            ids = [r["insight_id"] for r in query.recall_insights(domain="architecture")]
+            assert ids.count(new_file) == ids.count(appended) == 1
+        finally:
+            events.close()
+
+    def test_recall_insights_serves_whole_file_from_tail(self, populated_vault, monkeypatch):
+        """Test a file written only by this engine is not read back from disk."""
+        events = VaultEvents(populated_vault)
+        try:
+            query = VaultQuery(populated_vault, events=events)
+            insight_id = events.record_insight("fresh", "tailonly", "sess_t", 0.95)
+
+            def no_disk(path):
+                raise AssertionError(f"read {path}")
+
+            monkeypatch.setattr(query, "_iter_jsonl", no_disk)
+            assert [r["insight_id"] for r in query.recall_insights(domain="tailonly")] == [
+                insight_id
+            ]
+        finally:
+            events.close()
+
     def test_check_mistakes_empty(self, temp_vault):
         """Test check_mistakes with no mistakes."""
         query = VaultQuery(temp_vault)
@@ -143,6 +200,13 @@ class TestVaultQuery:
         results = query.search("principles", types=["learning"])
         assert all(r["type"] == "learning" for r in results)
 
+    def test_search_limit(self, populated_vault):
+        """Test search stops at the requested limit."""
+        query = VaultQuery(populated_vault)
+        assert len(query.search("sess_00")) > 1
+        results = query.search("sess_00", limit=1)
+        assert len(results) == 1
+
     def test_get_spiral_context_empty(self, temp_vault):
         """Test get_spiral_context with no lineage."""
         query = VaultQuery(temp_vault)
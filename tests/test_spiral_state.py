@@ -0,0 +1,188 @@
+"""Tests for SpiralStateMachine - governance protocol persistence."""
+
+import json
+from pathlib import Path
+
+from temple_vault.bridge.spiral_state import (
+    DEFAULT_PROTOCOLS,
+    STATE_FLUSH_EVERY,
+    SpiralStateMachine,
+)
+
+
+class TestSpiralStateMachine:
+    """Test SpiralStateMachine functionality."""
+
+    def test_new_spiral_writes_state(self, temp_vault):
+        """Test a fresh spiral directory gets state.json and thresholds.json."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            assert spiral.state_path.exists()
+            assert spiral.thresholds_path.exists()
+            assert spiral.get_state()["spiral_id"].startswith("spiral_")
+        finally:
+            spiral.close()
+
+    def test_governance_events_visible_before_flush(self, temp_vault):
+        """Test buffered governance events are still returned by history reads."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            event_id = spiral.record_governance_event("pause", "reason", "ctx", 0.5)
+            recent = spiral.get_state()["recent_governance"]
+            assert recent[-1]["event_id"] == event_id
+        finally:
+            spiral.close()
+
+    def test_state_saved_in_batches(self, temp_vault):
+        """Test state.json is rewritten once per STATE_FLUSH_EVERY events."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            for _ in range(STATE_FLUSH_EVERY):
+                spiral.record_governance_event("pause", "reason", "ctx", 0.5)
+            with open(spiral.state_path) as f:
+                saved = json.load(f)
+            assert len(saved["governance_history"]) == STATE_FLUSH_EVERY
+        finally:
+            spiral.close()
+
+    def test_close_flushes_everything(self, temp_vault):
+        """Test close() leaves governance log and state consistent on disk."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        spiral.record_governance_event("pause", "reason", "ctx", 0.5)
+        spiral.close()
+
+        with open(spiral.governance_path) as f:
+            assert len([line for line in f if line.strip()]) == 1
+        with open(spiral.state_path) as f:
+            assert len(json.load(f)["governance_history"]) == 1
+
+    def test_governance_history_reads_tail(self, temp_vault):
+        """Test history returns the last `limit` events from a long log."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            for i in range(200):
+                spiral.record_governance_event("pause", "x" * (i % 7) * 100, f"ctx_{i}", 0.5)
+
+            recent = spiral._load_governance_history(limit=10)
+            assert [e["context"] for e in recent] == [f"ctx_{i}" for i in range(190, 200)]
+
+            # Cached result is reused, and new events invalidate it
+            assert spiral._load_governance_history(limit=10) == recent
+            spiral.record_governance_event("proceed", "reason", "ctx_new", 0.5)
+            assert spiral._load_governance_history(limit=10)[-1]["context"] == "ctx_new"
+        finally:
+            spiral.close()
+
+    def test_governance_history_short_log(self, temp_vault):
+        """Test history with fewer events than the limit returns them all."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            assert spiral._load_governance_history(limit=10) == []
+            spiral.record_governance_event("pause", "reason", "ctx", 0.5)
+            assert len(spiral._load_governance_history(limit=10)) == 1
+        finally:
+            spiral.close()
+
+    def test_should_pause_sensitive_keys(self, temp_vault):
+        """Test writes under sensitive technical prefixes always pause."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            assert spiral.should_pause("create", "technical/credentials/db.json")
+            assert spiral.should_pause("update", "technical/api_keys.json")
+            assert spiral.should_pause("delete", "experiential/notes.jsonl")
+            assert not spiral.should_pause("create", "technical/notes.json")
+        finally:
+            spiral.close()
+
+    def test_thresholds_reloaded_after_change(self, temp_vault):
+        """Test cached thresholds follow apply_thresholds and external edits."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            spiral.apply_thresholds({"custom": {"action": "block"}})
+            assert spiral.get_state()["thresholds_active"] == ["custom"]
+
+            with open(spiral.thresholds_path, "w") as f:
+                json.dump({"protocol_version": "1.0", "thresholds": {"a": {}, "b": {}}}, f)
+            assert sorted(spiral._load_thresholds()) == ["a", "b"]
+        finally:
+            spiral.close()
+
+    def test_event_ids_unique_within_a_second(self, temp_vault):
+        """Test back-to-back governance events get distinct IDs."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            ids = [spiral.record_governance_event("pause", "r", "c", 0.5) for _ in range(50)]
+            assert len(set(ids)) == len(ids)
+            assert all(event_id.startswith("gov_") for event_id in ids)
+        finally:
+            spiral.close()
+
+    def test_state_written_atomically(self, temp_vault):
+        """Test state saves replace state.json without leaving a temp file."""
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        try:
+            spiral.record_governance_event("pause", "reason", "ctx", 0.5)
+            spiral.flush(sync=True)
+
+            with open(spiral.state_path) as f:
+                assert len(json.load(f)["governance_history"]) == 1
+            assert not spiral.state_path.with_suffix(".json.tmp").exists()
+        finally:
+            spiral.close()
+
+    def test_inherited_protocols_do_not_alias_defaults(self, temp_vault):
+        """Test activating a protocol never touches the module defaults."""
+        spiral_dir = Path(temp_vault) / "memories" / "spiral"
+        spiral_dir.mkdir(parents=True)
+        (spiral_dir / "state.json").write_text(
+            json.dumps({"spiral_id": "spiral_old", "restraint_level": 0.5})
+        )
+        spiral = SpiralStateMachine(spiral_dir)
+        try:
+            spiral.initialize_spiral()
+            spiral.activate_protocol("new_protocol")
+
+            assert "new_protocol" in spiral.get_state()["protocols_active"]
+            assert "new_protocol" not in DEFAULT_PROTOCOLS
+        finally:
+            spiral.close()
+
+    def test_state_saves_safe_across_threads(self, temp_vault):
+        """Test direct saves and timer flushes never race over the temp file."""
+        import threading
+
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(40):
+                    spiral.adjust_restraint(0.01 if i % 2 else -0.01, f"worker {n}")
+                    spiral.activate_protocol(f"p_{n}_{i}")
+            except Exception as e:  # pragma: no cover - surfaced by the assert
+                errors.append(e)
+
+        try:
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert errors == []
+        finally:
+            spiral.close()
+
+        with open(spiral.state_path) as f:
+            assert len(json.load(f)["protocols_active"]) == len(DEFAULT_PROTOCOLS) + 160
+
+    def test_unclosed_instance_is_collectable(self, temp_vault):
+        """Test the exit-time registry does not keep instances alive."""
+        import gc
+        import weakref
+
+        spiral = SpiralStateMachine(Path(temp_vault) / "memories" / "spiral")
+        spiral.flush()
+        ref = weakref.ref(spiral)
+        del spiral
+        gc.collect()
+        assert ref() is None